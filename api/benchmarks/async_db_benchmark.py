@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Concurrent-request throughput benchmark for the database access paths.
+
+Drives the FastAPI app in-process with concurrent clients and compares:
+    blocking   - the previous behaviour: a sync service called directly inside an async route
+    threadpool - DB_ASYNC=false: sync services moved to the threadpool by run_service
+    async      - DB_ASYNC=true: services run on the asyncpg engine through AsyncSession.run_sync
+
+Each mode runs in its own process because the engine choice is read at import time.
+The database configured through the usual DB_* environment variables is used as-is.
+In blocking mode a concurrency above the pool size stalls the whole loop until the
+pool timeout, which is the failure this benchmark exists to show.
+
+Usage:
+    python benchmarks/async_db_benchmark.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ["blocking", "threadpool", "async"]
+
+
+def run_child(mode: str, path: str, requests: int, concurrency: int) -> dict:
+    """
+    Run a single benchmark mode inside the current process and return its results.
+    """
+    sys.path.insert(0, API_DIR)
+    import httpx
+    from fastapi import Depends
+    from sqlalchemy.orm import Session
+
+    from main import app
+    from services.db.connect_to_db import get_db, engines
+    from services.subscriptions.get_all_subscriptions_service import get_all_subscriptions
+
+    if mode == "blocking":
+        # Reproduce the old route: the sync query runs on the event loop thread
+        @app.get("/__bench/blocking")
+        async def blocking_subscriptions(db: Session = Depends(get_db)):
+            return len(get_all_subscriptions(db))
+
+        path = "/__bench/blocking"
+
+    async def drive() -> dict:
+        latencies = []
+        semaphore = asyncio.Semaphore(concurrency)
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def one_request():
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+
+            # Warm up the pool before timing
+            await asyncio.gather(*(one_request() for _ in range(concurrency)))
+            latencies.clear()
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one_request() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+
+        await engines.dispose()
+
+        latencies.sort()
+        return {
+            "mode": mode,
+            "requests": requests,
+            "concurrency": concurrency,
+            "seconds": round(elapsed, 3),
+            "requests_per_second": round(requests / elapsed, 1),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        }
+
+    return asyncio.run(drive())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="/subscriptions/", help="Endpoint to request")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight requests")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma separated modes to run")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.path, args.requests, args.concurrency)))
+        return
+
+    results = []
+    for mode in args.modes.split(","):
+        env = dict(os.environ, DB_ASYNC="true" if mode == "async" else "false")
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", mode, "--path", args.path,
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            cwd=API_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    print(f"{'mode':<12}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        print(f"{result['mode']:<12}{result['requests_per_second']:>10}{result['p50_ms']:>10}{result['p99_ms']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Reproducible latency and throughput benchmark of the subscription API.
+
+Seeds a dataset of --rows subscriptions (with companies, users, categories,
+foreign keys and rollups), then measures each scenario in up to three modes:
+
+    service    - the service functions called directly on a session, one at a time
+    inprocess  - the FastAPI app driven through httpx.ASGITransport by --concurrency clients
+    http       - a uvicorn server in its own process driven over HTTP by --concurrency clients
+
+and reports p50/p95/p99 latency, throughput, peak RSS, response size on the
+wire and CPU time per request for each scenario. Every mode runs in a fresh
+process on a fresh copy of the dataset, so writes made by one mode or run never
+affect another. Peak RSS and CPU time are those of the process serving the
+requests (the benchmark process itself, clients included, for service and
+inprocess); peak RSS is reset before each scenario where Linux allows it.
+Responses are requested with --accept-encoding, so comparing a run with
+"identity" against one with "gzip" or "br" shows what compression saves on the
+wire and costs in CPU.
+
+By default everything runs offline on SQLite: the seeded dataset is kept in
+--data-dir and reused while the row count, seed and schema are unchanged.
+With --database configured the DB_* environment variables are used instead and
+the dataset is only seeded when the subscriptions table is empty; the writes of
+the create, update and delete scenarios stay in that database.
+
+--save-baseline stores the results as JSON; --baseline compares a run against
+such a file and exits with status 1 when a p95 latency or a throughput is worse
+than the baseline by more than --tolerance.
+
+Usage:
+    python benchmarks/benchmark_suite.py --rows 100000 --save-baseline baseline.json
+    python benchmarks/benchmark_suite.py --rows 100000 --baseline baseline.json
+    python benchmarks/benchmark_suite.py --rows 1000 --modes inprocess --scenarios list get_by_id
+    python benchmarks/benchmark_suite.py --rows 1000 --modes http --accept-encoding identity
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+
+from cold_start_benchmark import free_port, healthy
+
+MODES = ("service", "inprocess", "http")
+SCENARIOS = ("list", "list_filtered", "list_sorted", "list_expand", "get_by_id", "summary", "search", "search_all", "companies_list", "create", "update", "delete")
+# Scenarios without a service mode equivalent; they exercise routing and serialization on top of services already measured
+HTTP_ONLY_SCENARIOS = ("list_sorted", "list_expand", "companies_list")
+
+COMPANIES = 500
+USERS = 2000
+CATEGORIES = ("Streaming", "Music", "News", "Cloud", "Software", "Gaming", "Fitness", "Education", "Food", "Utilities")
+PLANS = ("Basic plan", "Standard plan", "Premium plan")
+SEED_BATCH_SIZE = 50000
+# Run settings that must match the baseline's for a comparison to be judged
+COMPARABLE_META = ("rows", "requests", "concurrency", "database", "db_async", "accept_encoding")
+PAGE_SIZE = 50
+
+
+def company_name(number: int) -> str:
+    return f"Company {number:04d}"
+
+
+def user_name(number: int) -> str:
+    return f"User {number:05d}"
+
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+
+def seed(engine, rows: int, seed_value: int) -> None:
+    """Create the schema on an empty database and fill it with a deterministic dataset."""
+    from sqlalchemy import insert
+    from sqlalchemy.orm import Session
+    from init_db import seed_table_versions
+    from models.category import Category
+    from models.company import Company
+    from models.subscription import Subscription
+    from models.user import User
+    from services.db.connect_to_db import Base
+    from services.subscriptions.rollup_subscriptions_service import rebuild_rollups
+    from services.subscriptions.search_subscriptions_service import create_search_index
+
+    Base.metadata.create_all(engine)
+    seed_table_versions(engine)
+    rng = random.Random(seed_value)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{"companyId": i, "companyName": company_name(i), "companyURL": f"https://company{i}.example"} for i in range(1, COMPANIES + 1)])
+        conn.execute(insert(User), [{"userID": i, "userName": user_name(i)} for i in range(1, USERS + 1)])
+        conn.execute(insert(Category), [{"categoryID": i, "categoryName": name} for i, name in enumerate(CATEGORIES, 1)])
+        for start in range(0, rows, SEED_BATCH_SIZE):
+            batch = []
+            for _ in range(min(SEED_BATCH_SIZE, rows - start)):
+                company, user, category = rng.randint(1, COMPANIES), rng.randint(1, USERS), rng.randint(1, len(CATEGORIES))
+                batch.append({
+                    "companyName": company_name(company), "companyId": company,
+                    "price": Decimal(rng.randint(99, 9999)) / 100,
+                    "subscriptionCategory": CATEGORIES[category - 1], "categoryID": category,
+                    "description": rng.choice(PLANS + (None,)),
+                    "userName": user_name(user), "userID": user,
+                    "emailAssociated": f"user{user}@example.com"
+                })
+            conn.execute(insert(Subscription), batch)
+    with Session(engine) as db:
+        rebuild_rollups(db)
+        db.commit()
+    create_search_index(engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+    print(f"seeded {rows} subscriptions in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+
+def schema_fingerprint() -> str:
+    """Short hash of the table and column names, so a schema change invalidates cached datasets."""
+    from init_db import Base
+    from services.subscriptions.search_subscriptions_service import SEARCH_TABLE
+    names = sorted(f"{table.name}.{column.name}" for table in Base.metadata.tables.values() for column in table.columns)
+    # The search index is created outside the models
+    names.append(SEARCH_TABLE)
+    return hashlib.sha1(",".join(names).encode()).hexdigest()[:8]
+
+
+def sqlite_dataset(data_dir: str, rows: int, seed_value: int) -> str:
+    """Path of a seeded SQLite dataset, seeding it on first use."""
+    from sqlalchemy import create_engine
+    from services.db.config import load_config
+    from services.db.sqlite_engine import configure_sqlite
+
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"subscriptions-{rows}-{seed_value}-{schema_fingerprint()}.db")
+    if not os.path.exists(path):
+        partial = path + ".partial"
+        if os.path.exists(partial):
+            os.remove(partial)
+        engine = create_engine(f"sqlite:///{partial}")
+        configure_sqlite(engine, {**load_config(), "backend": "sqlite"})
+        seed(engine, rows, seed_value)
+        # Closing the last connection checkpoints the WAL into the database file
+        engine.dispose()
+        os.replace(partial, path)
+    return path
+
+
+def seed_configured_database(rows: int, seed_value: int) -> None:
+    """Seed the database the DB_* variables point at, unless it already has subscriptions."""
+    from sqlalchemy import inspect, func, select
+    from models.subscription import Subscription
+    from services.db.connect_to_db import engines
+
+    engine = engines.engine()
+    if inspect(engine).has_table(Subscription.__tablename__):
+        with engine.connect() as conn:
+            existing = conn.scalar(select(func.count()).select_from(Subscription))
+        if existing:
+            print(f"using the {existing} subscriptions already in the configured database", file=sys.stderr)
+            return
+    seed(engine, rows, seed_value)
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def reset_peak_rss(pid: int) -> None:
+    """Reset the process's RSS high-water mark (Linux only; elsewhere peaks accumulate)."""
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb(pid: int) -> Optional[float]:
+    """RSS high-water mark of a process in MiB, or None if it can't be read."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if pid == os.getpid():
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in KiB on Linux and in bytes on macOS
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    return None
+
+
+def process_cpu_seconds(pid: int) -> Optional[float]:
+    """User plus system CPU time a process has used, or None if it can't be read."""
+    if pid == os.getpid():
+        return time.process_time()
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            # Fields after the parenthesized command name; utime and stime are the 12th and 13th
+            fields = stat.read().rpartition(")")[2].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float, peak: Optional[float],
+              wire_bytes: Optional[int] = None, cpu_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Percentiles in milliseconds, requests per second, peak RSS, mean response
+    size on the wire (None outside HTTP) and CPU time per request of one scenario.
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "peak_rss_mb": None if peak is None else round(peak, 1),
+        "wire_kib": None if wire_bytes is None else round(wire_bytes / len(latencies) / 1024, 2),
+        "cpu_ms": None if cpu_seconds is None else round(cpu_seconds / len(latencies) * 1000, 3)
+    }
+
+
+def http_requests(scenario: str, count: int, rows: int, rng: random.Random) -> List[tuple]:
+    """(method, url, json body) of every request of a scenario, drawn from rng."""
+    if scenario == "delete":
+        ids = rng.sample(range(1, rows + 1), min(count, rows))
+        return [("DELETE", f"/subscriptions/{ids[i % len(ids)]}", None) for i in range(count)]
+    requests = []
+    for _ in range(count):
+        if scenario == "list":
+            requests.append(("GET", f"/subscriptions/?limit={PAGE_SIZE}", None))
+        elif scenario == "list_filtered":
+            requests.append(("GET", f"/subscriptions/?limit={PAGE_SIZE}&companyName={company_name(rng.randint(1, COMPANIES))}", None))
+        elif scenario == "list_sorted":
+            requests.append(("GET", f"/subscriptions/?limit={PAGE_SIZE}&sort=-price", None))
+        elif scenario == "list_expand":
+            requests.append(("GET", f"/subscriptions/?limit={PAGE_SIZE}&expand=company,category,user", None))
+        elif scenario == "get_by_id":
+            requests.append(("GET", f"/subscriptions/{rng.randint(1, rows)}", None))
+        elif scenario == "summary":
+            requests.append(("GET", "/subscriptions/summary", None))
+        elif scenario in ("search", "search_all"):
+            match = "all" if scenario == "search_all" else "any"
+            requests.append(("GET", f"/subscriptions/search?q={search_text(rng).replace(' ', '+')}&match={match}&limit={PAGE_SIZE}", None))
+        elif scenario == "companies_list":
+            requests.append(("GET", f"/companies/?limit={PAGE_SIZE}", None))
+        elif scenario == "create":
+            requests.append(("POST", "/subscriptions/", random_subscription(rng)))
+        elif scenario == "update":
+            requests.append(("PUT", f"/subscriptions/{rng.randint(1, rows)}", {"price": rng.randint(99, 9999) / 100}))
+    return requests
+
+
+def search_text(rng: random.Random) -> str:
+    """A two word search such as "premium streaming": any of the words matches about a third of the rows, both about 2.5%."""
+    return f"{rng.choice(PLANS).split()[0]} {rng.choice(CATEGORIES)}".lower()
+
+
+def random_subscription(rng: random.Random) -> Dict[str, Any]:
+    user = rng.randint(1, USERS)
+    return {
+        "companyName": company_name(rng.randint(1, COMPANIES)),
+        "price": rng.randint(99, 9999) / 100,
+        "subscriptionCategory": rng.choice(CATEGORIES),
+        "userName": user_name(user),
+        "emailAssociated": f"user{user}@example.com"
+    }
+
+
+async def drive(client, requests: List[tuple], concurrency: int) -> tuple:
+    """Send requests with concurrency clients; return latencies, error count, wall time and response bytes on the wire."""
+    latencies = []
+    errors = 0
+    wire_bytes = 0
+    pending = iter(requests)
+
+    async def worker():
+        nonlocal errors, wire_bytes
+        for method, url, body in pending:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                failed = response.status_code >= 400
+                # Body bytes as received, before decoding any Content-Encoding
+                wire_bytes += response.num_bytes_downloaded
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started, wire_bytes
+
+
+async def run_client(base_url: str, transport, server_pid: int, args) -> Dict[str, Any]:
+    """Measure every selected HTTP scenario against an app and return their summaries."""
+    import httpx
+
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    headers = {"Accept-Encoding": args.accept_encoding}
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, limits=limits, headers=headers, timeout=120) as client:
+        for scenario in args.scenarios:
+            rng = random.Random(f"{args.seed}-{scenario}")
+            requests = http_requests(scenario, args.warmup + args.requests, args.rows, rng)
+            await drive(client, requests[:args.warmup], args.concurrency)
+            reset_peak_rss(server_pid)
+            cpu_started = process_cpu_seconds(server_pid)
+            latencies, errors, elapsed, wire_bytes = await drive(client, requests[args.warmup:], args.concurrency)
+            cpu_finished = process_cpu_seconds(server_pid)
+            cpu_seconds = None if cpu_started is None or cpu_finished is None else cpu_finished - cpu_started
+            results[scenario] = summarize(latencies, errors, elapsed, peak_rss_mb(server_pid), wire_bytes, cpu_seconds)
+    return results
+
+
+def run_inprocess(args) -> Dict[str, Any]:
+    """Drive the app in this process through httpx.ASGITransport."""
+    import httpx
+    from main import app
+    from services.db.connect_to_db import engines
+
+    async def run():
+        try:
+            return await run_client("http://bench", httpx.ASGITransport(app=app), os.getpid(), args)
+        finally:
+            await engines.dispose()
+    return asyncio.run(run())
+
+
+def run_http(args) -> Dict[str, Any]:
+    """Start uvicorn on this dataset and drive it over HTTP."""
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not healthy(port):
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not become healthy")
+            time.sleep(0.05)
+        return asyncio.run(run_client(f"http://127.0.0.1:{port}", None, server.pid, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_service(args) -> Dict[str, Any]:
+    """Call the service functions directly, one call per session, like one request each."""
+    from models.subscription import SubscriptionCreate, SubscriptionFilter, SubscriptionUpdate
+    from services.db.connect_to_db import engines
+    from services.subscriptions.add_subscription_service import add_subscription
+    from services.subscriptions.delete_subscription_service import delete_subscription
+    from services.subscriptions.get_all_subscriptions_service import get_all_subscriptions
+    from services.subscriptions.get_subscription_by_id_service import get_subscription_by_id
+    from services.subscriptions.search_subscriptions_service import search_subscriptions
+    from services.subscriptions.summarize_subscriptions_service import summarize_subscriptions
+    from services.subscriptions.update_subscription_service import update_subscription
+
+    calls: Dict[str, Callable[[random.Random, int], Callable]] = {
+        "list": lambda rng, i: lambda db: get_all_subscriptions(db, limit=PAGE_SIZE),
+        "list_filtered": lambda rng, i: (lambda name: lambda db: get_all_subscriptions(db, limit=PAGE_SIZE, filters=SubscriptionFilter(companyName=name)))(company_name(rng.randint(1, COMPANIES))),
+        "get_by_id": lambda rng, i: (lambda sid: lambda db: get_subscription_by_id(db, sid))(rng.randint(1, args.rows)),
+        "summary": lambda rng, i: lambda db: summarize_subscriptions(db),
+        "search": lambda rng, i: (lambda text: lambda db: search_subscriptions(db, text, limit=PAGE_SIZE))(search_text(rng)),
+        "search_all": lambda rng, i: (lambda text: lambda db: search_subscriptions(db, text, limit=PAGE_SIZE, match_all=True))(search_text(rng)),
+        "create": lambda rng, i: (lambda data: lambda db: add_subscription(db, data))(SubscriptionCreate(**random_subscription(rng))),
+        "update": lambda rng, i: (lambda sid, data: lambda db: update_subscription(db, sid, data))(rng.randint(1, args.rows), SubscriptionUpdate(price=rng.randint(99, 9999) / 100)),
+    }
+
+    results = {}
+    for scenario in args.scenarios:
+        if scenario in HTTP_ONLY_SCENARIOS:
+            continue
+        rng = random.Random(f"{args.seed}-{scenario}")
+        count = args.warmup + args.requests
+        if scenario == "delete":
+            ids = rng.sample(range(1, args.rows + 1), min(count, args.rows))
+            prepared = [(lambda sid: lambda db: delete_subscription(db, sid)[0])(ids[i % len(ids)]) for i in range(count)]
+        else:
+            prepared = [calls[scenario](rng, i) for i in range(count)]
+
+        latencies, errors = [], 0
+        for i, call in enumerate(prepared):
+            if i == args.warmup:
+                reset_peak_rss(os.getpid())
+                started = time.perf_counter()
+                cpu_started = time.process_time()
+            call_started = time.perf_counter()
+            try:
+                with engines.session() as db:
+                    failed = not call(db)
+            except Exception:
+                failed = True
+            if i >= args.warmup:
+                latencies.append(time.perf_counter() - call_started)
+                errors += failed
+        results[scenario] = summarize(latencies, errors, time.perf_counter() - started, peak_rss_mb(os.getpid()),
+                                      cpu_seconds=time.process_time() - cpu_started)
+    engines.engine().dispose()
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Orchestration and reporting
+# ---------------------------------------------------------------------------
+
+def run_mode(mode: str, args, database_path: Optional[str]) -> Dict[str, Any]:
+    """Run one mode in a fresh interpreter, on its own copy of the SQLite dataset."""
+    env = dict(os.environ)
+    workdir = None
+    if database_path:
+        workdir = tempfile.mkdtemp(prefix="submanager-bench-")
+        working_copy = os.path.join(workdir, "subscriptions.db")
+        shutil.copyfile(database_path, working_copy)
+        env.update(DB_BACKEND="sqlite", DB_SQLITE_PATH=working_copy)
+    try:
+        command = [sys.executable, os.path.abspath(__file__), "--child", mode, "--rows", str(args.rows), "--seed", str(args.seed),
+                   "--requests", str(args.requests), "--warmup", str(args.warmup), "--concurrency", str(args.concurrency),
+                   "--accept-encoding", args.accept_encoding,
+                   "--scenarios", *args.scenarios]
+        child = subprocess.run(command, capture_output=True, text=True, cwd=API_DIR, env=env)
+        if child.returncode != 0:
+            raise RuntimeError(f"{mode} mode failed:\n{child.stderr[-4000:]}")
+        return json.loads(child.stdout.strip().splitlines()[-1])
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def print_results(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]], tolerance: Optional[float]) -> List[str]:
+    """
+    Print one table per mode, with changes against the baseline if given, and
+    return the scenarios that regressed by more than tolerance (None: not judged).
+    """
+    regressions = []
+    for mode, scenarios in results.items():
+        print(f"\n{mode}")
+        header = f"{'scenario':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'peak MiB':>10}{'wire KiB':>10}{'cpu ms':>8}{'errors':>8}"
+        print(header + (f"{'p95 vs base':>13}{'req/s vs base':>15}" if baseline else ""))
+        for scenario, result in scenarios.items():
+            peak = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.1f}"
+            wire = "-" if result.get("wire_kib") is None else f"{result['wire_kib']:.2f}"
+            cpu = "-" if result.get("cpu_ms") is None else f"{result['cpu_ms']:.2f}"
+            line = (f"{scenario:<16}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                    f"{result['throughput_rps']:>10.1f}{peak:>10}{wire:>10}{cpu:>8}{result['errors']:>8}")
+            base = (baseline or {}).get("results", {}).get(mode, {}).get(scenario)
+            if base:
+                p95_change = result["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+                rps_change = result["throughput_rps"] / base["throughput_rps"] - 1 if base["throughput_rps"] else 0.0
+                flag = ""
+                if tolerance is not None and (p95_change > tolerance or rps_change < -tolerance):
+                    flag = "  REGRESSION"
+                    regressions.append(f"{mode}/{scenario}")
+                line += f"{p95_change:>+13.1%}{rps_change:>+15.1%}{flag}"
+            print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000, help="Subscriptions in the dataset, e.g. 1000 to 1000000")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the dataset and of the request mix")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests sent first in each scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="Clients sending requests at once (inprocess and http)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Modes to run")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), help="Scenarios to run, in this order")
+    parser.add_argument("--accept-encoding", default="gzip, deflate, br, zstd",
+                        help="Accept-Encoding sent by the HTTP clients; identity for uncompressed responses")
+    parser.add_argument("--database", choices=("sqlite", "configured"), default="sqlite",
+                        help="sqlite: seeded copy in --data-dir (offline); configured: the database of the DB_* variables")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "submanager-bench"), help="Where seeded SQLite datasets are kept")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write the results JSON to this file")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 and throughput change against the baseline")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        runner = {"service": run_service, "inprocess": run_inprocess, "http": run_http}[args.child]
+        print(json.dumps(runner(args)))
+        return
+
+    if args.database == "sqlite":
+        database_path = sqlite_dataset(args.data_dir, args.rows, args.seed)
+    else:
+        database_path = None
+        seed_configured_database(args.rows, args.seed)
+
+    meta = {
+        "rows": args.rows, "seed": args.seed, "requests": args.requests, "warmup": args.warmup,
+        "concurrency": args.concurrency, "database": args.database, "accept_encoding": args.accept_encoding, "db_async": os.getenv("DB_ASYNC", "false"),
+        "python": platform.python_version(), "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
+    }
+    results = {mode: run_mode(mode, args, database_path) for mode in args.modes}
+
+    baseline = None
+    differing = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        differing = differing_meta(baseline, meta)
+        if differing:
+            print(f"baseline was recorded with different {', '.join(differing)}; changes are shown but not judged", file=sys.stderr)
+
+    regressions = print_results(results, baseline, None if differing else args.tolerance)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump({"meta": meta, "results": results}, baseline_file, indent=2)
+        print(f"\nresults saved to {args.save_baseline}")
+
+    if regressions:
+        print(f"\n{len(regressions)} scenarios regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+def differing_meta(baseline: Optional[Dict[str, Any]], meta: Dict[str, Any]) -> List[str]:
+    """Settings the baseline was recorded with that make its numbers incomparable to this run."""
+    if baseline is None:
+        return []
+    return [key for key in COMPARABLE_META if baseline["meta"].get(key) != meta[key]]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark deleting many subscriptions one row at a time versus one set-based DELETE.
+
+Seeds the configured database with throwaway subscriptions, deletes them through
+the per-row delete_subscription service and through bulk_delete_subscriptions,
+and reports wall time and statements sent for each.
+
+Usage:
+    python benchmarks/bulk_delete_benchmark.py --rows 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from models.subscription import SubscriptionCreate
+from services.db.connect_to_db import engines
+from services.subscriptions.bulk_add_subscriptions_service import bulk_add_subscriptions
+from services.subscriptions.bulk_delete_subscriptions_service import bulk_delete_subscriptions
+from services.subscriptions.delete_subscription_service import delete_subscription
+
+
+def seed(rows: int) -> list:
+    """Insert throwaway subscriptions and return their IDs."""
+    data = [SubscriptionCreate(companyName=f"bench-delete-{i}", price=1) for i in range(rows)]
+    with engines.session() as db:
+        return [subscription.subscriptionID for subscription in bulk_add_subscriptions(db, data)]
+
+
+def measure(label: str, run) -> None:
+    """Time run() and count the statements it sends."""
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engines.engine(), "before_cursor_execute", count)
+    try:
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engines.engine(), "before_cursor_execute", count)
+    print(f"{label:<10}{elapsed * 1000:>12.1f}{statements:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Subscriptions deleted by each path")
+    args = parser.parse_args()
+
+    print(f"{'path':<10}{'ms':>12}{'statements':>12}")
+
+    ids = seed(args.rows)
+
+    def per_row():
+        with engines.session() as db:
+            for subscription_id in ids:
+                delete_subscription(db, subscription_id)
+
+    measure("per-row", per_row)
+
+    ids = seed(args.rows)
+
+    def bulk():
+        with engines.session() as db:
+            bulk_delete_subscriptions(db, ids)
+
+    measure("bulk", bulk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: time from launching the API to its first healthy /health.
+
+Starts `uvicorn main:app` in a fresh process --runs times, polls /health every
+few milliseconds until it answers 200, records the elapsed time and stops the
+server again. The database configured through the usual DB_* environment
+variables is used; it only affects the result if startup waits on it.
+
+Usage:
+    python benchmarks/cold_start_benchmark.py --runs 10
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    """Pick a port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def healthy(port: int) -> bool:
+    """Whether GET /health answers 200 right now."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+    try:
+        connection.request("GET", "/health")
+        return connection.getresponse().status == 200
+    except OSError:
+        return False
+    finally:
+        connection.close()
+
+
+def time_to_healthy(timeout: float) -> float:
+    """Launch the server once and return the seconds until /health answered."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while not healthy(port):
+            if server.poll() is not None:
+                raise RuntimeError(f"Server exited with code {server.returncode} before becoming healthy")
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"Server not healthy after {timeout} s")
+            time.sleep(0.005)
+        return time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Server launches to time")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for each launch")
+    args = parser.parse_args()
+
+    results = [time_to_healthy(args.timeout) for _ in range(args.runs)]
+    print(f"time to healthy /health: median {statistics.median(results) * 1000:.0f} ms, "
+          f"min {min(results) * 1000:.0f} ms, max {max(results) * 1000:.0f} ms over {args.runs} runs")
+
+
+if __name__ == "__main__":
+    main()
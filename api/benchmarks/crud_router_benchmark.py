@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Startup and throughput benchmark for the entity CRUD routes.
+
+Reports two things:
+    import   - wall time of `import main` in fresh interpreters (median of --imports runs),
+               with the number of routes and of route/service modules it loaded
+    requests - requests per second for list, get, create and update, driven
+               in-process through httpx.ASGITransport, for companies, users and
+               categories next to the hand-written subscription routes
+
+Each import run uses its own process so nothing is cached between runs. The
+database configured through the usual DB_* environment variables is used as-is;
+the rows created for the request benchmark are deleted again at the end.
+
+Usage:
+    python benchmarks/crud_router_benchmark.py --requests 1000 --concurrency 10 --imports 7
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (prefix, create payload, update payload, primary key field of the create response)
+ENTITIES = [
+    ("companies", {"companyName": "bench-crud", "companyURL": "https://bench.example"}, {"companyName": "bench-crud-2"}, "companyId"),
+    ("users", {"userName": "bench-crud"}, {"userName": "bench-crud-2"}, "userID"),
+    ("categories", {"categoryName": "bench-crud"}, {"categoryName": "bench-crud-2"}, "categoryID"),
+    ("subscriptions", {"companyName": "bench-crud", "price": 1}, {"price": 2}, "subscriptionID"),
+]
+SEED_ROWS = 200
+
+
+def import_child() -> dict:
+    """Import the app inside the current process and report what it cost."""
+    sys.path.insert(0, API_DIR)
+    started = time.perf_counter()
+    import main
+    elapsed = time.perf_counter() - started
+    modules = [name for name in sys.modules if name.startswith(("routes.", "services."))]
+    return {"seconds": elapsed, "routes": len(main.app.routes), "modules": len(modules)}
+
+
+def measure_imports(runs: int) -> None:
+    """Import the app in fresh interpreters and print the median cost."""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--import-child"],
+            check=True, capture_output=True, text=True, cwd=API_DIR
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    median = statistics.median(result["seconds"] for result in results)
+    print(f"import main: {median * 1000:.1f} ms median of {runs}, "
+          f"{results[0]['routes']} routes, {results[0]['modules']} route/service modules")
+
+
+async def measure_requests(total: int, concurrency: int) -> None:
+    """Drive every entity's list, get, create and update endpoints and print requests per second."""
+    sys.path.insert(0, API_DIR)
+    import httpx
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'entity':<15}{'list/s':>10}{'get/s':>10}{'create/s':>10}{'update/s':>10}")
+        for prefix, create, change, key in ENTITIES:
+            seeded = await client.post(f"/{prefix}/bulk", json=[create] * SEED_ROWS)
+            seeded.raise_for_status()
+            ids = [item[key] for item in seeded.json()["created"]]
+
+            async def run(make_request) -> tuple:
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def one(i: int):
+                    async with semaphore:
+                        response = await make_request(i)
+                        response.raise_for_status()
+                        return response
+
+                started = time.perf_counter()
+                responses = await asyncio.gather(*(one(i) for i in range(total)))
+                elapsed = time.perf_counter() - started
+                return total / elapsed, responses
+
+            list_rate, _ = await run(lambda i: client.get(f"/{prefix}/", params={"limit": 50}))
+            get_rate, _ = await run(lambda i: client.get(f"/{prefix}/{ids[i % len(ids)]}"))
+            create_rate, created = await run(lambda i: client.post(f"/{prefix}/", json=create))
+            update_rate, _ = await run(lambda i: client.put(f"/{prefix}/{ids[i % len(ids)]}", json=change))
+            print(f"{prefix:<15}{list_rate:>10.0f}{get_rate:>10.0f}{create_rate:>10.0f}{update_rate:>10.0f}")
+
+            ids += [response.json()[key] for response in created]
+            for start in range(0, len(ids), 10000):
+                await client.post(f"/{prefix}/bulk-delete", json={"ids": ids[start:start + 10000]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight at once")
+    parser.add_argument("--imports", type=int, default=7, help="Fresh interpreters used to time the import")
+    parser.add_argument("--import-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.import_child:
+        print(json.dumps(import_child()))
+        return
+
+    measure_imports(args.imports)
+    asyncio.run(measure_requests(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of response serialization for the list and detail routes.
+
+Serializes the same in-memory subscriptions two ways and reports the time per
+response and the speedup:
+
+    response_model - what FastAPI does for a returned value: validate it against
+                     the response_model, dump it to Python, run jsonable_encoder
+                     and json.dumps it (routes.json_response before it existed)
+    fast path      - routes.json_response: list items dumped straight to bytes by
+                     a precompiled TypeAdapter, detail objects validated and dumped
+                     by their response model in one pass
+
+Both paths must produce the same bytes; the benchmark checks that first.
+No database is needed: the rows are unsaved SQLAlchemy objects.
+
+Usage:
+    python benchmarks/json_serialization_benchmark.py --rows 1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Callable, List
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+
+
+def build_subscriptions(rows: int) -> list:
+    """Unsaved subscriptions with a realistic mix of values and NULLs."""
+    from models.subscription import Subscription
+
+    rng = random.Random(1)
+    return [
+        Subscription(
+            subscriptionID=i, companyName=f"Company {rng.randint(1, 500):04d}",
+            price=Decimal(rng.randint(99, 9999)) / 100, subscriptionCategory=rng.choice(("Streaming", "Music", None)),
+            description=rng.choice(("Premium plan", None)), userName=f"User {rng.randint(1, 2000):05d}",
+            emailAssociated=f"user{i}@example.com"
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def response_model_path(response_model) -> Callable:
+    """Serialize a returned value the way FastAPI does for a route with this response_model."""
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    field = create_model_field(name="Response", type_=response_model, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def serialize(content) -> bytes:
+        return JSONResponse(loop.run_until_complete(serialize_response(field=field, response_content=content))).body
+    return serialize
+
+
+def timed(serialize: Callable, content, repeat: int) -> float:
+    """Median seconds per call."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        serialize(content)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="Subscriptions in the list response (MAX_PAGE_SIZE is 1000)")
+    parser.add_argument("--repeat", type=int, default=200, help="Serializations timed per path")
+    args = parser.parse_args()
+
+    from fastapi import Response
+    from models.subscription import SubscriptionResponse
+    from routes.json_response import items_response, model_response
+    from routes.subscriptions.get_all_subscriptions_route import _page_adapter, _subscription_to_dict
+
+    subscriptions = build_subscriptions(args.rows)
+    items = [_subscription_to_dict(subscription, []) for subscription in subscriptions]
+
+    # (name, content, response_model path, fast path)
+    cases = [
+        (f"list of {args.rows}", items, response_model_path(List[dict]),
+         lambda content: items_response(_page_adapter, content, Response()).body),
+        ("detail", subscriptions[0], response_model_path(SubscriptionResponse),
+         lambda content: model_response(SubscriptionResponse, content, Response()).body),
+    ]
+
+    print(f"{'response':<16}{'response_model':>16}{'fast path':>12}{'speedup':>10}")
+    for name, content, slow, fast in cases:
+        if slow(content) != fast(content):
+            raise SystemExit(f"{name}: the fast path produced a different body")
+        slow_seconds = timed(slow, content, args.repeat)
+        fast_seconds = timed(fast, content, args.repeat)
+        print(f"{name:<16}{slow_seconds * 1000:>13.3f} ms{fast_seconds * 1000:>9.3f} ms{slow_seconds / fast_seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-row create path of every entity.
+
+Calls the company, user and category repositories' add and add_subscription against the
+configured database and reports, per create, the wall time, the SQL statements
+sent and the round trips (statements plus BEGIN/COMMIT/ROLLBACK) as counted by
+services.db.query_stats. A create is expected to cost two statements: the
+INSERT ... RETURNING and the table version bump used for conditional GETs,
+plus the spend rollup upsert for subscriptions.
+
+Usage:
+    python benchmarks/write_path_benchmark.py --rows 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.category import CategoryCreate
+from models.company import CompanyCreate
+from models.subscription import SubscriptionCreate
+from models.user import UserCreate
+from services.categories.category_repository import category_repository
+from services.companies.company_repository import company_repository
+from services.db.connect_to_db import engines
+from services.db.query_stats import begin_request_stats, end_request_stats
+from services.subscriptions.add_subscription_service import add_subscription
+from services.subscriptions.bulk_delete_subscriptions_service import bulk_delete_subscriptions
+from services.users.user_repository import user_repository
+
+# (label, create service, payload factory, primary key attribute, cleanup service)
+ENTITIES = [
+    ("company", company_repository.add, lambda i: CompanyCreate(companyName=f"bench-write-{i}"), "companyId", company_repository.bulk_delete),
+    ("user", user_repository.add, lambda i: UserCreate(userName=f"bench-write-{i}"), "userID", user_repository.bulk_delete),
+    ("category", category_repository.add, lambda i: CategoryCreate(categoryName=f"bench-write-{i}"), "categoryID", category_repository.bulk_delete),
+    ("subscription", add_subscription, lambda i: SubscriptionCreate(companyName=f"bench-write-{i}", price=1), "subscriptionID", bulk_delete_subscriptions),
+]
+
+
+def measure(label: str, create, payload, key: str, cleanup, rows: int) -> None:
+    """Create rows one at a time, report the cost per create, then delete them again."""
+    ids = []
+    with engines.session() as db:
+        stats, token = begin_request_stats()
+        try:
+            started = time.perf_counter()
+            for i in range(rows):
+                ids.append(getattr(create(db, payload(i)), key))
+            elapsed = time.perf_counter() - started
+        finally:
+            end_request_stats(token)
+        cleanup(db, ids)
+
+    print(
+        f"{label:<14}{elapsed * 1000 / rows:>12.3f}"
+        f"{stats.statements / rows:>14.2f}{stats.round_trips / rows:>14.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500, help="Rows created per entity")
+    args = parser.parse_args()
+
+    print(f"{'entity':<14}{'ms/create':>12}{'stmts/create':>14}{'trips/create':>14}")
+    for label, create, payload, key, cleanup in ENTITIES:
+        measure(label, create, payload, key, cleanup, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,21 +6,32 @@ This script creates all database tables based on SQLAlchemy models.
 Run this script to set up the database schema.
 
 Usage:
-    python init_db.py
+    python init_db.py                    # create tables, indexes, the search index and seed rows
+    python init_db.py --rebuild-rollups  # recompute the subscription spend rollups
+    python init_db.py --verify-rollups   # compare the rollups with the subscriptions table
+    python init_db.py --backfill-links   # link subscriptions to companies, categories and users by name
+    python init_db.py --drop             # drop all tables
 """
 
 import logging
-from sqlalchemy import create_engine
-from services.db.connect_to_db import get_database_url, Base
+from sqlalchemy import inspect, select, insert, text
+from sqlalchemy.orm import Session
+from services.db.connect_to_db import engines, Base
+from services.logs.log_pipeline import configure_logging
 
 # Import all models to ensure they're registered with Base.metadata
 from models.company import Company
 from models.user import User
 from models.category import Category
 from models.subscription import Subscription
+from models.table_version import TableVersion
+from models.subscription_rollup import SubscriptionRollup
+from services.subscriptions.rollup_subscriptions_service import rebuild_rollups, verify_rollups
+from services.subscriptions.link_subscriptions_service import backfill_links, SUBSCRIPTION_LINKS
+from services.subscriptions.search_subscriptions_service import create_search_index, drop_search_index
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 def create_tables():
@@ -28,39 +39,156 @@ def create_tables():
     Create all database tables based on SQLAlchemy models.
     """
     try:
-        # Create database engine
-        engine = create_engine(get_database_url())
-        logger.info("Database engine created successfully")
+        # Use the shared database engine
+        engine = engines.engine()
         
         # Create all tables
         logger.info("Creating database tables...")
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully!")
         
+        # create_all skips tables that already exist, so add any columns and indexes they are missing
+        added_columns = add_missing_columns(engine)
+        create_indexes(engine)
+        
+        # Full-text search over subscriptions: a tsvector column on PostgreSQL, an FTS5 table on SQLite
+        create_search_index(engine)
+        
+        # Start change tracking for conditional GETs
+        seed_table_versions(engine)
+        
+        # A new rollups table starts empty, so fill it from existing subscriptions
+        with Session(engine) as db:
+            if db.scalar(select(SubscriptionRollup.dimension).limit(1)) is None:
+                rebuild_rollups(db)
+                db.commit()
+        
+        # Subscriptions that predate the foreign keys are linked once, when the columns appear
+        link_columns = {foreign_key.name for foreign_key, _, _ in SUBSCRIPTION_LINKS.values()}
+        if link_columns & set(added_columns.get(Subscription.__tablename__, [])):
+            backfill_subscription_links()
+        
         # List all created tables
         table_names = list(Base.metadata.tables.keys())
-        logger.info(f"Created tables: {', '.join(table_names)}")
+        logger.info("Created tables: %s", ', '.join(table_names))
         
     except Exception as e:
-        logger.error(f"Error creating database tables: {e}")
+        logger.error("Error creating database tables: %s", e)
         raise
 
+def add_missing_columns(engine) -> dict:
+    """
+    Add model columns missing from existing tables, including their foreign keys.
+    Only suitable for nullable columns without a server default, which is all
+    that has been added to the models after their tables first shipped.
+    
+    Returns:
+        dict: Table name -> names of the columns that were added
+    """
+    preparer = engine.dialect.identifier_preparer
+    inspector = inspect(engine)
+    added = {}
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column.type.compile(engine.dialect)}"
+                for foreign_key in column.foreign_keys:
+                    ddl += f" REFERENCES {preparer.format_table(foreign_key.column.table)} ({preparer.format_column(foreign_key.column)})"
+                    if foreign_key.ondelete:
+                        ddl += f" ON DELETE {foreign_key.ondelete}"
+                conn.execute(text(ddl))
+                added.setdefault(table.name, []).append(column.name)
+                logger.info("Added column %s.%s", table.name, column.name)
+    return added
+
+def create_indexes(engine):
+    """
+    Create any model indexes missing from existing tables.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    logger.info("Database indexes are up to date")
+
+def seed_table_versions(engine):
+    """
+    Add a table_versions row for every entity table that doesn't have one yet.
+    Existing versions are left alone so clients' ETags stay valid across runs.
+    """
+    tracked = [Company.__tablename__, User.__tablename__, Category.__tablename__, Subscription.__tablename__]
+    with engine.begin() as conn:
+        existing = set(conn.scalars(select(TableVersion.table_name)))
+        missing = [name for name in tracked if name not in existing]
+        if missing:
+            conn.execute(insert(TableVersion), [{"table_name": name, "version": 0} for name in missing])
+    logger.info("Table versions are seeded")
+
+def rebuild_subscription_rollups():
+    """
+    Recompute the subscription spend rollups from the subscriptions table.
+    Writes made while the rebuild runs wait for it, so no change is lost.
+    """
+    engine = engines.engine()
+    with Session(engine) as db:
+        # Lock out writers, which update the rollups in their own transactions
+        if engine.dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE subscriptions IN SHARE MODE"))
+        elif engine.dialect.name == "sqlite":
+            # Any write takes SQLite's single write lock, even one that matches no rows
+            db.execute(text("DELETE FROM subscription_rollups WHERE 0"))
+        rebuild_rollups(db)
+        db.commit()
+
+def verify_subscription_rollups() -> bool:
+    """
+    Check the subscription spend rollups against the subscriptions table.
+    
+    Returns:
+        bool: True when every rollup matches
+    """
+    engine = engines.engine()
+    with Session(engine) as db:
+        if engine.dialect.name == "postgresql":
+            # One snapshot for both sides of the comparison
+            db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+        differences = verify_rollups(db)
+    for difference in differences:
+        logger.error("Rollup mismatch %s", difference)
+    if differences:
+        logger.error("%s subscription rollups are out of date; run with --rebuild-rollups", len(differences))
+        return False
+    logger.info("Subscription rollups match the subscriptions table")
+    return True
+
+def backfill_subscription_links():
+    """
+    Resolve the company, category and user foreign keys of existing subscriptions
+    from their name columns, in committed batches.
+    """
+    engine = engines.engine()
+    with Session(engine) as db:
+        updated = backfill_links(db)
+    logger.info("Linked %s subscriptions to their company, category and user", updated)
+
 def drop_tables():
     """
     Drop all database tables. Use with caution!
     """
     try:
-        # Create database engine
-        engine = create_engine(get_database_url())
-        logger.info("Database engine created successfully")
+        # Use the shared database engine
+        engine = engines.engine()
         
         # Drop all tables
         logger.warning("Dropping all database tables...")
         Base.metadata.drop_all(bind=engine)
+        drop_search_index(engine)
         logger.info("Database tables dropped successfully!")
         
     except Exception as e:
-        logger.error(f"Error dropping database tables: {e}")
+        logger.error("Error dropping database tables: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -68,6 +196,12 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1 and sys.argv[1] == "--drop":
         drop_tables()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--rebuild-rollups":
+        rebuild_subscription_rollups()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--verify-rollups":
+        sys.exit(0 if verify_subscription_rollups() else 1)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--backfill-links":
+        backfill_subscription_links()
     else:
         create_tables()
 
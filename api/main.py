@@ -1,4 +1,6 @@
 from typing import Union, List
+from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 import logging
 from fastapi import FastAPI, Depends, HTTPException
@@ -7,47 +9,63 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 # Import database components
-from services.db.connect_to_db import get_db
+from services.db.connect_to_db import get_db, engines
+from services.logs.log_pipeline import configure_logging
+from middleware.query_stats_middleware import QueryStatsMiddleware
+from middleware.metrics_middleware import MetricsMiddleware
+from middleware.compression_middleware import CompressionMiddleware
 # from models.company import Company
 # from models.user import User
 
-# Import routers - Companies
-from routes.companies.get_all_companies_route import router as get_all_companies_router
-from routes.companies.add_company_route import router as add_company_router
-from routes.companies.update_company_route import router as update_company_router
-from routes.companies.delete_company_route import router as delete_company_router
-from routes.companies.get_company_by_id_route import router as get_company_by_id_router
-
-# Import routers - Users
-from routes.users.get_all_users_route import router as get_all_user_router
-from routes.users.add_user_route import router as add_user_router
-from routes.users.update_user_route import router as update_user_router
-from routes.users.delete_user_route import router as delete_user_router
-from routes.users.get_user_by_id_route import router as get_user_by_id_router
-
-# Import routers - Categories
-from routes.categories.get_all_categories_route import router as get_all_categories_router
-from routes.categories.get_category_by_id_route import router as get_category_by_id_router
-from routes.categories.add_category_route import router as add_category_router
-from routes.categories.update_category_route import router as update_category_router
-from routes.categories.delete_category_route import router as delete_category_router
+# Import routers - Companies, Users and Categories (generated from their repositories)
+from routes.companies.companies_router import router as companies_router
+from routes.users.users_router import router as users_router
+from routes.categories.categories_router import router as categories_router
 
 # Import routers - Subscriptions
 from routes.subscriptions.get_all_subscriptions_route import router as get_all_subscriptions_router
+from routes.subscriptions.export_subscriptions_route import router as export_subscriptions_router
+from routes.subscriptions.get_subscription_summary_route import router as get_subscription_summary_router
+from routes.subscriptions.search_subscriptions_route import router as search_subscriptions_router
 from routes.subscriptions.get_subscription_by_id_route import router as get_subscription_by_id_router
 from routes.subscriptions.add_subscription_route import router as add_subscription_router
+from routes.subscriptions.bulk_add_subscriptions_route import router as bulk_add_subscriptions_router
 from routes.subscriptions.update_subscription_route import router as update_subscription_router
 from routes.subscriptions.delete_subscription_route import router as delete_subscription_router
+from routes.subscriptions.bulk_delete_subscriptions_route import router as bulk_delete_subscriptions_router
+
+# Import routers - Cache
+from routes.cache.get_cache_stats_route import router as get_cache_stats_router
+
+# Import routers - Database
+from routes.db.get_pool_stats_route import router as get_pool_stats_router
+from routes.db.get_slow_queries_route import router as get_slow_queries_router
+
+# Import routers - Metrics
+from routes.metrics.get_metrics_route import router as get_metrics_router
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the database engines and warm their pools in the background, so the
+    app starts serving (and /health answers) without waiting on the database.
+    Pooled connections are closed at shutdown.
+    """
+    warm_up = asyncio.create_task(engines.start())
+    yield
+    warm_up.cancel()
+    await engines.dispose()
+
 # Create FastAPI app
 app = FastAPI(
     title="Subscription Manager API",
     description="API for managing subscriptions",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS middleware
@@ -57,29 +75,39 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "Link", "X-DB-Statements", "X-DB-Round-Trips", "Server-Timing", "ETag"],  # Let the frontend read pagination, query stats and ETags
 )
 
+# Record request counts, latency and database time for GET /metrics
+# (added first so it runs inside QueryStatsMiddleware and shares its query stats)
+app.add_middleware(MetricsMiddleware)
+
+# Report statements, round trips and database time per request in response headers,
+# and check statement counts against the route budgets
+app.add_middleware(QueryStatsMiddleware)
+
+# Compress responses the client accepts compressed (added last so it wraps everything,
+# including the headers set by the middleware above)
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
-app.include_router(get_all_companies_router)
-app.include_router(add_company_router)
-app.include_router(update_company_router)
-app.include_router(delete_company_router)
-app.include_router(get_company_by_id_router)
-app.include_router(get_all_user_router)
-app.include_router(add_user_router)
-app.include_router(update_user_router)
-app.include_router(delete_user_router)
-app.include_router(get_user_by_id_router)
-app.include_router(get_all_categories_router)
-app.include_router(get_category_by_id_router)
-app.include_router(add_category_router)
-app.include_router(update_category_router)
-app.include_router(delete_category_router)
+app.include_router(companies_router)
+app.include_router(users_router)
+app.include_router(categories_router)
 app.include_router(get_all_subscriptions_router)
+app.include_router(export_subscriptions_router)  # Before the /{subscription_id} routes so "export" is not taken as an ID
+app.include_router(get_subscription_summary_router)  # Likewise for "summary"
+app.include_router(search_subscriptions_router)  # And "search"
 app.include_router(get_subscription_by_id_router)
 app.include_router(add_subscription_router)
+app.include_router(bulk_add_subscriptions_router)
 app.include_router(update_subscription_router)
 app.include_router(delete_subscription_router)
+app.include_router(bulk_delete_subscriptions_router)
+app.include_router(get_cache_stats_router)
+app.include_router(get_pool_stats_router)
+app.include_router(get_slow_queries_router)
+app.include_router(get_metrics_router)
 
 # Health check endpoint for Kubernetes
 @app.get("/health")
@@ -0,0 +1,216 @@
+import logging
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.db.config import load_config
+
+# Optional codecs: without them responses use the encodings that are available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Media types worth compressing; anything else (images, archives) is already compressed or tiny
+COMPRESSIBLE_TYPES = frozenset({"application/json", "application/x-ndjson", "application/javascript", "application/xml"})
+
+class GzipStream:
+    """gzip encoder; compress() flushes, so every chunk can be decoded as it arrives."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self._compressor = zlib.compressobj(config['compression_gzip_level'], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+class BrotliStream:
+    """Brotli encoder, with the same interface as GzipStream."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self._compressor = brotli.Compressor(quality=config['compression_brotli_quality'])
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+class ZstdStream:
+    """Zstandard encoder, with the same interface as GzipStream."""
+
+    def __init__(self, config: Dict[str, Any]):
+        self._compressor = zstandard.ZstdCompressor(level=config['compression_zstd_level']).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+# Content-Encoding token -> encoder, for the codecs installed
+ENCODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {"gzip": GzipStream}
+if brotli is not None:
+    ENCODERS["br"] = BrotliStream
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdStream
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Pick the encoding of a response from the request's Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, br;q=0.9, *;q=0"
+        encodings: Encodings the server offers, most preferred first
+
+    Returns:
+        Optional[str]: The offered encoding with the highest q value, ties going
+            to the server's preference; None to send the response uncompressed
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+def is_compressible(headers: Headers) -> bool:
+    """Whether a response's media type is text-like and it isn't encoded already."""
+    if "content-encoding" in headers:
+        return False
+    media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES or media_type.endswith(("+json", "+xml"))
+
+def vary_on_accept_encoding(start: Message) -> Message:
+    """
+    Add Vary: Accept-Encoding to the start of a response that would have been
+    compressed for another client, so shared caches keep the encodings apart.
+    """
+    headers = MutableHeaders(raw=list(start["headers"]))
+    if not is_compressible(headers):
+        return start
+    headers.add_vary_header("Accept-Encoding")
+    return {**start, "headers": headers.raw}
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses with the best encoding the client
+    accepts: zstd, br or gzip, in the order of COMPRESSION_ENCODINGS.
+
+    The start of a response is held until COMPRESSION_MIN_SIZE bytes of body
+    have arrived; smaller responses are sent as they are. Complete responses get
+    a Content-Length and a "compress" Server-Timing entry with the time spent
+    compressing. Streaming responses are compressed chunk by chunk and each
+    chunk is flushed, so clients can decode the stream as it arrives. Every
+    response of a compressible type carries Vary: Accept-Encoding, whether it
+    was compressed or not.
+    """
+
+    def __init__(self, app: ASGIApp, config: Optional[Dict[str, Any]] = None):
+        self.app = app
+        self.config = config or load_config()
+        self.minimum_size = self.config['compression_min_size']
+        self.encodings: List[str] = []
+        for name in self.config['compression_encodings']:
+            if name in ENCODERS:
+                self.encodings.append(name)
+            else:
+                logger.warning("Response compression with %s is not available and was skipped", name)
+        logger.info("Response compression enabled for %s", ', '.join(self.encodings) or 'no encodings')
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            async def send_uncompressed(message: Message):
+                if message["type"] == "http.response.start":
+                    message = vary_on_accept_encoding(message)
+                await send(message)
+
+            await self.app(scope, receive, send_uncompressed)
+            return
+
+        start: Optional[Message] = None
+        pending: List[bytes] = []
+        stream = None
+
+        async def send_compressed(message: Message):
+            nonlocal start, stream
+            if message["type"] == "http.response.start":
+                # Held until the body shows whether the response is worth compressing
+                start = message
+                return
+            if start is None:
+                # Started already, compressed or not
+                if stream is not None and message["type"] == "http.response.body":
+                    more_body = message.get("more_body", False)
+                    body = message.get("body", b"")
+                    message = {**message, "body": stream.compress(body) if more_body else stream.finish(body)}
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=list(start["headers"]))
+            body_message = message["type"] == "http.response.body"
+            more_body = body_message and message.get("more_body", False)
+            if body_message:
+                pending.append(message.get("body", b""))
+            size = sum(len(chunk) for chunk in pending)
+            if more_body and size < self.minimum_size and is_compressible(headers):
+                return
+
+            body = b"".join(pending)
+            pending.clear()
+            if not body_message or size < self.minimum_size or start["status"] in (204, 304) or not is_compressible(headers):
+                first, start = vary_on_accept_encoding(start), None
+                await send(first)
+                if body_message:
+                    message = {**message, "body": body}
+                await send(message)
+                return
+
+            started = time.perf_counter()
+            stream = ENCODERS[encoding](self.config)
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                compressed = stream.compress(body)
+                if "content-length" in headers:
+                    del headers["content-length"]
+            else:
+                compressed = stream.finish(body)
+                headers["Content-Length"] = str(len(compressed))
+                headers.append("Server-Timing", f"compress;dur={(time.perf_counter() - started) * 1000:.1f}")
+            first, start = {**start, "headers": headers.raw}, None
+            await send(first)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
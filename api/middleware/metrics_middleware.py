@@ -0,0 +1,61 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.db.query_stats import begin_request_stats, end_request_stats, current_request_stats
+from services.metrics.request_metrics import request_metrics
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records count, status, latency and database time of
+    every request in request_metrics, for GET /metrics.
+
+    Database time comes from the request's query stats, so add this middleware
+    inside QueryStatsMiddleware (before it in add_middleware order) to share them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = current_request_stats()
+        token = None
+        if stats is None:
+            stats, token = begin_request_stats()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        request_metrics.in_progress += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_metrics.in_progress -= 1
+            request_metrics.observe(
+                scope["method"], route_template(scope), status_code,
+                time.perf_counter() - started, stats.db_seconds, stats.statements
+            )
+            if token is not None:
+                end_request_stats(token)
+
+def route_template(scope: Scope) -> str:
+    """
+    The path template of the route that handled the request, e.g.
+    /subscriptions/{subscription_id}; "unmatched" if no route matched, so
+    scanning for random URLs can't create new series.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Routes FastAPI adds itself (/docs, /openapi.json) have fixed paths
+    if "endpoint" in scope:
+        return scope["path"]
+    return "unmatched"
@@ -0,0 +1,63 @@
+import time
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.db.config import load_config
+from services.db.query_stats import begin_request_stats, end_request_stats
+from services.db.statement_budget import check_statement_budget
+from middleware.metrics_middleware import route_template
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that records database activity per request and reports it
+    in the X-DB-Statements and X-DB-Round-Trips response headers, and as db and
+    app durations in Server-Timing, which browser dev tools show per request.
+
+    Streamed responses, such as exports, send their headers before their
+    queries run, so they get none of these headers rather than a count of 0.
+
+    When the request is done its statement count is checked against the
+    route's budget (see statement_budget), so N+1 regressions are logged, or
+    fail the request in tests with DB_STATEMENT_BUDGET_MODE=raise.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.config = load_config()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats, token = begin_request_stats()
+        start: Optional[Message] = None
+
+        async def send_with_stats(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Held until the first body message shows whether the response is streamed
+                start = message
+                return
+            if start is not None:
+                first, start = start, None
+                if message["type"] == "http.response.body" and not message.get("more_body", False):
+                    app_ms = (time.perf_counter() - started) * 1000
+                    headers = MutableHeaders(scope=first)
+                    headers["X-DB-Statements"] = str(stats.statements)
+                    headers["X-DB-Round-Trips"] = str(stats.round_trips)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} statements", app;dur={app_ms:.1f}'
+                    )
+                await send(first)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            end_request_stats(token)
+        # Checked once the body is sent too, so statements of streamed responses count
+        check_statement_budget(scope["method"], route_template(scope), stats.statements, self.config)
@@ -0,0 +1,31 @@
+from typing import Any, Dict, Generic, List, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+# Pydantic models shared by the bulk endpoints of every entity
+class BulkItemError(BaseModel):
+    """Pydantic model describing why one item of a bulk request was rejected"""
+    index: int = Field(..., example=3, description="Position of the rejected item in the request body")
+    errors: List[Dict[str, Any]] = Field(..., description="Validation errors for the item")
+
+
+class BulkCreateResponse(BaseModel, Generic[T]):
+    """
+    Pydantic model for the result of a bulk create.
+    Created items are listed in request order, skipping the rejected ones.
+    """
+    created: List[T] = Field(..., description="The created items with their assigned IDs")
+    errors: List[BulkItemError] = Field(default_factory=list, description="Items that failed validation and were not created")
+
+
+class BulkDeleteRequest(BaseModel):
+    """Pydantic model for a bulk delete sent in the request body"""
+    ids: List[int] = Field(..., min_length=1, max_length=10000, example=[1, 2, 3], description="IDs to delete")
+
+
+class BulkDeleteResponse(BaseModel):
+    """Pydantic model for the result of a bulk delete"""
+    deleted: List[int] = Field(..., example=[1, 3], description="IDs that were deleted")
+    missing: List[int] = Field(..., example=[2], description="Requested IDs that did not exist")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+# Pydantic models for monitoring the entity cache
+class CacheStatsResponse(BaseModel):
+    """Pydantic model for the usage counters of the entity cache"""
+    backend: str = Field(..., example="TTLLRUCache", description="Cache backend in use")
+    hits: int = Field(..., example=1200, description="Lookups answered from the cache")
+    misses: int = Field(..., example=85, description="Lookups that went to the database")
+    hit_ratio: float = Field(..., example=0.934, description="hits / (hits + misses), 0 before the first lookup")
+    evictions: int = Field(..., example=0, description="Entries dropped to stay within the size bound")
+    expirations: int = Field(..., example=12, description="Entries dropped because their TTL had passed")
+    invalidations: int = Field(..., example=4, description="Entries removed after a delete or a missed write")
+    size: int = Field(..., example=73, description="Entries currently held")
+    max_entries: int = Field(..., example=10000, description="Size bound, 0 when caching is disabled")
+    ttl_seconds: float = Field(..., example=60, description="Lifetime of an entry in seconds")
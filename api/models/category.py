@@ -16,7 +16,7 @@ class Category(Base):
     __tablename__ = "categories"
     
     categoryID = Column(Integer, primary_key=True, index=True)
-    categoryName = Column(String, nullable=True)
+    categoryName = Column(String, nullable=True, index=True)  # Indexed for resolving subscriptions by name
     
     def __repr__(self):
         return f"<User {self.categoryName}>"
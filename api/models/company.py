@@ -17,7 +17,7 @@ class Company(Base):
     __tablename__ = "companies"
     
     companyId = Column(Integer, primary_key=True, index=True)
-    companyName = Column(String, nullable=True)  # character varying in PostgreSQL
+    companyName = Column(String, nullable=True, index=True)  # character varying in PostgreSQL; indexed for resolving subscriptions by name
     companyURL = Column(Text, nullable=True)     # text in PostgreSQL
     
     def __repr__(self):
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+# Pydantic models for monitoring the database connection pools
+class PoolStatsResponse(BaseModel):
+    """Pydantic model for the state and checkout counters of one connection pool"""
+    engine: str = Field(..., example="sync", description="Engine the pool belongs to: sync or async")
+    size: int = Field(..., example=10, description="Connections kept open in the pool")
+    checked_out: int = Field(..., example=3, description="Connections currently in use")
+    idle: int = Field(..., example=7, description="Open connections waiting in the pool")
+    overflow: int = Field(..., example=0, description="Connections open beyond the pool size")
+    max_overflow: int = Field(..., example=20, description="Connections allowed beyond the pool size")
+    checkouts: int = Field(..., example=5210, description="Connections handed out")
+    timeouts: int = Field(..., example=0, description="Checkouts that gave up after the pool timeout")
+    slow_checkouts: int = Field(..., example=2, description="Checkouts slower than DB_POOL_SLOW_CHECKOUT_MS")
+    wait_ms_total: float = Field(..., example=812.4, description="Time spent obtaining connections, in milliseconds")
+    wait_ms_avg: float = Field(..., example=0.16, description="Average time to obtain a connection, in milliseconds")
+    wait_ms_max: float = Field(..., example=143.0, description="Longest time to obtain a connection, in milliseconds")
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+# Pydantic models for inspecting slow database statements
+class SlowQueryResponse(BaseModel):
+    """Pydantic model for one statement that exceeded the slow query threshold"""
+    captured_at: datetime = Field(..., description="When the statement finished")
+    duration_ms: float = Field(..., example=412.7, description="Time the statement took, in milliseconds")
+    statement: str = Field(..., example='SELECT subscriptions."subscriptionID" FROM subscriptions WHERE subscriptions."companyName" = %(companyName_1)s', description="SQL text with parameter placeholders")
+    parameters: str = Field(..., example="{'companyName_1': '<str>'}", description="Bound parameters with their values replaced by their types")
+    caller: Optional[str] = Field(None, example="services.subscriptions.get_all_subscriptions_service.get_all_subscriptions", description="Service function that ran the statement")
+    plan: Optional[str] = Field(None, description="EXPLAIN output, when the statement was sampled for a plan")
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, Float, ForeignKey, DECIMAL
+from sqlalchemy import Column, Integer, String, Boolean, Text, Float, ForeignKey, DECIMAL, Index
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from pydantic import BaseModel, HttpUrl, Field, EmailStr
-from typing import Optional
+from typing import Any, Dict, Optional
+from typing_extensions import NotRequired, TypedDict
+from decimal import Decimal
 from services.db.connect_to_db import Base
+from models.company import Company
+from models.category import Category
+from models.user import User
 
 class Subscription(Base):
     """
@@ -17,6 +23,16 @@ class Subscription(Base):
         description: description
         userName: name the sub is under
         emailAssociated: email used for the sub account
+        companyId: Company the companyName resolves to, if any
+        categoryID: Category the subscriptionCategory resolves to, if any
+        userID: User the userName resolves to, if any
+    
+    The name columns stay the source of truth for the API; the foreign keys link
+    each subscription to the matching row, resolved by name on every write to a
+    subscription and relinked when a company, category or user changes. Keeping
+    both is step 1 of moving to the keys and makes the table bigger, not smaller:
+    filters, sorting and summaries still use the names. The README's "Subscription
+    foreign keys" section has the plan for retiring the name columns.
     """
     __tablename__ = "subscriptions"
     
@@ -27,6 +43,25 @@ class Subscription(Base):
     description = Column(Text, nullable=True)
     userName = Column(String, nullable=True)
     emailAssociated = Column(String, nullable=True)
+    companyId = Column(Integer, ForeignKey("companies.companyId", ondelete="SET NULL"), nullable=True, index=True)
+    categoryID = Column(Integer, ForeignKey("categories.categoryID", ondelete="SET NULL"), nullable=True, index=True)
+    userID = Column(Integer, ForeignKey("users.userID", ondelete="SET NULL"), nullable=True, index=True)
+    
+    # Loaded on demand with selectinload, see get_all_subscriptions(expand=...)
+    company = relationship(Company, lazy="raise_on_sql")
+    category = relationship(Category, lazy="raise_on_sql")
+    user = relationship(User, lazy="raise_on_sql")
+    
+    # Each filterable column is indexed together with the primary key, so an equality
+    # filter or a sort on the column is served by one index range scan, with the
+    # primary key as the keyset pagination tie-breaker
+    __table_args__ = (
+        Index("ix_subscriptions_companyName_id", "companyName", "subscriptionID"),
+        Index("ix_subscriptions_subscriptionCategory_id", "subscriptionCategory", "subscriptionID"),
+        Index("ix_subscriptions_userName_id", "userName", "subscriptionID"),
+        Index("ix_subscriptions_emailAssociated_id", "emailAssociated", "subscriptionID"),
+        Index("ix_subscriptions_price_id", "price", "subscriptionID"),
+    )
     
     def __repr__(self):
         return f"<Subscription {self.subscriptionID}: {self.companyName}>"
@@ -61,6 +96,19 @@ class SubscriptionUpdate(BaseModel):
     emailAssociated: Optional[str] = Field(None, example="john.doe@example.com", description="Email used for the subscription account")
 
 
+class SubscriptionFilter(BaseModel):
+    """
+    Pydantic model for filtering the subscription list.
+    Every field is optional; the filters that are set are combined with AND.
+    """
+    companyName: Optional[str] = Field(None, example="Netflix", description="Exact name of the subscription service")
+    subscriptionCategory: Optional[str] = Field(None, example="Entertainment", description="Exact category of the subscription")
+    userName: Optional[str] = Field(None, example="John Doe", description="Exact name the subscription is under")
+    emailAssociated: Optional[str] = Field(None, example="john.doe@example.com", description="Exact email used for the subscription account")
+    minPrice: Optional[float] = Field(None, example=5.00, description="Minimum monthly price, inclusive")
+    maxPrice: Optional[float] = Field(None, example=20.00, description="Maximum monthly price, inclusive")
+
+
 class SubscriptionResponse(SubscriptionBase):
     """Pydantic model for subscription response that includes the ID"""
     subscriptionID: int = Field(..., example=1, description="Unique identifier for the subscription")
@@ -68,3 +116,35 @@ class SubscriptionResponse(SubscriptionBase):
     model_config = {
         "from_attributes": True
     }
+
+
+class SubscriptionListItem(TypedDict):
+    """
+    One subscription in the GET /subscriptions list.
+    A TypedDict rather than a model, so rows built as dicts serialize without being validated.
+    """
+    id: int
+    name: str
+    price: Decimal
+    category: Optional[str]
+    description: Optional[str]
+    account_holder: Optional[str]
+    account_email: Optional[str]
+    related: NotRequired[Dict[str, Optional[Dict[str, Any]]]]
+
+
+class SubscriptionSummary(BaseModel):
+    """
+    Pydantic model for spend aggregated over a set of subscriptions.
+    Money values are exact decimals, sent as strings like the list endpoint's price.
+    """
+    count: int = Field(..., example=12, description="Number of subscriptions")
+    total: Decimal = Field(..., example="143.88", description="Sum of the monthly prices")
+    average: Optional[Decimal] = Field(None, example="11.99", description="Average monthly price, rounded to cents; null when count is 0")
+    minimum: Optional[Decimal] = Field(None, example="4.99", description="Lowest monthly price; null when count is 0")
+    maximum: Optional[Decimal] = Field(None, example="22.99", description="Highest monthly price; null when count is 0")
+
+
+class SubscriptionGroupSummary(SubscriptionSummary):
+    """Pydantic model for spend aggregated over the subscriptions sharing one category, user or company"""
+    key: Optional[str] = Field(..., example="Entertainment", description="Category, user or company name; null groups the subscriptions without one")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Boolean, DECIMAL
+from services.db.connect_to_db import Base
+
+class SubscriptionRollup(Base):
+    """
+    SQLAlchemy model for the subscription_rollups table.
+    
+    Spend per category, user and company, plus one global row, kept up to date
+    by the subscription write services in the same transaction as the write.
+    Subscriptions without a value for the grouping column are rolled up under
+    key_is_null, because a NULL cannot be part of the primary key.
+    
+    Attributes:
+        dimension: "all", "category", "user" or "company" (primary key)
+        key_is_null: True for the group of subscriptions without a value (primary key)
+        group_key: Category, user or company name; "" for the global and NULL groups (primary key)
+        count: Number of subscriptions in the group
+        total: Sum of their monthly prices
+        minimum: Lowest monthly price in the group
+        maximum: Highest monthly price in the group
+    """
+    __tablename__ = "subscription_rollups"
+    
+    dimension = Column(String, primary_key=True)
+    key_is_null = Column(Boolean, primary_key=True, default=False)
+    group_key = Column(String, primary_key=True, default="")
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(DECIMAL(14, 2), nullable=False, default=0)
+    minimum = Column(DECIMAL(10, 2), nullable=True)
+    maximum = Column(DECIMAL(10, 2), nullable=True)
+    
+    def __repr__(self):
+        return f"<SubscriptionRollup {self.dimension}:{self.group_key}: {self.count} / {self.total}>"
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, BigInteger
+from services.db.connect_to_db import Base
+
+class TableVersion(Base):
+    """
+    SQLAlchemy model for the table_versions table.
+    
+    One row per entity table, bumped inside every transaction that writes to
+    that table, so readers can tell whether anything changed with a single
+    primary key lookup.
+    
+    Attributes:
+        table_name: Name of the tracked table (primary key)
+        version: Number of committed writes to the table
+    """
+    __tablename__ = "table_versions"
+    
+    table_name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<TableVersion {self.table_name}: {self.version}>"
@@ -16,7 +16,7 @@ class User(Base):
     __tablename__ = "users"
     
     userID = Column(Integer, primary_key=True, index=True)
-    userName = Column(String, nullable=True)
+    userName = Column(String, nullable=True, index=True)  # Indexed for resolving subscriptions by name
     
     def __repr__(self):
         return f"<User {self.userName}>"
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, status
+
+from models.cache import CacheStatsResponse
+from services.cache.entity_cache import get_cache
+
+# Create router
+router = APIRouter(
+    prefix="/cache",
+    tags=["cache"],
+    responses={
+        status.HTTP_200_OK: {"description": "Cache Statistics Retrieved Successfully"}
+    }
+)
+
+@router.get(
+    "/stats",
+    response_model=CacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get entity cache statistics",
+    response_description="Hit, miss and eviction counters of the get-by-id cache"
+)
+async def get_cache_stats_endpoint():
+    """
+    Report how the get-by-id cache is performing in this process.
+    
+    Counters are per worker process and start from zero when the process starts.
+    
+    Returns:
+    - **CacheStatsResponse**: Backend name, counters and configured bounds
+    """
+    cache = get_cache()
+    stats = cache.stats()
+    lookups = stats.hits + stats.misses
+    return CacheStatsResponse(
+        backend=type(cache).__name__,
+        hit_ratio=stats.hits / lookups if lookups else 0.0,
+        **stats.as_dict()
+    )
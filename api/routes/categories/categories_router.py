@@ -0,0 +1,12 @@
+from models.category import CategoryCreate, CategoryUpdate, CategoryResponse
+from routes.crud_router import create_crud_router
+from services.categories.category_repository import category_repository
+
+# List, get, create, bulk create, update, delete and bulk delete endpoints for categories
+router = create_crud_router(
+    category_repository,
+    CategoryCreate,
+    CategoryUpdate,
+    CategoryResponse,
+    list_fields={"id": "categoryID", "name": "categoryName"}
+)
@@ -0,0 +1,12 @@
+from models.company import CompanyCreate, CompanyUpdate, CompanyResponse
+from routes.crud_router import create_crud_router
+from services.companies.company_repository import company_repository
+
+# List, get, create, bulk create, update, delete and bulk delete endpoints for companies
+router = create_crud_router(
+    company_repository,
+    CompanyCreate,
+    CompanyUpdate,
+    CompanyResponse,
+    list_fields={"id": "companyId", "name": "companyName", "url": "companyURL"}
+)
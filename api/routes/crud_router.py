@@ -0,0 +1,545 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from models.bulk import BulkCreateResponse, BulkDeleteRequest, BulkDeleteResponse
+from services.db.bulk import validate_bulk_items, BULK_BATCH_SIZE, MAX_BULK_BATCH_SIZE, MAX_BULK_ITEMS
+from services.db.connect_to_db import get_session, run_service, DBSession
+from services.db.change_versions import table_etag, content_etag, etag_matches, set_etag_headers, not_modified
+from services.db.pagination import set_pagination_headers, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from services.db.repository import Repository
+from routes.json_response import items_response, model_response
+
+def create_crud_router(
+    repository: Repository,
+    create_schema: Type[BaseModel],
+    update_schema: Type[BaseModel],
+    response_schema: Type[BaseModel],
+    list_fields: Dict[str, str]
+) -> APIRouter:
+    """
+    Build the list, get, create, bulk create, update, delete and bulk delete
+    endpoints for an entity served by a Repository.
+
+    Endpoint docstrings are templates filled in with the entity's names, so the
+    OpenAPI docs read as if each entity's routes were written out by hand. Route
+    names follow the same pattern, which keeps the generated operation IDs stable.
+
+    Args:
+        repository: Repository of the entity
+        create_schema: Pydantic model for POST request bodies
+        update_schema: Pydantic model for PUT request bodies, with every field optional
+        response_schema: Pydantic model returned by get, create and update
+        list_fields: List item key -> model attribute, for the compact list response
+
+    Returns:
+        APIRouter: Router mounted at /<plural>
+    """
+    singular, plural = repository.singular, repository.plural
+    names = {"singular": singular, "plural": plural, "Singular": singular.capitalize(), "Plural": plural.capitalize()}
+    table_name = repository.model.__tablename__
+    # Path parameter named after the entity, e.g. /companies/{company_id}
+    id_name = f"{singular}_id"
+    id_path = f"/{{{id_name}}}"
+    # Serializes a page of list items straight to JSON bytes
+    page_adapter = TypeAdapter(List[Dict[str, Any]])
+
+    def describe(endpoint: Callable) -> Callable:
+        """Fill the entity's names into an endpoint's docstring before FastAPI reads it."""
+        endpoint.__doc__ = endpoint.__doc__.format(**names)
+        return endpoint
+
+    def parse_ids(values: List[str]) -> List[int]:
+        """Accept both ?ids=1,2,3 and ?ids=1&ids=2&ids=3."""
+        try:
+            ids = [int(value) for item in values for value in item.split(",") if value.strip()]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ids must be a comma separated list of integers"
+            )
+        if not ids or len(ids) > MAX_BULK_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Between 1 and {MAX_BULK_ITEMS} ids must be given"
+            )
+        return ids
+
+    async def bulk_delete(db: DBSession, ids: List[int]) -> BulkDeleteResponse:
+        """Run the bulk delete and map database errors to HTTP errors."""
+        try:
+            deleted, missing = await run_service(db, repository.bulk_delete, ids)
+            return BulkDeleteResponse(deleted=deleted, missing=missing)
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    # Create router
+    router = APIRouter(
+        prefix=f"/{plural}",
+        tags=[plural],
+        responses={status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"}}
+    )
+
+    @router.get("/", response_model=List[dict], name=f"read_{plural}")
+    @describe
+    async def read_items(
+        request: Request,
+        response: Response,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description=f"Maximum number of {plural} to return"),
+        after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Get one page of {plural} from the database, ordered by ID.
+
+        When more {plural} follow, the cursor for the next page is returned in the
+        X-Next-Cursor header (and as a Link header) and can be passed back as `after`.
+        Responses carry an ETag; sending it back in If-None-Match gets a 304 until
+        the table is written to.
+
+        Returns:
+            List of {plural}
+        """
+        try:
+            # Answer unchanged polls before running the query or serializing anything
+            etag = await run_service(db, table_etag, table_name)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            set_etag_headers(response, etag)
+
+            page = await run_service(db, repository.get_page, limit, after)
+            set_pagination_headers(request, response, page)
+            # Convert SQLAlchemy models to dictionaries and serialize them in one pass
+            return items_response(page_adapter, [
+                {key: getattr(item, attribute) for key, attribute in list_fields.items()}
+                for item in page.items
+            ], response)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=str(e)
+            )
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Database error: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    @router.get(
+        id_path,
+        response_model=response_schema,
+        status_code=status.HTTP_200_OK,
+        name=f"get_{singular}_endpoint",
+        summary=f"Get a {singular} by ID",
+        response_description=f"The requested {singular}",
+        responses={
+            status.HTTP_404_NOT_FOUND: {"description": f"{names['Singular']} Not Found"},
+            status.HTTP_200_OK: {"description": f"{names['Singular']} Retrieved Successfully"}
+        }
+    )
+    @describe
+    async def get_item(
+        request: Request,
+        response: Response,
+        item_id: int = Path(..., alias=id_name, title=f"{names['Singular']} ID", description=f"ID of the {singular} to retrieve", gt=0),
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Retrieve a single {singular} by its ID.
+
+        Parameters:
+        - **{singular}_id**: ID of the {singular} to retrieve (path parameter)
+
+        Returns:
+        - **{Singular}Response**: The requested {singular}
+        - **304 Not Modified**: If If-None-Match holds the ETag of the {singular} as it would be sent
+
+        Raises:
+        - **404 Not Found**: If the {singular} with the given ID doesn't exist
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        try:
+            item = await run_service(db, repository.get, item_id)
+
+            if item is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{names['Singular']} with ID {item_id} not found"
+                )
+
+            # The row may come from the entity cache, so the ETag is taken from the body itself
+            sent = model_response(response_schema, item, response)
+            etag = content_etag(sent.body)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            set_etag_headers(sent, etag)
+            return sent
+
+        except HTTPException:
+            # Let the 404 raised above through instead of turning it into a 500
+            raise
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    @router.post(
+        "/",
+        response_model=response_schema,
+        status_code=status.HTTP_201_CREATED,
+        name=f"create_{singular}",
+        summary=f"Create a new {singular}",
+        response_description=f"The created {singular}",
+        responses={
+            status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+            status.HTTP_201_CREATED: {"description": f"{names['Singular']} Created Successfully"}
+        }
+    )
+    @describe
+    async def create_item(
+        item: create_schema,
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Create a new {singular} in the database.
+
+        Parameters:
+        - **{singular}**: {Singular} data (request body)
+
+        Returns:
+        - **{Singular}Response**: The created {singular} with its assigned ID
+
+        Raises:
+        - **400 Bad Request**: If the {singular} data is invalid or a duplicate
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        try:
+            return await run_service(db, repository.add, item)
+
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{names['Singular']} already exists or constraint violation"
+            )
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    @router.post(
+        "/bulk",
+        response_model=BulkCreateResponse[response_schema],
+        status_code=status.HTTP_201_CREATED,
+        name=f"bulk_create_{plural}",
+        summary=f"Create many {plural} at once",
+        response_description=f"The created {plural} and any rejected items",
+        responses={
+            status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+            status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": f"No Valid {names['Plural']} In Request"},
+            status.HTTP_207_MULTI_STATUS: {"description": f"Some {names['Plural']} Created, Rejected Items Listed In errors"},
+            status.HTTP_201_CREATED: {"description": f"{names['Plural']} Created Successfully"}
+        }
+    )
+    @describe
+    async def bulk_create_items(
+        response: Response,
+        items: List[Any] = Body(..., title=names["Plural"], description=f"{names['Plural']} to create, each in the same shape as POST /{plural}"),
+        batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE, description=f"{names['Plural']} per multi-row INSERT statement"),
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Create many {plural} in a single transaction.
+
+        Each item is validated on its own. Valid items are inserted with multi-row
+        INSERT ... RETURNING statements and committed once; invalid items are reported
+        by their index in the request body and skipped.
+
+        Parameters:
+        - **{plural}**: List of {singular} objects (request body)
+        - **batch_size**: Number of {plural} per INSERT statement
+
+        Returns:
+        - **BulkCreateResponse**: The created {plural} with their IDs and any per-item errors
+          (201 when every item was created, 207 when some were rejected)
+
+        Raises:
+        - **400 Bad Request**: If the request is too large or a constraint violation occurs (nothing is created)
+        - **422 Unprocessable Entity**: If no item is valid
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        if len(items) > MAX_BULK_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_BULK_ITEMS} {plural} can be created per request"
+            )
+
+        valid_items, errors = validate_bulk_items(items, create_schema)
+
+        if errors and not valid_items:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=[error.model_dump() for error in errors]
+            )
+
+        try:
+            created = await run_service(db, repository.bulk_add, valid_items, batch_size)
+
+            if errors:
+                response.status_code = status.HTTP_207_MULTI_STATUS
+            return {"created": created, "errors": errors}
+
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{names['Plural']} already exist or constraint violation; nothing was created"
+            )
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    @router.put(
+        id_path,
+        response_model=response_schema,
+        status_code=status.HTTP_200_OK,
+        name=f"update_{singular}_endpoint",
+        summary=f"Update an existing {singular}",
+        response_description=f"The updated {singular}",
+        responses={
+            status.HTTP_404_NOT_FOUND: {"description": f"{names['Singular']} Not Found"},
+            status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+            status.HTTP_200_OK: {"description": f"{names['Singular']} Updated Successfully"}
+        }
+    )
+    @describe
+    async def update_item(
+        item_id: int = Path(..., alias=id_name, title=f"{names['Singular']} ID", description=f"ID of the {singular} to update", gt=0),
+        item: update_schema = None,
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Update an existing {singular} in the database.
+
+        Parameters:
+        - **{singular}_id**: ID of the {singular} to update (path parameter)
+        - **{singular}**: Updated {singular} data (request body)
+
+        Returns:
+        - **{Singular}Response**: The updated {singular}
+
+        Raises:
+        - **404 Not Found**: If the {singular} with the given ID doesn't exist
+        - **400 Bad Request**: If the {singular} data is invalid or a constraint violation occurs
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        if item is None:
+            item = update_schema()
+
+        try:
+            updated = await run_service(db, repository.update, item_id, item)
+
+            if updated is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"{names['Singular']} with ID {item_id} not found"
+                )
+
+            return updated
+
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{names['Singular']} update failed due to constraint violation"
+            )
+
+        except HTTPException:
+            # Let the 404 raised above through instead of turning it into a 500
+            raise
+
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}"
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An unexpected error occurred: {str(e)}"
+            )
+
+    @router.delete(
+        id_path,
+        status_code=status.HTTP_204_NO_CONTENT,
+        name=f"delete_{singular}_endpoint",
+        summary=f"Delete a {singular}",
+        response_description="No content is returned on successful deletion",
+        responses={
+            status.HTTP_404_NOT_FOUND: {"description": f"{names['Singular']} Not Found"},
+            status.HTTP_204_NO_CONTENT: {"description": f"{names['Singular']} Deleted Successfully"}
+        }
+    )
+    @describe
+    async def delete_item(
+        item_id: int = Path(..., alias=id_name, title=f"{names['Singular']} ID", description=f"ID of the {singular} to delete", gt=0),
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Delete a {singular} from the database.
+
+        Parameters:
+        - **{singular}_id**: ID of the {singular} to delete (path parameter)
+
+        Returns:
+        - No content (204) on successful deletion
+
+        Raises:
+        - **404 Not Found**: If the {singular} with the given ID doesn't exist
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        success, error_message = await run_service(db, repository.delete, item_id)
+
+        if not success:
+            if "not found" in error_message:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=error_message
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=error_message
+                )
+
+        # Return 204 No Content for successful deletion
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    @router.delete(
+        "/",
+        response_model=BulkDeleteResponse,
+        status_code=status.HTTP_200_OK,
+        name=f"bulk_delete_{plural}_endpoint",
+        summary=f"Delete many {plural} by ID",
+        response_description="The deleted IDs and the IDs that did not exist",
+        responses={
+            status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+            status.HTTP_200_OK: {"description": f"{names['Plural']} Deleted, Missing IDs Listed"}
+        }
+    )
+    @describe
+    async def bulk_delete_items(
+        ids: List[str] = Query(..., example=["1,2,3"], description="IDs to delete, comma separated or repeated"),
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Delete many {plural} with one set-based DELETE statement.
+
+        Parameters:
+        - **ids**: IDs of the {plural} to delete (query parameter)
+
+        Returns:
+        - **BulkDeleteResponse**: The deleted IDs and the requested IDs that did not exist
+
+        Raises:
+        - **400 Bad Request**: If the IDs are not integers or too many are given
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        return await bulk_delete(db, parse_ids(ids))
+
+    @router.post(
+        "/bulk-delete",
+        response_model=BulkDeleteResponse,
+        status_code=status.HTTP_200_OK,
+        name=f"bulk_delete_{plural}_body_endpoint",
+        summary=f"Delete many {plural} by ID (IDs in the request body)",
+        response_description="The deleted IDs and the IDs that did not exist",
+        responses={
+            status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+            status.HTTP_200_OK: {"description": f"{names['Plural']} Deleted, Missing IDs Listed"}
+        }
+    )
+    @describe
+    async def bulk_delete_items_body(
+        request: BulkDeleteRequest,
+        db: DBSession = Depends(get_session)
+    ):
+        """
+        Delete many {plural} with one set-based DELETE statement.
+        Use this variant for ID lists too long for a query string.
+
+        Parameters:
+        - **ids**: IDs of the {plural} to delete (request body)
+
+        Returns:
+        - **BulkDeleteResponse**: The deleted IDs and the requested IDs that did not exist
+
+        Raises:
+        - **500 Internal Server Error**: If there's an error with the database or server
+        """
+        return await bulk_delete(db, request.ids)
+
+    return router
@@ -0,0 +1,34 @@
+from typing import List
+from fastapi import APIRouter, status
+
+from models.pool import PoolStatsResponse
+from services.db.connect_to_db import engines
+
+# Create router
+router = APIRouter(
+    prefix="/db",
+    tags=["db"],
+    responses={
+        status.HTTP_200_OK: {"description": "Pool Statistics Retrieved Successfully"}
+    }
+)
+
+@router.get(
+    "/pool",
+    response_model=List[PoolStatsResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get connection pool statistics",
+    response_description="State and checkout counters of each database connection pool"
+)
+async def get_pool_stats_endpoint():
+    """
+    Report how the database connection pools of this process are doing.
+    
+    A growing timeouts or slow_checkouts count, or checked_out sitting at
+    size + max_overflow, means requests are queueing for connections.
+    Counters are per worker process and start from zero when the process starts.
+    
+    Returns:
+    - **List[PoolStatsResponse]**: One entry per engine created so far: sync, and async when DB_ASYNC is enabled
+    """
+    return [PoolStatsResponse(engine=name, **pool.snapshot()) for name, pool in engines.pools()]
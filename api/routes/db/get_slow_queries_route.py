@@ -0,0 +1,53 @@
+from typing import List
+from fastapi import APIRouter, HTTPException, Query, status
+
+from models.slow_query import SlowQueryResponse
+from services.db.config import load_config
+from services.db.slow_queries import slow_query_log
+
+# Create router
+router = APIRouter(
+    prefix="/db",
+    tags=["db"],
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Endpoint Not Enabled"},
+        status.HTTP_200_OK: {"description": "Slow Queries Retrieved Successfully"}
+    }
+)
+
+@router.get(
+    "/slow-queries",
+    response_model=List[SlowQueryResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get recent slow queries",
+    response_description="The latest statements slower than DB_SLOW_QUERY_MS, newest first"
+)
+async def get_slow_queries_endpoint(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of slow queries to return")
+):
+    """
+    Show the latest statements of this process that took longer than DB_SLOW_QUERY_MS.
+
+    Each entry names the service function that ran the statement. Parameter values
+    are redacted to their types. A DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE fraction of
+    the slow SELECTs also carries its EXPLAIN (ANALYZE, BUFFERS) plan.
+    The buffer is per worker process and keeps the last DB_SLOW_QUERY_MAX_ENTRIES.
+
+    The endpoint has no access control, so it answers only when
+    DB_SLOW_QUERY_ENDPOINT is enabled.
+
+    Parameters:
+    - **limit**: Maximum number of slow queries to return (query parameter)
+
+    Returns:
+    - **List[SlowQueryResponse]**: Slow statements, newest first
+
+    Raises:
+    - **404 Not Found**: If DB_SLOW_QUERY_ENDPOINT is not enabled
+    """
+    if not load_config()['slow_query_endpoint']:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    return [SlowQueryResponse(**entry.as_dict()) for entry in slow_query_log.recent()[:limit]]
@@ -0,0 +1,55 @@
+from typing import Any, Type
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+JSON_MEDIA_TYPE = "application/json"
+
+def json_response(content: bytes, response: Response) -> Response:
+    """
+    Send an already serialized JSON body.
+
+    FastAPI passes a Response returned by an endpoint through untouched, so the
+    body skips response_model validation, jsonable_encoder and json.dumps. The
+    headers set on the endpoint's Response parameter (ETag, pagination) would be
+    dropped along with them, so they are copied over here, as FastAPI would.
+
+    Args:
+        content: JSON bytes
+        response: The Response parameter of the endpoint
+
+    Returns:
+        Response: The response to return from the endpoint
+    """
+    sent = Response(content, media_type=JSON_MEDIA_TYPE)
+    sent.headers.raw.extend(response.headers.raw)
+    return sent
+
+def items_response(adapter: TypeAdapter, items: Any, response: Response) -> Response:
+    """
+    Serialize list items that already have the response's shape in one pass.
+
+    Args:
+        adapter: TypeAdapter of the list type, built once at import so its serializer is compiled once
+        items: Plain dicts (or other values) matching the adapter's type; they are not validated
+        response: The Response parameter of the endpoint
+
+    Returns:
+        Response: The response to return from the endpoint
+    """
+    return json_response(adapter.dump_json(items), response)
+
+def model_response(schema: Type[BaseModel], obj: Any, response: Response) -> Response:
+    """
+    Validate an ORM object against its response model and serialize it, as
+    response_model does, without the jsonable_encoder pass over the result.
+
+    Args:
+        schema: Pydantic response model
+        obj: SQLAlchemy object read through from_attributes
+        response: The Response parameter of the endpoint
+
+    Returns:
+        Response: The response to return from the endpoint
+    """
+    model = schema.model_validate(obj, from_attributes=True)
+    return json_response(model.__pydantic_serializer__.to_json(model), response)
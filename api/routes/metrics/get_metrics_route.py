@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Response, status
+
+from services.cache.entity_cache import get_cache
+from services.db.connect_to_db import engines
+from services.logs.log_pipeline import log_pipeline_stats
+from services.metrics.request_metrics import request_metrics
+
+# Create router
+router = APIRouter(
+    tags=["metrics"],
+    responses={
+        status.HTTP_200_OK: {"description": "Metrics Retrieved Successfully"}
+    }
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Get Prometheus metrics",
+    response_description="Request, database pool, cache and logging metrics in the Prometheus text format",
+    response_class=Response
+)
+async def get_metrics_endpoint():
+    """
+    Expose the metrics of this worker process for Prometheus to scrape.
+
+    Requests are counted per method, route template and status code, with
+    histograms of their latency and of the time they spent executing database
+    statements. Connection pool, get-by-id cache and log pipeline counters are
+    included too.
+    Values are per worker process and start from zero when the process starts;
+    sum them across workers in the query.
+
+    Returns:
+    - **text/plain**: Prometheus text exposition format, version 0.0.4
+    """
+    lines = request_metrics.render()
+
+    pools = [(name, pool.snapshot()) for name, pool in engines.pools()]
+    for metric, key, kind, description in (
+        ("db_pool_size", "size", "gauge", "Connections kept open in the pool."),
+        ("db_pool_checked_out", "checked_out", "gauge", "Connections currently in use."),
+        ("db_pool_overflow", "overflow", "gauge", "Connections open beyond the pool size."),
+        ("db_pool_checkouts_total", "checkouts", "counter", "Connections handed out."),
+        ("db_pool_timeouts_total", "timeouts", "counter", "Checkouts that gave up after the pool timeout."),
+        ("db_pool_wait_seconds_total", "wait_ms_total", "counter", "Time spent obtaining connections.")
+    ):
+        lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {kind}"]
+        for name, snapshot in pools:
+            value = snapshot[key] / 1000 if key == "wait_ms_total" else snapshot[key]
+            lines.append(f'{metric}{{engine="{name}"}} {value}')
+
+    cache_stats = get_cache().stats()
+    for metric, value, kind, description in (
+        ("cache_hits_total", cache_stats.hits, "counter", "Get-by-id lookups answered from the cache."),
+        ("cache_misses_total", cache_stats.misses, "counter", "Get-by-id lookups that went to the database."),
+        ("cache_evictions_total", cache_stats.evictions, "counter", "Entries dropped to stay within the size bound."),
+        ("cache_entries", cache_stats.size, "gauge", "Entries currently held.")
+    ):
+        lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {kind}", f"{metric} {value}"]
+
+    log_stats = log_pipeline_stats()
+    for metric, value, kind, description in (
+        ("log_records_dropped_total", log_stats["dropped"], "counter", "Log records dropped because the log queue was full."),
+        ("log_records_sampled_out_total", log_stats["sampled_out"], "counter", "Log records left out by LOG_SAMPLE_RATES."),
+        ("log_queue_length", log_stats["queued"], "gauge", "Log records waiting to be written.")
+    ):
+        lines += [f"# HELP {metric} {description}", f"# TYPE {metric} {kind}", f"{metric} {value}"]
+
+    return Response(content="\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from models.subscription import SubscriptionCreate, SubscriptionResponse
 from services.subscriptions.add_subscription_service import add_subscription
-from services.db.connect_to_db import get_db
+from services.db.connect_to_db import get_session, run_service, DBSession
 
 # Create router
 router = APIRouter(
@@ -26,7 +25,7 @@ router = APIRouter(
 )
 async def create_company(
     subscription: SubscriptionCreate,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """
     Create a new subscription in the database.
@@ -42,7 +41,7 @@ async def create_company(
     - **500 Internal Server Error**: If there's an error with the database or server
     """
     try:
-        new_subscription = add_subscription(db, subscription)
+        new_subscription = await run_service(db, add_subscription, subscription)
         return new_subscription
         
     except IntegrityError:
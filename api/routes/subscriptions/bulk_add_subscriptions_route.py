@@ -0,0 +1,100 @@
+from typing import Any, List
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from models.bulk import BulkCreateResponse
+from models.subscription import SubscriptionCreate, SubscriptionResponse
+from services.subscriptions.bulk_add_subscriptions_service import bulk_add_subscriptions
+from services.db.bulk import validate_bulk_items, BULK_BATCH_SIZE, MAX_BULK_BATCH_SIZE, MAX_BULK_ITEMS
+from services.db.connect_to_db import get_session, run_service, DBSession
+
+# Create router
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "No Valid Subscriptions In Request"},
+        status.HTTP_207_MULTI_STATUS: {"description": "Some Subscriptions Created, Rejected Items Listed In errors"},
+        status.HTTP_201_CREATED: {"description": "Subscriptions Created Successfully"}
+    }
+)
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResponse[SubscriptionResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many subscriptions at once",
+    response_description="The created subscriptions and any rejected items"
+)
+async def bulk_create_subscriptions(
+    response: Response,
+    subscriptions: List[Any] = Body(..., description="Subscriptions to create, each in the same shape as POST /subscriptions"),
+    batch_size: int = Query(BULK_BATCH_SIZE, ge=1, le=MAX_BULK_BATCH_SIZE, description="Subscriptions per multi-row INSERT statement"),
+    db: DBSession = Depends(get_session)
+):
+    """
+    Create many subscriptions in a single transaction.
+    
+    Each item is validated on its own. Valid items are inserted with multi-row
+    INSERT ... RETURNING statements and committed once; invalid items are reported
+    by their index in the request body and skipped.
+    
+    Parameters:
+    - **subscriptions**: List of subscription objects (request body)
+    - **batch_size**: Number of subscriptions per INSERT statement
+    
+    Returns:
+    - **BulkCreateResponse**: The created subscriptions with their IDs and any per-item errors
+      (201 when every item was created, 207 when some were rejected)
+    
+    Raises:
+    - **400 Bad Request**: If the request is too large or a constraint violation occurs (nothing is created)
+    - **422 Unprocessable Entity**: If no item is valid
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    if len(subscriptions) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BULK_ITEMS} subscriptions can be created per request"
+        )
+    
+    valid_subscriptions, errors = validate_bulk_items(subscriptions, SubscriptionCreate)
+    
+    if errors and not valid_subscriptions:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[error.model_dump() for error in errors]
+        )
+        
+    try:
+        created = await run_service(db, bulk_add_subscriptions, valid_subscriptions, batch_size)
+        
+        if errors:
+            response.status_code = status.HTTP_207_MULTI_STATUS
+        return {"created": created, "errors": errors}
+        
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscriptions already exist or constraint violation; nothing was created"
+        )
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+        
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
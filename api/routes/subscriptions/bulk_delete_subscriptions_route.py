@@ -0,0 +1,105 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.bulk import BulkDeleteRequest, BulkDeleteResponse
+from services.subscriptions.bulk_delete_subscriptions_service import bulk_delete_subscriptions
+from services.db.bulk import MAX_BULK_ITEMS
+from services.db.connect_to_db import get_session, run_service, DBSession
+
+# Create router
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Bad Request"},
+        status.HTTP_200_OK: {"description": "Subscriptions Deleted, Missing IDs Listed"}
+    }
+)
+
+def _parse_ids(values: List[str]) -> List[int]:
+    """Accept both ?ids=1,2,3 and ?ids=1&ids=2&ids=3."""
+    try:
+        ids = [int(value) for item in values for value in item.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma separated list of integers"
+        )
+    if not ids or len(ids) > MAX_BULK_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Between 1 and {MAX_BULK_ITEMS} ids must be given"
+        )
+    return ids
+
+async def _delete(db: DBSession, ids: List[int]) -> BulkDeleteResponse:
+    """Run the bulk delete service and map database errors to HTTP errors."""
+    try:
+        deleted, missing = await run_service(db, bulk_delete_subscriptions, ids)
+        return BulkDeleteResponse(deleted=deleted, missing=missing)
+        
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.delete(
+    "/",
+    response_model=BulkDeleteResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete many subscriptions by ID",
+    response_description="The deleted IDs and the IDs that did not exist"
+)
+async def bulk_delete_subscriptions_endpoint(
+    ids: List[str] = Query(..., example=["1,2,3"], description="IDs to delete, comma separated or repeated"),
+    db: DBSession = Depends(get_session)
+):
+    """
+    Delete many subscriptions with one set-based DELETE statement.
+    
+    Parameters:
+    - **ids**: IDs of the subscriptions to delete (query parameter)
+    
+    Returns:
+    - **BulkDeleteResponse**: The deleted IDs and the requested IDs that did not exist
+    
+    Raises:
+    - **400 Bad Request**: If the IDs are not integers or too many are given
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    return await _delete(db, _parse_ids(ids))
+
+@router.post(
+    "/bulk-delete",
+    response_model=BulkDeleteResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete many subscriptions by ID (IDs in the request body)",
+    response_description="The deleted IDs and the IDs that did not exist"
+)
+async def bulk_delete_subscriptions_body_endpoint(
+    request: BulkDeleteRequest,
+    db: DBSession = Depends(get_session)
+):
+    """
+    Delete many subscriptions with one set-based DELETE statement.
+    Use this variant for ID lists too long for a query string.
+    
+    Parameters:
+    - **ids**: IDs of the subscriptions to delete (request body)
+    
+    Returns:
+    - **BulkDeleteResponse**: The deleted IDs and the requested IDs that did not exist
+    
+    Raises:
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    return await _delete(db, request.ids)
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Path, Response
-from sqlalchemy.orm import Session
 
 from services.subscriptions.delete_subscription_service import delete_subscription
-from services.db.connect_to_db import get_db
+from services.db.connect_to_db import get_session, run_service, DBSession
 
 # Create router
 router = APIRouter(
@@ -23,7 +22,7 @@ router = APIRouter(
 )
 async def delete_subscription_endpoint(
     subscription_id: int = Path(..., title="Subscription ID", description="ID of the subscription to delete", gt=0),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """
     Delete a subscription from the database.
@@ -38,7 +37,7 @@ async def delete_subscription_endpoint(
     - **404 Not Found**: If the subscription with the given ID doesn't exist
     - **500 Internal Server Error**: If there's an error with the database or server
     """
-    success, error_message = delete_subscription(db, subscription_id)
+    success, error_message = await run_service(db, delete_subscription, subscription_id)
     
     if not success:
         if "not found" in error_message:
@@ -0,0 +1,124 @@
+import json
+import logging
+from enum import Enum
+from typing import AsyncIterator, Iterator, Sequence
+from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Row
+
+from services.subscriptions.export_subscriptions_service import (
+    stream_subscriptions, stream_subscriptions_async, EXPORT_BATCH_SIZE
+)
+from services.db.connect_to_db import engines
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+        status.HTTP_200_OK: {"description": "Subscriptions Streamed Successfully"}
+    }
+)
+
+class ExportFormat(str, Enum):
+    """Output formats supported by the export endpoint"""
+    ndjson = "ndjson"
+    json = "json"
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.json: "application/json"
+}
+
+def _serialize_batch(batch: Sequence[Row]) -> list:
+    """Serialize rows with the same keys as GET /subscriptions, price as an exact string."""
+    return [
+        json.dumps({
+            "id": row.subscriptionID,
+            "name": row.companyName,
+            "price": str(row.price),
+            "category": row.subscriptionCategory,
+            "description": row.description,
+            "account_holder": row.userName,
+            "account_email": row.emailAssociated
+        }, separators=(",", ":"))
+        for row in batch
+    ]
+
+def _frame(lines: list, export_format: ExportFormat, first: bool) -> str:
+    """Join one serialized batch into a chunk of the chosen output format."""
+    if export_format == ExportFormat.ndjson:
+        return "".join(line + "\n" for line in lines)
+    chunk = ",".join(lines)
+    return chunk if first else "," + chunk
+
+def _export_chunks(export_format: ExportFormat, batch_size: int) -> Iterator[str]:
+    """
+    Produce the export body with a sync session owned by the stream.
+    StreamingResponse iterates this in the threadpool, one batch per step.
+    """
+    first = True
+    if export_format == ExportFormat.json:
+        yield "["
+    try:
+        with engines.session() as db:
+            for batch in stream_subscriptions(db, batch_size):
+                yield _frame(_serialize_batch(batch), export_format, first)
+                first = False
+    except Exception as e:
+        # Headers are already sent, so the stream is cut short instead of returning a 500
+        logger.error("Subscription export aborted: %s", e)
+        raise
+    if export_format == ExportFormat.json:
+        yield "]"
+
+async def _export_chunks_async(export_format: ExportFormat, batch_size: int) -> AsyncIterator[str]:
+    """Async variant of _export_chunks using an AsyncSession owned by the stream."""
+    first = True
+    if export_format == ExportFormat.json:
+        yield "["
+    try:
+        async with engines.async_session() as db:
+            async for batch in stream_subscriptions_async(db, batch_size):
+                yield _frame(_serialize_batch(batch), export_format, first)
+                first = False
+    except Exception as e:
+        # Headers are already sent, so the stream is cut short instead of returning a 500
+        logger.error("Subscription export aborted: %s", e)
+        raise
+    if export_format == ExportFormat.json:
+        yield "]"
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export all subscriptions as a stream",
+    response_description="Every subscription as NDJSON or a streamed JSON array",
+    response_class=StreamingResponse
+)
+async def export_subscriptions_endpoint(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="ndjson (one object per line) or json (a single array)"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000, description="Rows fetched from the database cursor per batch")
+):
+    """
+    Stream every subscription in the database.
+
+    Rows are read through a server-side cursor and written out batch by batch,
+    so memory use stays constant regardless of the number of subscriptions.
+
+    Parameters:
+    - **format**: `ndjson` (default) or `json`
+    - **batch_size**: Rows fetched from the database per batch
+
+    Returns:
+    - A streamed response with the same fields as `GET /subscriptions`
+    """
+    if engines.async_enabled:
+        chunks = _export_chunks_async(format, batch_size)
+    else:
+        chunks = _export_chunks(format, batch_size)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format])
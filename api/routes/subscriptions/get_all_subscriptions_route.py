@@ -1,10 +1,17 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.exc import SQLAlchemyError
 
-from services.subscriptions.get_all_subscriptions_service import get_all_subscriptions
-from services.db.connect_to_db import get_db  # Adjust import path based on your project structure
+from models.subscription import Subscription, SubscriptionFilter, SubscriptionListItem
+from models.company import CompanyResponse
+from models.category import CategoryResponse
+from models.user import UserResponse
+from services.subscriptions.get_all_subscriptions_service import get_all_subscriptions, parse_expand
+from services.db.connect_to_db import get_session, run_service, DBSession
+from services.db.change_versions import table_etag, etag_matches, set_etag_headers, not_modified
+from services.db.pagination import set_pagination_headers, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from routes.json_response import items_response
 
 # Create router for company endpoints
 router = APIRouter(
@@ -13,29 +20,80 @@ router = APIRouter(
     responses={500: {"description": "Internal Server Error"}}
 )
 
-@router.get("/", response_model=List[dict])
-async def read_subscriptions(db: Session = Depends(get_db)):
+# Response model of each relationship that can be expanded
+EXPANDED_MODELS = {
+    "company": CompanyResponse,
+    "category": CategoryResponse,
+    "user": UserResponse
+}
+
+# Serializes a page of list items straight to JSON bytes
+_page_adapter = TypeAdapter(List[SubscriptionListItem])
+
+def _subscription_to_dict(subscription: Subscription, expanded: List[str]) -> SubscriptionListItem:
+    """Convert a subscription, and any relationships loaded for it, to the list's JSON shape."""
+    item = {
+        "id": subscription.subscriptionID,
+        "name": subscription.companyName,
+        "price": subscription.price,
+        "category": subscription.subscriptionCategory,
+        "description": subscription.description,
+        "account_holder": subscription.userName,
+        "account_email": subscription.emailAssociated
+    }
+    if expanded:
+        related = {}
+        for name in expanded:
+            entity = getattr(subscription, name)
+            related[name] = None if entity is None else EXPANDED_MODELS[name].model_validate(entity, from_attributes=True).model_dump(mode="json")
+        item["related"] = related
+    return item
+
+@router.get("/", response_model=List[SubscriptionListItem])
+async def read_subscriptions(
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of subscriptions to return"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sort: Optional[str] = Query(None, example="price,-companyName", description="Comma separated columns to sort by, prefix with - for descending"),
+    filters: SubscriptionFilter = Depends(),
+    expand: Optional[str] = Query(None, example="company,user", description="Comma separated related entities to include: company, category, user"),
+    db: DBSession = Depends(get_session)
+):
     """
-    Get all subscriptions from the database.
+    Get one page of subscriptions from the database.
+    
+    Filters (companyName, subscriptionCategory, userName, emailAssociated,
+    minPrice, maxPrice) and the sort order are applied in the database.
+    When more subscriptions follow, the cursor for the next page is returned in the
+    X-Next-Cursor header (and as a Link header) and can be passed back as `after`.
+    Responses carry an ETag; sending it back in If-None-Match gets a 304 until
+    the table is written to.
+    `expand` adds the matching company, category and user records under a
+    `related` key, at the cost of one extra query per relationship for the whole page.
     
     Returns:
         List of subscriptions
     """
     try:
-        subscriptions = get_all_subscriptions(db)
-        # Convert SQLAlchemy models to dictionaries for JSON response
-        return [
-            {
-                "id": subscription.subscriptionID,
-                "name": subscription.companyName,
-                "price": subscription.price,
-                "category": subscription.subscriptionCategory,
-                "description": subscription.description,
-                "account_holder": subscription.userName,
-                "account_email": subscription.emailAssociated
-            } 
-            for subscription in subscriptions
-        ]
+        expanded = parse_expand(expand)
+        related_tables = [getattr(Subscription, name).property.mapper.local_table.name for name in expanded]
+        
+        # Answer unchanged polls before running the query or serializing anything
+        etag = await run_service(db, table_etag, Subscription.__tablename__, *related_tables)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag_headers(response, etag)
+        
+        page = await run_service(db, get_all_subscriptions, limit, after, filters, sort, expanded)
+        set_pagination_headers(request, response, page)
+        # Convert SQLAlchemy models to dictionaries and serialize them in one pass
+        return items_response(_page_adapter, [_subscription_to_dict(subscription, expanded) for subscription in page.items], response)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=500,
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request, Response
 from sqlalchemy.exc import SQLAlchemyError
 
 from models.subscription import SubscriptionResponse
 from services.subscriptions.get_subscription_by_id_service import get_subscription_by_id
-from services.db.connect_to_db import get_db
+from services.db.connect_to_db import get_session, run_service, DBSession
+from services.db.change_versions import content_etag, etag_matches, set_etag_headers, not_modified
+from routes.json_response import model_response
 
 # Create router
 router = APIRouter(
@@ -25,8 +26,10 @@ router = APIRouter(
     response_description="The requested subscription"
 )
 async def get_company_endpoint(
+    request: Request,
+    response: Response,
     subscription_id: int = Path(..., title="Subscription ID", description="ID of the subscription to retrieve", gt=0),
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """
     Retrieve a single subscription by its ID.
@@ -36,13 +39,14 @@ async def get_company_endpoint(
     
     Returns:
     - **SubscriptionResponse**: The requested subscription
+    - **304 Not Modified**: If If-None-Match holds the ETag of the subscription as it would be sent
     
     Raises:
     - **404 Not Found**: If the subscription with the given ID doesn't exist
     - **500 Internal Server Error**: If there's an error with the database or server
     """
     try:
-        subscription = get_subscription_by_id(db, subscription_id)
+        subscription = await run_service(db, get_subscription_by_id, subscription_id)
         
         if subscription is None:
             raise HTTPException(
@@ -50,7 +54,17 @@ async def get_company_endpoint(
                 detail=f"Subscription with ID {subscription_id} not found"
             )
             
-        return subscription
+        # The row may come from the entity cache, so the ETag is taken from the body itself
+        sent = model_response(SubscriptionResponse, subscription, response)
+        etag = content_etag(sent.body)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag_headers(sent, etag)
+        return sent
+        
+    except HTTPException:
+        # Let the 404 raised above through instead of turning it into a 500
+        raise
         
     except ValueError as e:
         raise HTTPException(
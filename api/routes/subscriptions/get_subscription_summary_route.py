@@ -0,0 +1,133 @@
+from enum import Enum
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription, SubscriptionFilter, SubscriptionSummary, SubscriptionGroupSummary
+from services.subscriptions.summarize_subscriptions_service import summarize_subscriptions, summarize_subscriptions_by
+from services.db.connect_to_db import get_session, run_service, DBSession
+from services.db.change_versions import table_etag, etag_matches, set_etag_headers, not_modified
+
+# Create router
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+        status.HTTP_200_OK: {"description": "Subscription Spend Summarized Successfully"}
+    }
+)
+
+class SummaryGrouping(str, Enum):
+    """Groupings supported by the grouped summary endpoint"""
+    category = "by-category"
+    user = "by-user"
+    company = "by-company"
+
+@router.get(
+    "/summary",
+    response_model=SubscriptionSummary,
+    status_code=status.HTTP_200_OK,
+    summary="Summarize spend over all subscriptions",
+    response_description="Count, total, average, minimum and maximum monthly price"
+)
+async def get_subscription_summary_endpoint(
+    request: Request,
+    response: Response,
+    filters: SubscriptionFilter = Depends(),
+    live: bool = Query(False, description="Aggregate the subscriptions table instead of reading the rollups"),
+    db: DBSession = Depends(get_session)
+):
+    """
+    Summarize monthly spend, computed in the database with exact decimal arithmetic.
+
+    Unfiltered summaries are read from rollups kept current by every write.
+    Accepts the same filters as `GET /subscriptions`; filtered summaries, or
+    `live=true`, aggregate the subscriptions table directly.
+
+    Returns:
+    - **SubscriptionSummary**: count, total, average, minimum and maximum price
+    - **304 Not Modified**: If If-None-Match holds the current ETag of the table
+
+    Raises:
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    try:
+        etag = await run_service(db, table_etag, Subscription.__tablename__)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag_headers(response, etag)
+
+        return await run_service(db, summarize_subscriptions, filters, live)
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.get(
+    "/summary/{grouping}",
+    response_model=List[SubscriptionGroupSummary],
+    status_code=status.HTTP_200_OK,
+    summary="Summarize spend per category, user or company",
+    response_description="One summary per group, highest total first"
+)
+async def get_grouped_subscription_summary_endpoint(
+    request: Request,
+    response: Response,
+    grouping: SummaryGrouping,
+    filters: SubscriptionFilter = Depends(),
+    live: bool = Query(False, description="Aggregate the subscriptions table instead of reading the rollups"),
+    db: DBSession = Depends(get_session)
+):
+    """
+    Summarize monthly spend per category, user or company.
+
+    The response holds one entry per distinct category, user or company, so its
+    size does not grow with the number of subscriptions. Subscriptions without a
+    value for the grouping column are collected under a `null` key.
+    Unfiltered groups are read from the rollups; filters or `live=true` switch
+    to a GROUP BY over the subscriptions table.
+
+    Parameters:
+    - **grouping**: `by-category`, `by-user` or `by-company` (path parameter)
+
+    Returns:
+    - **List[SubscriptionGroupSummary]**: Group key with count, total, average, minimum and maximum price
+    - **304 Not Modified**: If If-None-Match holds the current ETag of the table
+
+    Raises:
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    try:
+        etag = await run_service(db, table_etag, Subscription.__tablename__)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag_headers(response, etag)
+
+        return await run_service(db, summarize_subscriptions_by, grouping.name, filters, live)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
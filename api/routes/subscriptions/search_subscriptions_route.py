@@ -0,0 +1,88 @@
+from enum import Enum
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription, SubscriptionListItem
+from services.subscriptions.search_subscriptions_service import search_subscriptions
+from services.db.connect_to_db import get_session, run_service, DBSession
+from services.db.change_versions import table_etag, etag_matches, set_etag_headers, not_modified
+from services.db.pagination import set_pagination_headers, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from routes.json_response import items_response
+from routes.subscriptions.get_all_subscriptions_route import _page_adapter, _subscription_to_dict
+
+# Create router
+router = APIRouter(
+    prefix="/subscriptions",
+    tags=["subscriptions"],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+        status.HTTP_200_OK: {"description": "Subscriptions Searched Successfully"}
+    }
+)
+
+class SearchMatch(str, Enum):
+    """Which words of the search a subscription must contain"""
+    any = "any"
+    all = "all"
+
+@router.get(
+    "/search",
+    response_model=List[SubscriptionListItem],
+    status_code=status.HTTP_200_OK,
+    summary="Search subscriptions by company, category and description",
+    response_description="One page of matching subscriptions, best match first"
+)
+async def search_subscriptions_endpoint(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, example="that streaming thing", description="Words to search for"),
+    match: SearchMatch = Query(SearchMatch.any, description="any: subscriptions with any of the words, those with more ranked first; all: only those with every word"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of subscriptions to return"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: DBSession = Depends(get_session)
+):
+    """
+    Full-text search over the company name, category and description of
+    every subscription, ranked by relevance.
+
+    Words are matched on their stem ("streams" finds "streaming"), and a match
+    in the company name ranks above one in the category or description. Results
+    are paginated like `GET /subscriptions`: the cursor for the next page is in
+    the X-Next-Cursor and Link headers and can be passed back as `after`.
+
+    Returns:
+    - **List[SubscriptionListItem]**: Matching subscriptions, in the list's shape
+    - **304 Not Modified**: If If-None-Match holds the current ETag of the table
+
+    Raises:
+    - **400 Bad Request**: If the search has no words or too many, or the cursor is invalid
+    - **500 Internal Server Error**: If there's an error with the database or server
+    """
+    try:
+        etag = await run_service(db, table_etag, Subscription.__tablename__)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag_headers(response, etag)
+
+        page = await run_service(db, search_subscriptions, q, limit, after, match == SearchMatch.all)
+        set_pagination_headers(request, response, page)
+        return items_response(_page_adapter, [_subscription_to_dict(subscription, []) for subscription in page.items], response)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database error: {str(e)}"
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Path
-from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from models.subscription import SubscriptionUpdate, SubscriptionResponse
 from services.subscriptions.update_subscription_service import update_subscription
-from services.db.connect_to_db import get_db
+from services.db.connect_to_db import get_session, run_service, DBSession
 
 # Create router
 router = APIRouter(
@@ -28,7 +27,7 @@ router = APIRouter(
 async def update_subscription_endpoint(
     subscription_id: int = Path(..., title="Subscription ID", description="ID of the subsciption to update", gt=0),
     subsciption: SubscriptionUpdate = None,
-    db: Session = Depends(get_db)
+    db: DBSession = Depends(get_session)
 ):
     """
     Update an existing subsciption in the database.
@@ -49,7 +48,7 @@ async def update_subscription_endpoint(
         subsciption = SubscriptionUpdate()
         
     try:
-        updated_subsciption = update_subscription(db, subscription_id, subsciption)
+        updated_subsciption = await run_service(db, update_subscription, subscription_id, subsciption)
         
         if updated_subsciption is None:
             raise HTTPException(
@@ -65,6 +64,10 @@ async def update_subscription_endpoint(
             detail="Subscription update failed due to constraint violation"
         )
         
+    except HTTPException:
+        # Let the 404 raised above through instead of turning it into a 500
+        raise
+        
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
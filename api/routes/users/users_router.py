@@ -0,0 +1,12 @@
+from models.user import UserCreate, UserUpdate, UserResponse
+from routes.crud_router import create_crud_router
+from services.users.user_repository import user_repository
+
+# List, get, create, bulk create, update, delete and bulk delete endpoints for users
+router = create_crud_router(
+    user_repository,
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    list_fields={"id": "userID", "name": "userName"}
+)
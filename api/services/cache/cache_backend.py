@@ -0,0 +1,159 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Hashable, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing how a cache has been used since it was created or cleared.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that found nothing, or only an expired entry
+        evictions: Entries dropped to stay within the size bound
+        expirations: Entries dropped because their TTL had passed
+        invalidations: Entries removed explicitly after a write
+        size: Entries currently held
+        max_entries: Size bound of the cache, 0 when unbounded or disabled
+        ttl_seconds: Lifetime of an entry, 0 when entries never expire
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_entries: int = 0
+    ttl_seconds: float = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dictionary."""
+        return asdict(self)
+
+class CacheBackend:
+    """
+    Interface every cache backend implements.
+
+    Values are opaque to the backend; callers store immutable snapshots so a
+    cached value can be handed to several requests at once.
+    """
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored under key, or None if there is none."""
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, replacing any previous value."""
+        raise NotImplementedError
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key if it is present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        raise NotImplementedError
+
+    def stats(self) -> CacheStats:
+        """Return a copy of the usage counters."""
+        raise NotImplementedError
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing, used when caching is disabled."""
+
+    def __init__(self):
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        self._stats.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        pass
+
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(**self._stats.as_dict())
+
+class TTLLRUCache(CacheBackend):
+    """
+    In-process cache bounded by entry count, evicting the least recently used
+    entry first, with a fixed time to live per entry.
+
+    All operations are O(1) and guarded by a lock, since services run in the
+    threadpool as well as on the event loop.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0):
+        """
+        Args:
+            max_entries: Maximum number of entries held at once
+            ttl_seconds: Seconds an entry stays valid; 0 disables expiry
+
+        Raises:
+            ValueError: If max_entries is not positive or ttl_seconds is negative
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds cannot be negative")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, value), least recently used first
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if self.ttl_seconds and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            stats = CacheStats(**self._stats.as_dict())
+            stats.size = len(self._entries)
+        stats.max_entries = self.max_entries
+        stats.ttl_seconds = self.ttl_seconds
+        return stats
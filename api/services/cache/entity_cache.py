@@ -0,0 +1,122 @@
+import logging
+import threading
+from typing import Any, Dict, Hashable, Optional, Type, TypeVar
+from sqlalchemy import inspect
+
+from services.db.config import load_config
+from .cache_backend import CacheBackend, NullCache, TTLLRUCache
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M")
+
+def create_cache(config: Dict[str, Any]) -> CacheBackend:
+    """
+    Build the cache backend selected in the configuration.
+
+    Args:
+        config: Configuration from load_config
+
+    Returns:
+        CacheBackend: TTLLRUCache for "memory", NullCache for "none"
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = config['cache_backend']
+    if backend == "memory":
+        return TTLLRUCache(max_entries=config['cache_max_entries'], ttl_seconds=config['cache_ttl_seconds'])
+    if backend == "none":
+        return NullCache()
+    raise ValueError(f"Unknown CACHE_BACKEND '{backend}', expected 'memory' or 'none'")
+
+# Created on first use, so importing this module reads no configuration
+_cache: Optional[CacheBackend] = None
+
+def get_cache() -> CacheBackend:
+    """Return the cache backend in use, creating the configured one on first use."""
+    global _cache
+    if _cache is None:
+        _cache = create_cache(load_config())
+    return _cache
+
+def set_cache(backend: CacheBackend) -> None:
+    """
+    Replace the cache backend, e.g. with one shared between processes.
+
+    The in-process default only sees writes made by this process, so with several
+    workers another worker's update becomes visible once the entry's TTL runs out.
+    """
+    global _cache
+    _cache = backend
+    logger.info("Entity cache backend set to %s", type(backend).__name__)
+
+def _key(model: Type[M], entity_id: Hashable) -> tuple:
+    return (model.__tablename__, entity_id)
+
+# Generation of each cache key, bumped whenever its entity is written or invalidated,
+# so a read that started before a write cannot cache what it loaded after the write
+# invalidated it. Keys share a fixed number of slots: a collision only skips a cache write
+GENERATION_SLOTS = 4096
+_generations = [0] * GENERATION_SLOTS
+_generation_lock = threading.Lock()
+
+def _slot(key: tuple) -> int:
+    return hash(key) % GENERATION_SLOTS
+
+def read_generation(model: Type[M], entity_id: Hashable) -> int:
+    """
+    Current generation of an entity's cache entry. Take it before reading the
+    entity from the database and pass it to cache_entity with the row read.
+    """
+    return _generations[_slot(_key(model, entity_id))]
+
+def get_cached(model: Type[M], entity_id: Hashable) -> Optional[M]:
+    """
+    Look an entity up in the cache.
+
+    Args:
+        model: ORM class of the entity
+        entity_id: Primary key of the entity
+
+    Returns:
+        A new, detached instance built from the cached column values, or None on a miss
+    """
+    snapshot = get_cache().get(_key(model, entity_id))
+    if snapshot is None:
+        return None
+    return model(**dict(snapshot))
+
+def cache_entity(instance: Any, generation: Optional[int] = None) -> None:
+    """
+    Store the column values of a loaded entity in the cache.
+    Call only with committed data, so a rolled back write is never cached.
+
+    Args:
+        instance: Loaded entity
+        generation: When caching a read, the read_generation taken before it; the
+            entity is then left out if it was written or invalidated since. Writers
+            caching what they committed leave it out, which supersedes older reads.
+    """
+    mapper = inspect(instance).mapper
+    snapshot = tuple((attr.key, getattr(instance, attr.key)) for attr in mapper.column_attrs)
+    entity_id = mapper.primary_key_from_instance(instance)[0]
+    key = _key(mapper.class_, entity_id)
+    slot = _slot(key)
+    with _generation_lock:
+        if generation is None:
+            _generations[slot] += 1
+        elif _generations[slot] != generation:
+            logger.debug("Not caching %s %s: written while it was being read", key[0], entity_id)
+            return
+        get_cache().set(key, snapshot)
+
+def invalidate(model: Type[M], *entity_ids: Hashable) -> None:
+    """Drop cached entries for entities that were changed or deleted."""
+    cache = get_cache()
+    with _generation_lock:
+        for entity_id in entity_ids:
+            key = _key(model, entity_id)
+            _generations[_slot(key)] += 1
+            cache.delete(key)
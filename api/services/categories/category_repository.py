@@ -0,0 +1,10 @@
+from models.category import Category
+from services.db.repository import Repository
+from services.subscriptions.link_subscriptions_service import subscription_relinker
+
+# Create, read, update and delete for the categories table
+category_repository = Repository(
+    Category, Category.categoryID, Category.categoryName, "category", "categories",
+    # Subscriptions refer to category rows by subscriptionCategory, so keep their foreign keys in step
+    on_names_written=subscription_relinker("subscriptionCategory")
+)
@@ -0,0 +1,10 @@
+from models.company import Company
+from services.db.repository import Repository
+from services.subscriptions.link_subscriptions_service import subscription_relinker
+
+# Create, read, update and delete for the companies table
+company_repository = Repository(
+    Company, Company.companyId, Company.companyName, "company", "companies",
+    # Subscriptions refer to company rows by companyName, so keep their foreign keys in step
+    on_names_written=subscription_relinker("companyName")
+)
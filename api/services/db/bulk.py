@@ -0,0 +1,103 @@
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Integer, any_, bindparam, delete, insert
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from models.bulk import BulkItemError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = 500
+MAX_BULK_BATCH_SIZE = 5000
+MAX_BULK_ITEMS = 10000
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+ModelT = TypeVar("ModelT")
+
+def validate_bulk_items(items: Sequence[Any], schema: Type[SchemaT]) -> Tuple[List[SchemaT], List[BulkItemError]]:
+    """
+    Validate each item of a bulk request on its own, so one bad item does not reject the rest.
+    
+    Args:
+        items: Raw items from the request body
+        schema: Pydantic model each item must satisfy
+        
+    Returns:
+        tuple: (valid_items, errors)
+            - valid_items: Validated models in request order
+            - errors: One BulkItemError per rejected item, carrying its index
+    """
+    valid_items = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            valid_items.append(schema.model_validate(item))
+        except ValidationError as e:
+            errors.append(BulkItemError(index=index, errors=e.errors(include_url=False, include_context=False)))
+    return valid_items, errors
+
+def insert_many(
+    db: Session,
+    model: Type[ModelT],
+    rows: List[Dict[str, Any]],
+    batch_size: int = BULK_BATCH_SIZE,
+    values: Optional[Dict[str, Any]] = None
+) -> List[ModelT]:
+    """
+    Insert rows with multi-row INSERT ... RETURNING statements inside the session's transaction.
+    
+    Rows are sent batch_size at a time, so N rows cost about N / batch_size round trips
+    instead of the add/flush/refresh cycle per row. The caller commits.
+    
+    Args:
+        db: SQLAlchemy database session
+        model: SQLAlchemy model to insert into
+        rows: Column values for each new row
+        batch_size: Number of rows per INSERT statement
+        values: SQL expressions added to every row, which may use extra bind
+            parameters supplied in rows
+        
+    Returns:
+        The inserted objects, in the same order as rows
+    """
+    if not rows:
+        return []
+    statement = insert(model).values(**(values or {})).returning(model, sort_by_parameter_order=True)
+    return list(db.scalars(statement, rows, execution_options={"insertmanyvalues_page_size": batch_size}))
+
+def delete_many(
+    db: Session,
+    model: Type[ModelT],
+    id_column: InstrumentedAttribute,
+    ids: Sequence[int],
+    *returning: InstrumentedAttribute
+) -> List[Any]:
+    """
+    Delete rows by ID with one set-based DELETE ... RETURNING statement.
+    
+    On PostgreSQL the IDs are bound as a single array (id = ANY(:ids)), so the statement
+    text and its plan are the same for any number of IDs. The caller commits.
+    
+    Args:
+        db: SQLAlchemy database session
+        model: SQLAlchemy model to delete from
+        id_column: Integer primary key column of the model
+        ids: IDs to delete
+        returning: Further columns to read back from the deleted rows
+        
+    Returns:
+        The IDs that existed and were deleted, or with returning columns,
+        rows of (id, *returning) for them
+    """
+    if not ids:
+        return []
+    if db.get_bind().dialect.name == "postgresql":
+        condition = id_column == any_(bindparam("ids", list(ids), type_=ARRAY(Integer)))
+    else:
+        condition = id_column.in_(list(ids))
+    statement = delete(model).where(condition).returning(id_column, *returning)
+    result = db.execute(statement, execution_options={"synchronize_session": False})
+    return list(result.all() if returning else result.scalars())
@@ -0,0 +1,113 @@
+import hashlib
+import logging
+from sqlalchemy import select, update, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
+
+from models.table_version import TableVersion
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def bump_table_version(db: Session, table_name: str) -> None:
+    """
+    Record a write to a table by incrementing its version.
+
+    Call inside the writing transaction, before commit, so the new version
+    becomes visible together with the data it describes. If init_db has not
+    seeded the row yet it is created here.
+
+    Args:
+        db: SQLAlchemy database session holding the write
+        table_name: Name of the table that was written to
+    """
+    statement = (
+        update(TableVersion)
+        .where(TableVersion.table_name == table_name)
+        .values(version=TableVersion.version + 1)
+    )
+    if db.execute(statement, execution_options={"synchronize_session": False}).rowcount:
+        return
+
+    try:
+        # Savepoint, so losing a race with another writer doesn't abort the caller's transaction
+        with db.begin_nested():
+            db.execute(insert(TableVersion).values(table_name=table_name, version=1))
+        logger.info("Started change tracking for table %s", table_name)
+    except IntegrityError:
+        db.execute(statement, execution_options={"synchronize_session": False})
+
+def get_table_version(db: Session, table_name: str) -> int:
+    """
+    Read the current version of a table; 0 if it was never written to.
+
+    Args:
+        db: SQLAlchemy database session
+        table_name: Name of the table
+
+    Returns:
+        int: The table's version
+    """
+    version = db.scalar(select(TableVersion.version).where(TableVersion.table_name == table_name))
+    return version or 0
+
+def table_etag(db: Session, table_name: str, *more_table_names: str) -> str:
+    """
+    Build a weak ETag for any representation read from one or more tables.
+
+    Read it before the data itself: a write committed in between then only
+    causes one extra full response, never a stale 304.
+
+    Args:
+        db: SQLAlchemy database session
+        table_name: Name of the table the response is read from
+        more_table_names: Further tables the response includes data from
+
+    Returns:
+        str: ETag header value
+    """
+    if not more_table_names:
+        return f'W/"{table_name}-{get_table_version(db, table_name)}"'
+    names = [table_name, *more_table_names]
+    versions = dict(db.execute(select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(names))).all())
+    return 'W/"' + ".".join(f"{name}-{versions.get(name) or 0}" for name in names) + '"'
+
+def content_etag(body: bytes) -> str:
+    """
+    Build a weak ETag from the bytes of a response body.
+
+    For responses that may be served from the entity cache: a table version
+    read from the database can be newer than a cached row, and would then label
+    the stale row with the current version. Hashing what is actually sent keeps
+    the ETag true to the body and costs no statement.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        str: ETag header value
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header names the given ETag, using weak comparison."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == bare for candidate in header.split(","))
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """Attach the ETag, and ask clients to revalidate on every use instead of reusing blindly."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 response for a request whose cached copy is still current."""
+    response = Response(status_code=304)
+    set_etag_headers(response, etag)
+    return response
@@ -1,12 +1,74 @@
 from dotenv import load_dotenv
 import os
+from typing import Dict
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse "logger=rate,logger=rate" into {logger: rate}, e.g. "uvicorn.access=0.01,services=0.1"."""
+    rates = {}
+    for item in value.split(','):
+        name, _, rate = item.partition('=')
+        if name.strip() and rate.strip():
+            rates[name.strip()] = float(rate)
+    return rates
 
 def load_config():
     load_dotenv()
+    # "postgresql", or "sqlite" to run on the file at sqlite_path without a database server
+    backend = os.getenv('DB_BACKEND', 'postgresql').lower()
+    sqlite = backend == 'sqlite'
     return {
+        'backend': backend,
         'host': os.getenv('DB_HOST'),
         'database': os.getenv('DB_NAME'),
         'user': os.getenv('DB_USER'),
         'password': os.getenv('DB_PASSWORD'),
-        'port': os.getenv('DB_PORT')
-    }
\ No newline at end of file
+        'port': os.getenv('DB_PORT'),
+        'sqlite_path': os.getenv('DB_SQLITE_PATH', 'subscriptions.db'),
+        'sqlite_busy_timeout_ms': int(os.getenv('DB_SQLITE_BUSY_TIMEOUT_MS', '5000')),
+        'sqlite_cache_size_kib': int(os.getenv('DB_SQLITE_CACHE_SIZE_KIB', '65536')),
+        'sqlite_mmap_size_mb': int(os.getenv('DB_SQLITE_MMAP_SIZE_MB', '256')),
+        # Use the async engine (asyncpg, or aiosqlite) and AsyncSession for request handling
+        'async_enabled': os.getenv('DB_ASYNC', 'false').lower() in ('1', 'true', 'yes'),
+        # Connection pool, applied to both the sync and the async engine (per worker process).
+        # SQLite connections are cheap, so by default each of the 40 threadpool threads gets its
+        # own and none waits for another's while the single writer holds the database
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '40' if sqlite else '10')),
+        'pool_max_overflow': int(os.getenv('DB_POOL_MAX_OVERFLOW', '0' if sqlite else '20')),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'false' if sqlite else 'true').lower() in ('1', 'true', 'yes'),
+        'pool_use_lifo': os.getenv('DB_POOL_USE_LIFO', 'true').lower() in ('1', 'true', 'yes'),
+        # Connections opened in the background at startup, so the first requests don't wait on connecting
+        'pool_min_connections': int(os.getenv('DB_POOL_MIN_CONNECTIONS', '2')),
+        # Checkouts slower than this are logged; the pool state is logged at most this often (0 disables)
+        'pool_slow_checkout_ms': float(os.getenv('DB_POOL_SLOW_CHECKOUT_MS', '100')),
+        'pool_log_interval_seconds': float(os.getenv('DB_POOL_LOG_INTERVAL_SECONDS', '60')),
+        # Statements a route may execute per request (routes without their own budget), 0 for no limit;
+        # over budget is logged ("log"), fails the request ("raise", for tests) or is not checked ("off")
+        'statement_budget': int(os.getenv('DB_STATEMENT_BUDGET', '0')),
+        'statement_budget_mode': os.getenv('DB_STATEMENT_BUDGET_MODE', 'log').lower(),
+        # Statements slower than this are logged and kept for GET /db/slow-queries (0 disables);
+        # this fraction of the slow SELECTs is also explained, which runs them a second time
+        'slow_query_ms': float(os.getenv('DB_SLOW_QUERY_MS', '200')),
+        'slow_query_explain_sample_rate': float(os.getenv('DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE', '0')),
+        'slow_query_max_entries': int(os.getenv('DB_SLOW_QUERY_MAX_ENTRIES', '50')),
+        # GET /db/slow-queries shows SQL, call sites and plans to anyone, so it is off unless enabled
+        'slow_query_endpoint': os.getenv('DB_SLOW_QUERY_ENDPOINT', 'false').lower() in ('1', 'true', 'yes'),
+        # Read-through cache for get-by-id lookups: "memory" or "none"
+        'cache_backend': os.getenv('CACHE_BACKEND', 'memory').lower(),
+        'cache_ttl_seconds': float(os.getenv('CACHE_TTL_SECONDS', '60')),
+        'cache_max_entries': int(os.getenv('CACHE_MAX_ENTRIES', '10000')),
+        # Response compression: encodings offered, most preferred first (empty disables), the smallest
+        # body worth compressing, and each encoding's level (higher is smaller but costs more CPU)
+        'compression_encodings': [name.strip().lower() for name in os.getenv('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(',') if name.strip()],
+        'compression_min_size': int(os.getenv('COMPRESSION_MIN_SIZE', '1024')),
+        'compression_gzip_level': int(os.getenv('COMPRESSION_GZIP_LEVEL', '6')),
+        'compression_brotli_quality': int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4')),
+        'compression_zstd_level': int(os.getenv('COMPRESSION_ZSTD_LEVEL', '3')),
+        # Logging: records below log_level are discarded unformatted; "text" or "json" lines; the
+        # fraction of DEBUG/INFO records kept per logger; records buffered for the writer thread
+        'log_level': os.getenv('LOG_LEVEL', 'INFO').upper(),
+        'log_format': os.getenv('LOG_FORMAT', 'text').lower(),
+        'log_sample_rates': parse_sample_rates(os.getenv('LOG_SAMPLE_RATES', '')),
+        'log_queue_size': int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    }
@@ -1,33 +1,69 @@
 import logging
-from typing import Generator, Dict
+from typing import Any, Generator, AsyncGenerator, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+import threading
 import urllib.parse
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
 from .config import load_config
+from .query_stats import install_query_stats
+from .slow_queries import slow_query_log
+from .sqlite_engine import configure_sqlite, BEGIN_IMMEDIATE_OPTION
+from .pool_stats import TimedQueuePool, TimedAsyncAdaptedQueuePool, pool_options, configure_pool_logging
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create SQLAlchemy Base
 Base = declarative_base()
 
-def get_database_url() -> str:
+T = TypeVar("T")
+
+# Either session type can be handed to a route by get_session
+DBSession = Union[Session, AsyncSession]
+
+# Request methods whose sessions only read
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# SQLAlchemy dialect+driver prefixes of each DB_BACKEND: (sync, async)
+DRIVERS = {
+    "postgresql": ("postgresql", "postgresql+asyncpg"),
+    "sqlite": ("sqlite", "sqlite+aiosqlite")
+}
+
+def get_database_url(asynchronous: bool = False) -> str:
     """
     Create a database URL from the config values.
     Properly URL encodes parameters, especially the password which may contain special characters.
     
+    Args:
+        asynchronous: Use the backend's async driver (asyncpg or aiosqlite)
+        
     Returns:
         str: A properly formatted and URL-encoded database connection string
         
     Raises:
         KeyError: If required configuration values are missing
+        ValueError: If DB_BACKEND is not a supported backend
         Exception: For other errors during URL construction
     """
     try:
         config = load_config()
         
+        backend = config['backend']
+        if backend not in DRIVERS:
+            raise ValueError(f"Unknown DB_BACKEND '{backend}', expected 'postgresql' or 'sqlite'")
+        driver = DRIVERS[backend][1 if asynchronous else 0]
+        
+        # A SQLite database is a file, no server or credentials involved
+        if backend == "sqlite":
+            return f"{driver}:///{config['sqlite_path']}"
+        
         # Validate required config parameters
         required_params = ['user', 'password', 'host', 'port', 'database']
         for param in required_params:
@@ -39,49 +75,266 @@ def get_database_url() -> str:
         password = urllib.parse.quote_plus(config['password'])
         
         # Construct and return the connection URL
-        connection_url = f"postgresql://{username}:{password}@{config['host']}:{config['port']}/{config['database']}"
-        logger.debug(f"Database URL created successfully (sensitive info redacted)")
+        connection_url = f"{driver}://{username}:{password}@{config['host']}:{config['port']}/{config['database']}"
+        logger.debug("Database URL created successfully (sensitive info redacted)")
         return connection_url
     except KeyError as ke:
-        logger.error(f"Configuration error: {ke}")
+        logger.error("Configuration error: %s", ke)
         raise
     except Exception as e:
-        logger.error(f"Error creating database URL: {e}")
+        logger.error("Error creating database URL: %s", e)
         raise
 
-# Create SQLAlchemy engine
-try:
-    engine = create_engine(get_database_url())
-    logger.info("Database engine created successfully")
-except Exception as e:
-    logger.error(f"Error creating database engine: {e}")
-    raise
+def get_async_database_url() -> str:
+    """
+    Create a database URL for the backend's async driver from the config values.
+    
+    Returns:
+        str: A properly formatted and URL-encoded async database connection string
+    """
+    return get_database_url(asynchronous=True)
+
+class EngineRegistry:
+    """
+    The process-wide database engines and session factories, created on first use.
+    
+    Importing this module reads no configuration and opens no connections, so
+    models and scripts can import it freely. The app creates the engines in its
+    lifespan; scripts such as init_db.py and the benchmarks share the same ones.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._config = None
+        self._engine = None
+        self._session_factory = None
+        self._write_bind = None
+        self._async_engine = None
+        self._async_session_factory = None
+        self._async_write_bind = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Database configuration, loaded once."""
+        if self._config is None:
+            self._config = load_config()
+        return self._config
+    
+    @property
+    def async_enabled(self) -> bool:
+        """Whether requests are served through the async engine."""
+        return self.config['async_enabled']
+    
+    def engine(self) -> Engine:
+        """Return the sync engine, creating it on first use."""
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    try:
+                        engine = create_engine(get_database_url(), poolclass=TimedQueuePool, **pool_options(self.config))
+                        self._write_bind = engine
+                        if engine.dialect.name == "sqlite":
+                            configure_sqlite(engine, self.config)
+                            self._write_bind = engine.execution_options(**{BEGIN_IMMEDIATE_OPTION: True})
+                        configure_pool_logging(engine.pool, self.config)
+                        install_query_stats(engine)
+                        slow_query_log.configure(self.config)
+                        slow_query_log.install(engine)
+                        # Objects stay loaded after commit, so returning them does not cost a SELECT per row
+                        self._session_factory = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+                        self._engine = engine
+                        logger.info("Database engine created successfully")
+                    except Exception as e:
+                        logger.error("Error creating database engine: %s", e)
+                        raise
+        return self._engine
+    
+    def async_engine(self) -> Optional[AsyncEngine]:
+        """Return the async engine, creating it on first use; None unless DB_ASYNC is enabled."""
+        if not self.async_enabled:
+            return None
+        if self._async_engine is None:
+            with self._lock:
+                if self._async_engine is None:
+                    try:
+                        async_engine = create_async_engine(get_async_database_url(), poolclass=TimedAsyncAdaptedQueuePool, **pool_options(self.config))
+                        self._async_write_bind = async_engine
+                        if async_engine.dialect.name == "sqlite":
+                            configure_sqlite(async_engine.sync_engine, self.config)
+                            self._async_write_bind = async_engine.execution_options(**{BEGIN_IMMEDIATE_OPTION: True})
+                        configure_pool_logging(async_engine.pool, self.config)
+                        install_query_stats(async_engine.sync_engine)
+                        slow_query_log.configure(self.config)
+                        slow_query_log.install(async_engine.sync_engine)
+                        # Objects must stay readable after commit, since lazy loads cannot run outside the greenlet
+                        self._async_session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+                        self._async_engine = async_engine
+                        logger.info("Async database engine created successfully")
+                    except Exception as e:
+                        logger.error("Error creating async database engine: %s", e)
+                        raise
+        return self._async_engine
+    
+    def session(self, write: bool = False) -> Session:
+        """
+        Open a new session on the sync engine.
+        
+        Args:
+            write: Whether the session will write; on SQLite its transactions
+                then take the write lock when they begin
+        """
+        self.engine()
+        if write:
+            return self._session_factory(bind=self._write_bind)
+        return self._session_factory()
+    
+    def async_session(self, write: bool = False) -> AsyncSession:
+        """Open a new AsyncSession on the async engine; write as for session()."""
+        if self.async_engine() is None:
+            raise RuntimeError("The async database engine is disabled; set DB_ASYNC=true")
+        if write:
+            return self._async_session_factory(bind=self._async_write_bind)
+        return self._async_session_factory()
+    
+    def pools(self) -> List[Tuple[str, Pool]]:
+        """The pools of the engines created so far, as (engine name, pool) pairs."""
+        pools = []
+        if self._engine is not None:
+            pools.append(("sync", self._engine.pool))
+        if self._async_engine is not None:
+            pools.append(("async", self._async_engine.pool))
+        return pools
+    
+    def warm_up(self, connections: int) -> int:
+        """
+        Open connections on the sync engine and return them to its pool, so the
+        first requests don't pay for connecting.
+        
+        Args:
+            connections: Connections to open; capped at the pool size, since
+                connections beyond it are closed again on return
+        
+        Returns:
+            int: Connections opened
+        """
+        engine = self.engine()
+        opened = []
+        try:
+            for _ in range(min(connections, engine.pool.size())):
+                opened.append(engine.connect())
+        finally:
+            for connection in opened:
+                connection.close()
+        return len(opened)
+    
+    async def warm_up_async(self, connections: int) -> int:
+        """Async variant of warm_up for the async engine."""
+        async_engine = self.async_engine()
+        opened = []
+        try:
+            for _ in range(min(connections, async_engine.pool.size())):
+                opened.append(await async_engine.connect())
+        finally:
+            for connection in opened:
+                await connection.close()
+        return len(opened)
+    
+    async def start(self) -> None:
+        """
+        Create the engine that serves requests and warm its pool to
+        DB_POOL_MIN_CONNECTIONS. A database that can't be reached is logged,
+        not raised: requests will connect on demand once it is back.
+        """
+        connections = self.config['pool_min_connections']
+        try:
+            # Engine creation imports the driver, so keep it off the event loop
+            if self.async_enabled:
+                await run_in_threadpool(self.async_engine)
+                warmed = await self.warm_up_async(connections)
+            else:
+                warmed = await run_in_threadpool(self.warm_up, connections)
+            logger.info("Database pool warmed up with %s connections", warmed)
+        except Exception as e:
+            logger.warning("Database pool warm-up failed, connecting on demand: %s", e)
+    
+    async def dispose(self) -> None:
+        """Close every pooled connection; the engines stay usable and reconnect on demand."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+        if self._engine is not None:
+            await run_in_threadpool(self._engine.dispose)
+        logger.info("Database engines disposed")
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Shared by everything in the process
+engines = EngineRegistry()
 
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get a database session for FastAPI endpoints.
     Ensures the session is properly closed even if an exception occurs.
     """
-    db = SessionLocal()
+    db = engines.session()
     try:
         yield db
         logger.debug("Database session provided")
     except Exception as e:
-        logger.error(f"Database session error: {e}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
         db.close()
         logger.debug("Database session closed")
 
+async def get_session(request: Request) -> AsyncGenerator[DBSession, None]:
+    """
+    Dependency function to get the configured database session for FastAPI endpoints.
+    Yields an AsyncSession when DB_ASYNC is enabled, otherwise a regular Session.
+    Requests other than GET, HEAD and OPTIONS get a session opened for writing.
+    Pass the session to run_service rather than calling services on it directly.
+    """
+    write = request.method not in READ_ONLY_METHODS
+    if engines.async_enabled:
+        async with engines.async_session(write) as db:
+            logger.debug("Async database session provided")
+            yield db
+        logger.debug("Async database session closed")
+        return
+
+    db = engines.session(write)
+    try:
+        yield db
+        logger.debug("Database session provided")
+    except Exception as e:
+        logger.error("Database session error: %s", e)
+        raise
+    finally:
+        await run_in_threadpool(db.close)
+        logger.debug("Database session closed")
+
+async def run_service(db: DBSession, service: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a service function without blocking the event loop.
+    
+    With an AsyncSession the service runs through AsyncSession.run_sync, so every
+    statement goes over the async driver and yields to the event loop while waiting.
+    With a regular Session the call is moved to the threadpool.
+    
+    Args:
+        db: Session or AsyncSession from get_session
+        service: Service function taking the session as its first argument
+        
+    Returns:
+        Whatever the service function returns
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(service, *args, **kwargs)
+    return await run_in_threadpool(service, db, *args, **kwargs)
+
 if __name__ == '__main__':
     # Test connection
-    with SessionLocal() as session:
+    with engines.session() as session:
         try:
             # Execute a simple query to test the connection
-            session.execute("SELECT 1")
+            session.execute(text("SELECT 1"))
             logger.info("Connection successful!")
         except Exception as e:
-            logger.error(f"An error occurred while connecting to the database: {e}")
+            logger.error("An error occurred while connecting to the database: %s", e)
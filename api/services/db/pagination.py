@@ -0,0 +1,155 @@
+import base64
+import json
+import logging
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, false
+from starlette.requests import Request
+from starlette.responses import Response
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# A sort key: the expression to order by and whether it sorts descending
+SortKey = Tuple[ColumnElement, bool]
+
+
+class Page(NamedTuple):
+    """A single page of results and the cursor for the page after it"""
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key values of the last row on a page into an opaque cursor token.
+
+    Args:
+        values: Sort key values, in sort key order
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    payload = json.dumps([str(value) if value is not None else None for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    """
+    Decode a cursor token back into typed sort key values.
+
+    Args:
+        cursor: Token previously produced by encode_cursor
+        keys: Sort keys the cursor was produced for
+
+    Returns:
+        List of sort key values converted to each key's Python type
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the sort keys
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match the requested ordering")
+        return [
+            key.type.python_type(value) if value is not None else None
+            for (key, _), value in zip(keys, values)
+        ]
+    except (TypeError, ValueError, ArithmeticError) as e:
+        logger.warning("Rejected pagination cursor %r: %s", cursor, e)
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+
+
+def keyset_predicate(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    Build the WHERE clause selecting rows strictly after the given sort key values.
+
+    Expands (a, b) > (x, y) into (a > x) OR (a = x AND b > y) so that mixed
+    ascending and descending keys are supported. NULLs sort after every value,
+    matching PostgreSQL's default index order.
+    """
+    clauses = []
+    for position, (key, descending) in enumerate(keys):
+        equal_prefix = [
+            prefix.is_(None) if value is None else prefix == value
+            for (prefix, _), value in zip(keys[:position], values[:position])
+        ]
+        value = values[position]
+        if value is None:
+            # Nothing sorts after NULL ascending; descending, every non-NULL value does
+            after = key.is_not(None) if descending else false()
+        else:
+            after = key < value if descending else key > value
+            if not descending and _is_nullable(key):
+                after = or_(after, key.is_(None))
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
+
+
+def _is_nullable(key: ColumnElement) -> bool:
+    """Whether a sort key can hold NULL; expressions are assumed to."""
+    return getattr(getattr(key, "expression", key), "nullable", True)
+
+
+def order_by_keys(keys: Sequence[SortKey]) -> List[ColumnElement]:
+    """Build ORDER BY clauses for sort keys, placing NULLs as keyset_predicate expects."""
+    return [key.desc().nulls_first() if descending else key.asc().nulls_last() for key, descending in keys]
+
+
+def fetch_page(
+    db: Session,
+    statement: Select,
+    keys: Sequence[SortKey],
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+) -> Page:
+    """
+    Execute a statement as one keyset-paginated page.
+
+    The last key must be unique (normally the primary key) so the ordering is stable.
+    One extra row is fetched to find out whether another page follows, so a page
+    costs a single index range scan no matter how deep into the table it is.
+
+    Args:
+        db: SQLAlchemy database session
+        statement: Select statement returning ORM entities
+        keys: Sort keys, ending with a unique key
+        limit: Maximum number of rows on the page
+        cursor: Cursor returned with the previous page, if any
+
+    Returns:
+        Page: The rows on this page and the cursor for the next one
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if cursor:
+        statement = statement.where(keyset_predicate(keys, decode_cursor(cursor, keys)))
+
+    # Select the sort key values next to each entity so the cursor can be built from the last row
+    statement = statement.add_columns(*(key for key, _ in keys))
+    statement = statement.order_by(*order_by_keys(keys))
+    rows = db.execute(statement.limit(limit + 1)).all()
+
+    next_cursor = encode_cursor(rows[limit - 1][1:]) if len(rows) > limit else None
+    return Page(items=[row[0] for row in rows[:limit]], next_cursor=next_cursor)
+
+
+def set_pagination_headers(request: Request, response: Response, page: Page) -> None:
+    """
+    Advertise the next page on a list response.
+
+    Sets X-Next-Cursor to the opaque cursor and a Link header pointing at the next page,
+    leaving the response body a plain list. Nothing is set on the last page.
+    """
+    if page.next_cursor is None:
+        return
+    response.headers["X-Next-Cursor"] = page.next_cursor
+    response.headers["Link"] = f'<{request.url.include_query_params(after=page.next_cursor)}>; rel="next"'
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PoolStats:
+    """
+    Checkout counters of one connection pool since the process started.
+
+    Attributes:
+        checkouts: Connections handed out
+        timeouts: Checkouts that gave up after the pool timeout
+        slow_checkouts: Checkouts that took longer than the slow threshold
+        wait_ms_total: Time spent obtaining connections, in milliseconds
+        wait_ms_max: Longest single checkout, in milliseconds
+    """
+    checkouts: int = 0
+    timeouts: int = 0
+    slow_checkouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class TimedPoolMixin:
+    """
+    Time every checkout of a QueuePool.
+
+    The measured time is what a request waits for a usable connection: queueing
+    for one to be checked in, opening a new one within the overflow, and the
+    pre-ping. Checkouts slower than slow_checkout_ms are logged with the pool
+    state, and the state is logged at most every log_interval_seconds.
+    """
+    slow_checkout_ms: float = 100.0
+    log_interval_seconds: float = 60.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._stats_lock = threading.Lock()
+        self._last_logged = time.monotonic()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._record((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        self._record((time.perf_counter() - started) * 1000)
+        return connection
+
+    def recreate(self):
+        # dispose() swaps in a fresh pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        pool.slow_checkout_ms = self.slow_checkout_ms
+        pool.log_interval_seconds = self.log_interval_seconds
+        return pool
+
+    def _record(self, wait_ms: float, timed_out: bool = False) -> None:
+        slow = wait_ms > self.slow_checkout_ms
+        with self._stats_lock:
+            stats = self.stats
+            stats.checkouts += not timed_out
+            stats.timeouts += timed_out
+            stats.slow_checkouts += slow
+            stats.wait_ms_total += wait_ms
+            stats.wait_ms_max = max(stats.wait_ms_max, wait_ms)
+            now = time.monotonic()
+            log_status = self.log_interval_seconds > 0 and now - self._last_logged >= self.log_interval_seconds
+            if log_status:
+                self._last_logged = now
+
+        if timed_out:
+            logger.error("Timed out after %.0f ms waiting for a database connection (%s)", wait_ms, self.status())
+        elif slow:
+            logger.warning("Waited %.0f ms for a database connection (%s)", wait_ms, self.status())
+        if log_status:
+            logger.info("Connection pool: %s; %s checkouts, %s slow, %s timed out, max wait %.0f ms",
+                        self.status(), stats.checkouts, stats.slow_checkouts, stats.timeouts, stats.wait_ms_max)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool state together with the checkout counters."""
+        with self._stats_lock:
+            counters = self.stats.as_dict()
+        checkouts = counters["checkouts"] + counters["timeouts"]
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "wait_ms_avg": counters["wait_ms_total"] / checkouts if checkouts else 0.0,
+            **counters
+        }
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool for the sync engine with checkout timing."""
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """QueuePool for the async engine with checkout timing."""
+
+def pool_options(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    create_engine keyword arguments for the configured pool, without the pool class.
+
+    Args:
+        config: Values from load_config()
+
+    Returns:
+        dict: pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping and pool_use_lifo
+    """
+    return {
+        "pool_size": config["pool_size"],
+        "max_overflow": config["pool_max_overflow"],
+        "pool_timeout": config["pool_timeout"],
+        "pool_recycle": config["pool_recycle"],
+        "pool_pre_ping": config["pool_pre_ping"],
+        "pool_use_lifo": config["pool_use_lifo"]
+    }
+
+def configure_pool_logging(pool: TimedPoolMixin, config: Dict[str, Any]) -> None:
+    """Apply the configured slow checkout threshold and status log interval to a pool."""
+    pool.slow_checkout_ms = config["pool_slow_checkout_ms"]
+    pool.log_interval_seconds = config["pool_log_interval_seconds"]
@@ -0,0 +1,75 @@
+import logging
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class QueryStats:
+    """
+    Database activity recorded for one request.
+    
+    Attributes:
+        statements: SQL statements sent to the database
+        round_trips: Statements plus transaction control (BEGIN, COMMIT, ROLLBACK)
+        db_seconds: Time spent executing statements, from sending one to the driver returning
+    """
+    statements: int = 0
+    round_trips: int = 0
+    db_seconds: float = 0.0
+
+# Stats for the request being handled; threadpool calls and run_sync share the same object
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+def begin_request_stats() -> Tuple[QueryStats, Token]:
+    """
+    Start recording database activity for the current request.
+    
+    Returns:
+        tuple: (stats, token) - pass the token to end_request_stats when the request is done
+    """
+    stats = QueryStats()
+    return stats, _request_stats.set(stats)
+
+def end_request_stats(token: Token) -> None:
+    """Stop recording database activity for the current request."""
+    _request_stats.reset(token)
+
+def current_request_stats() -> Optional[QueryStats]:
+    """Return the stats of the request being handled, or None outside a request."""
+    return _request_stats.get()
+
+def _on_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.round_trips += 1
+        conn.info["query_started"] = time.perf_counter()
+
+def _on_statement_done(conn, cursor, statement, parameters, context, executemany):
+    # A failed statement never gets here; the next one on the connection overwrites its start
+    started = conn.info.pop("query_started", None)
+    stats = _request_stats.get()
+    if stats is not None and started is not None:
+        stats.db_seconds += time.perf_counter() - started
+
+def _on_transaction_control(conn, *args):
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.round_trips += 1
+
+def install_query_stats(engine: Engine) -> None:
+    """
+    Count statements and transaction round trips, and time statements, on an engine.
+    For an AsyncEngine pass its sync_engine.
+    """
+    event.listen(engine, "before_cursor_execute", _on_statement)
+    event.listen(engine, "after_cursor_execute", _on_statement_done)
+    for name in ("begin", "commit", "rollback"):
+        event.listen(engine, name, _on_transaction_control)
+    logger.debug("Query stats installed on database engine")
@@ -0,0 +1,408 @@
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+import logging
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from services.cache.entity_cache import get_cached, read_generation, cache_entity, invalidate
+from services.db.bulk import insert_many, delete_many, BULK_BATCH_SIZE
+from services.db.change_versions import bump_table_version
+from services.db.pagination import Page, fetch_page, DEFAULT_PAGE_SIZE
+
+ModelT = TypeVar("ModelT")
+
+# Called inside a write's transaction with the names written or removed and the
+# IDs of rows that may have been renamed, for tables that refer to rows by name.
+# May return a function to run once the write has committed, e.g. to invalidate caches
+AfterCommit = Callable[[], None]
+NamesWrittenHook = Callable[[Session, Sequence[Optional[str]], Sequence[int]], Optional[AfterCommit]]
+
+def _nothing() -> None:
+    pass
+
+class Repository(Generic[ModelT]):
+    """
+    Create, read, update and delete for one entity table.
+
+    Covers entities whose rows are written exactly as their Pydantic schemas
+    validate them, with no side effects beyond the entity cache, the table
+    version used for ETags and the on_names_written hook. Every method takes
+    the session first, so a bound method can be handed to run_service like any
+    service function.
+
+    Attributes:
+        model: SQLAlchemy model of the table
+        id_column: Integer primary key column
+        name_column: Column used to identify rows in log messages
+        singular: Entity name used in log and error messages, e.g. "company"
+        plural: Plural entity name, e.g. "companies"
+        on_names_written: Optional hook run before commit whenever the name column
+            is written or rows are deleted, e.g. to relink subscriptions by name;
+            the function it may return is run after the commit
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        id_column: InstrumentedAttribute,
+        name_column: InstrumentedAttribute,
+        singular: str,
+        plural: str,
+        on_names_written: Optional[NamesWrittenHook] = None
+    ):
+        self.model = model
+        self.id_column = id_column
+        self.name_column = name_column
+        self.singular = singular
+        self.plural = plural
+        self.on_names_written = on_names_written
+        self.logger = logging.getLogger(f"services.{plural}")
+
+    def _describe(self, row: ModelT) -> str:
+        """Name of a row for log messages."""
+        return getattr(row, self.name_column.key)
+
+    def _names_written(self, db: Session, names: Sequence[Optional[str]], entity_ids: Sequence[int] = ()) -> AfterCommit:
+        """Run the on_names_written hook, if any, inside the current transaction; returns what to run after commit."""
+        if self.on_names_written is None:
+            return _nothing
+        return self.on_names_written(db, names, entity_ids) or _nothing
+
+    def get_page(self, db: Session, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+        """
+        Retrieve one page of rows from the database, ordered by ID.
+
+        Args:
+            db: SQLAlchemy database session
+            limit: Maximum number of rows to return
+            cursor: Opaque cursor from the previous page, if any
+
+        Returns:
+            Page of model objects and the cursor for the next page
+
+        Raises:
+            SQLAlchemyError: If there is a database error
+            ValueError: If the cursor is invalid
+        """
+        try:
+            # Query one page, keyed on the primary key
+            page = fetch_page(db, select(self.model), [(self.id_column, False)], limit, cursor)
+            self.logger.info("Retrieved %s %s from database", len(page.items), self.plural)
+            return page
+        except SQLAlchemyError as e:
+            # Log the error and re-raise
+            self.logger.error("Database error when retrieving %s: %s", self.plural, e)
+            raise
+
+    def get(self, db: Session, entity_id: int) -> Optional[ModelT]:
+        """
+        Retrieve a single row by ID, from the entity cache when possible.
+
+        Args:
+            db: SQLAlchemy database session
+            entity_id: ID of the row to retrieve
+
+        Returns:
+            The row if found, None otherwise
+
+        Raises:
+            SQLAlchemyError: If there is a database error
+        """
+        try:
+            # Serve recently read or written rows from the cache
+            cached = get_cached(self.model, entity_id)
+            if cached is not None:
+                self.logger.info("Retrieved %s ID %s from cache: %s", self.singular, entity_id, self._describe(cached))
+                return cached
+
+            # Query the row by ID; a write committed meanwhile keeps it out of the cache
+            generation = read_generation(self.model, entity_id)
+            row = db.scalars(select(self.model).where(self.id_column == entity_id)).first()
+
+            if row:
+                cache_entity(row, generation)
+                self.logger.info("Retrieved %s ID %s: %s", self.singular, entity_id, self._describe(row))
+            else:
+                self.logger.warning("%s with ID %s not found", self.singular.capitalize(), entity_id)
+
+            return row
+
+        except SQLAlchemyError as e:
+            # Log the error and re-raise
+            self.logger.error("Database error when retrieving %s %s: %s", self.singular, entity_id, e)
+            raise
+
+        except Exception as e:
+            # Log the error and re-raise
+            self.logger.error("Unexpected error when retrieving %s %s: %s", self.singular, entity_id, e)
+            raise ValueError(f"Error retrieving {self.singular}: {str(e)}")
+
+    def add(self, db: Session, data: BaseModel) -> ModelT:
+        """
+        Add a new row to the database.
+
+        Args:
+            db: SQLAlchemy database session
+            data: Validated data from the request
+
+        Returns:
+            The newly created row
+
+        Raises:
+            SQLAlchemyError: If there is a database error
+            IntegrityError: If there is a constraint violation
+            ValueError: If the data is invalid
+        """
+        try:
+            # Insert the validated data and read the stored row back in the same statement;
+            # JSON mode turns values such as URLs into the plain strings the columns hold
+            row = db.scalars(
+                insert(self.model).values(**data.model_dump(mode="json")).returning(self.model)
+            ).one()
+            after_commit = self._names_written(db, [self._describe(row)])
+            bump_table_version(db, self.model.__tablename__)
+            db.commit()
+            after_commit()
+
+            # New rows are likely to be read back soon, so cache them straight away
+            cache_entity(row)
+
+            self.logger.info("Created new %s: %s (ID: %s)", self.singular, self._describe(row), getattr(row, self.id_column.key))
+            return row
+
+        except IntegrityError as e:
+            # Roll back the session in case of integrity error
+            db.rollback()
+            self.logger.error("Integrity error when creating %s: %s", self.singular, e)
+            raise
+
+        except SQLAlchemyError as e:
+            # Roll back the session in case of database error
+            db.rollback()
+            self.logger.error("Database error when creating %s: %s", self.singular, e)
+            raise
+
+        except Exception as e:
+            # Roll back the session in case of any other error
+            db.rollback()
+            self.logger.error("Unexpected error when creating %s: %s", self.singular, e)
+            raise ValueError(f"Error creating {self.singular}: {str(e)}")
+
+    def bulk_add(self, db: Session, items: List[BaseModel], batch_size: int = BULK_BATCH_SIZE) -> List[ModelT]:
+        """
+        Add many rows to the database in a single transaction.
+
+        Args:
+            db: SQLAlchemy database session
+            items: Validated data from the request
+            batch_size: Number of rows per multi-row INSERT statement
+
+        Returns:
+            The newly created rows, in request order
+
+        Raises:
+            SQLAlchemyError: If there is a database error; nothing is created
+            IntegrityError: If any row violates a constraint; nothing is created
+            ValueError: If the data is invalid
+        """
+        try:
+            rows = [item.model_dump(mode="json") for item in items]
+
+            # Insert every row in one transaction and commit once
+            created = insert_many(db, self.model, rows, batch_size)
+            after_commit = self._names_written(db, [self._describe(row) for row in created])
+            bump_table_version(db, self.model.__tablename__)
+            db.commit()
+            after_commit()
+
+            self.logger.info("Created %s %s in bulk", len(created), self.plural)
+            return created
+
+        except IntegrityError as e:
+            # Roll back the session in case of integrity error
+            db.rollback()
+            self.logger.error("Integrity error when creating %s in bulk: %s", self.plural, e)
+            raise
+
+        except SQLAlchemyError as e:
+            # Roll back the session in case of database error
+            db.rollback()
+            self.logger.error("Database error when creating %s in bulk: %s", self.plural, e)
+            raise
+
+        except Exception as e:
+            # Roll back the session in case of any other error
+            db.rollback()
+            self.logger.error("Unexpected error when creating %s in bulk: %s", self.plural, e)
+            raise ValueError(f"Error creating {self.plural}: {str(e)}")
+
+    def update(self, db: Session, entity_id: int, data: BaseModel) -> Optional[ModelT]:
+        """
+        Update an existing row in the database with the fields set in data.
+
+        Args:
+            db: SQLAlchemy database session
+            entity_id: ID of the row to update
+            data: Validated data for the update
+
+        Returns:
+            The updated row, or None if not found
+
+        Raises:
+            SQLAlchemyError: If there is a database error
+            IntegrityError: If there is a constraint violation
+            ValueError: If the data is invalid
+        """
+        try:
+            update_data = data.model_dump(mode="json", exclude_unset=True)
+
+            if not update_data:
+                # Nothing to write, so just read the current row
+                row = db.get(self.model, entity_id)
+                if not row:
+                    self.logger.warning("%s with ID %s not found for update", self.singular.capitalize(), entity_id)
+                    return None
+                self.logger.info("No changes provided for %s ID %s", self.singular, entity_id)
+                return row
+
+            # Update and read back the row in a single UPDATE ... RETURNING statement
+            statement = (
+                update(self.model)
+                .where(self.id_column == entity_id)
+                .values(**update_data)
+                .returning(self.model)
+            )
+            row = db.scalars(statement, execution_options={"synchronize_session": False}).one_or_none()
+
+            # Return None if the row was not found
+            if not row:
+                self.logger.warning("%s with ID %s not found for update", self.singular.capitalize(), entity_id)
+                invalidate(self.model, entity_id)
+                return None
+
+            # A rename moves the rows referring to the old name, so pass the ID as well
+            after_commit = _nothing
+            if self.name_column.key in update_data:
+                after_commit = self._names_written(db, [self._describe(row)], [entity_id])
+
+            # Record the change for conditional GETs and commit it to the database
+            bump_table_version(db, self.model.__tablename__)
+            db.commit()
+            after_commit()
+
+            # Replace the cached copy with the committed row
+            cache_entity(row)
+
+            self.logger.info("Updated %s ID %s: %s", self.singular, entity_id, self._describe(row))
+            return row
+
+        except IntegrityError as e:
+            # Roll back the session in case of integrity error
+            db.rollback()
+            self.logger.error("Integrity error when updating %s %s: %s", self.singular, entity_id, e)
+            raise
+
+        except SQLAlchemyError as e:
+            # Roll back the session in case of database error
+            db.rollback()
+            self.logger.error("Database error when updating %s %s: %s", self.singular, entity_id, e)
+            raise
+
+        except Exception as e:
+            # Roll back the session in case of any other error
+            db.rollback()
+            self.logger.error("Unexpected error when updating %s %s: %s", self.singular, entity_id, e)
+            raise ValueError(f"Error updating {self.singular}: {str(e)}")
+
+    def delete(self, db: Session, entity_id: int) -> Tuple[bool, Optional[str]]:
+        """
+        Delete a row from the database by ID.
+
+        Args:
+            db: SQLAlchemy database session
+            entity_id: ID of the row to delete
+
+        Returns:
+            tuple: (success, error_message)
+                - success: True if deletion was successful, False otherwise
+                - error_message: None if successful, error message string if failed
+        """
+        try:
+            # Delete the row and read back its name in a single DELETE ... RETURNING statement
+            statement = (
+                delete(self.model)
+                .where(self.id_column == entity_id)
+                .returning(self.name_column)
+            )
+            deleted = db.execute(statement, execution_options={"synchronize_session": False}).one_or_none()
+
+            # Return False if the row was not found
+            if deleted is None:
+                self.logger.warning("%s with ID %s not found for deletion", self.singular.capitalize(), entity_id)
+                invalidate(self.model, entity_id)
+                return False, f"{self.singular.capitalize()} with ID {entity_id} not found"
+
+            # Rows that pointed at the deleted one may have another with the same name
+            after_commit = self._names_written(db, [deleted[0]])
+            bump_table_version(db, self.model.__tablename__)
+            db.commit()
+            invalidate(self.model, entity_id)
+            after_commit()
+
+            self.logger.info("Deleted %s ID %s: %s", self.singular, entity_id, deleted[0])
+            return True, None
+
+        except SQLAlchemyError as e:
+            # Roll back the session in case of database error
+            db.rollback()
+            error_msg = f"Database error when deleting {self.singular} {entity_id}: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+
+        except Exception as e:
+            # Roll back the session in case of any other error
+            db.rollback()
+            error_msg = f"Unexpected error when deleting {self.singular} {entity_id}: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+
+    def bulk_delete(self, db: Session, entity_ids: Sequence[int]) -> Tuple[List[int], List[int]]:
+        """
+        Delete many rows from the database by ID in a single statement.
+
+        Args:
+            db: SQLAlchemy database session
+            entity_ids: IDs of the rows to delete
+
+        Returns:
+            tuple: (deleted, missing)
+                - deleted: IDs that were deleted
+                - missing: Requested IDs that did not exist
+
+        Raises:
+            SQLAlchemyError: If there is a database error; nothing is deleted
+        """
+        try:
+            requested = list(dict.fromkeys(entity_ids))
+            deleted_rows = delete_many(db, self.model, self.id_column, requested, self.name_column)
+            deleted = {row[0] for row in deleted_rows}
+            after_commit = _nothing
+            if deleted:
+                after_commit = self._names_written(db, [row[1] for row in deleted_rows])
+                bump_table_version(db, self.model.__tablename__)
+            db.commit()
+            invalidate(self.model, *deleted)
+            after_commit()
+
+            missing = [entity_id for entity_id in requested if entity_id not in deleted]
+            if missing:
+                self.logger.warning("%s %s not found for bulk deletion", len(missing), self.plural)
+            self.logger.info("Deleted %s %s in bulk", len(deleted), self.plural)
+            return [entity_id for entity_id in requested if entity_id in deleted], missing
+
+        except SQLAlchemyError as e:
+            # Roll back the session in case of database error
+            db.rollback()
+            self.logger.error("Database error when deleting %s in bulk: %s", self.plural, e)
+            raise
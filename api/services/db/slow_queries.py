@@ -0,0 +1,178 @@
+import logging
+import random
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# How to ask each dialect for a plan. PostgreSQL runs the statement again to
+# measure it, so only SELECTs are explained and only a sample of them.
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (ANALYZE, BUFFERS) ",
+    "sqlite": "EXPLAIN QUERY PLAN "
+}
+
+# Modules whose frames are skipped when looking for the service that ran a statement
+_INFRASTRUCTURE_MODULES = frozenset({__name__, "services.db.query_stats", "services.db.connect_to_db"})
+
+@dataclass
+class SlowQuery:
+    """
+    One statement that took longer than the slow query threshold.
+
+    Attributes:
+        captured_at: When the statement finished
+        duration_ms: Time from sending the statement to the driver returning
+        statement: SQL text, with placeholders for the parameters
+        parameters: Bound parameters with their values replaced by their types
+        caller: Service function that ran the statement, if one was found
+        plan: EXPLAIN output, when the statement was sampled for a plan
+    """
+    captured_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: str
+    caller: Optional[str] = None
+    plan: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class SlowQueryLog:
+    """
+    Log statements slower than a threshold and keep the latest ones, with
+    EXPLAIN plans for a sampled fraction, in a ring buffer for GET /db/slow-queries.
+    """
+
+    def __init__(self, threshold_ms: float = 200.0, explain_sample_rate: float = 0.0, max_entries: int = 50):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.entries: Deque[SlowQuery] = deque(maxlen=max_entries)
+        self._random = random.Random()
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """Apply the configured threshold, sample rate and buffer size."""
+        self.threshold_ms = config['slow_query_ms']
+        self.explain_sample_rate = config['slow_query_explain_sample_rate']
+        if self.entries.maxlen != config['slow_query_max_entries']:
+            self.entries = deque(self.entries, maxlen=config['slow_query_max_entries'])
+
+    def recent(self) -> List[SlowQuery]:
+        """The captured slow queries, newest first."""
+        return list(reversed(self.entries))
+
+    def install(self, engine: Engine) -> None:
+        """
+        Time every statement on an engine.
+        For an AsyncEngine pass its sync_engine.
+        """
+        event.listen(engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine, "after_cursor_execute", self._on_statement_done)
+        logger.debug("Slow query log installed on database engine")
+
+    def _on_statement(self, conn, cursor, statement, parameters, context, executemany):
+        if self.threshold_ms > 0:
+            conn.info["slow_query_started"] = time.perf_counter()
+
+    def _on_statement_done(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("slow_query_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        entry = SlowQuery(
+            captured_at=datetime.now(timezone.utc),
+            duration_ms=round(duration_ms, 1),
+            statement=" ".join(statement.split()),
+            parameters=redact_parameters(parameters, executemany),
+            caller=find_caller()
+        )
+        logger.warning("Slow query (%.0f ms) in %s: %s parameters=%s",
+                       entry.duration_ms, entry.caller or 'unknown caller', entry.statement, entry.parameters)
+        if self.explain_sample_rate > 0 and self._random.random() < self.explain_sample_rate:
+            entry.plan = explain(conn, statement, parameters, context, executemany)
+        self.entries.append(entry)
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    """
+    Describe bound parameters without their values, which may hold personal data.
+
+    Args:
+        parameters: Parameters as passed to the DBAPI cursor
+        executemany: Whether parameters is a list of parameter sets
+
+    Returns:
+        str: The parameters with every value but None replaced by its type name
+    """
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} rows like {redact_parameters(rows[0]) if rows else '()'}"
+    if isinstance(parameters, dict):
+        return repr({name: _redact(value) for name, value in parameters.items()})
+    if isinstance(parameters, (list, tuple)):
+        return repr(tuple(_redact(value) for value in parameters))
+    return _redact(parameters)
+
+def _redact(value: Any) -> Optional[str]:
+    return None if value is None else f"<{type(value).__name__}>"
+
+def find_caller() -> Optional[str]:
+    """
+    The outermost service function on the stack, e.g.
+    services.subscriptions.get_all_subscriptions_service.get_all_subscriptions.
+    Only called for slow statements, so walking the stack costs nothing otherwise.
+    """
+    caller = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("services.") and module not in _INFRASTRUCTURE_MODULES:
+            caller = f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return caller
+
+def explain(conn, statement: str, parameters: Any, context, executemany: bool) -> Optional[str]:
+    """
+    Run EXPLAIN for a statement on the connection that just executed it.
+
+    Only single SELECTs are explained, as EXPLAIN ANALYZE executes the statement
+    again, and not while a server-side cursor of the statement is still open.
+    The EXPLAIN runs inside a savepoint, so a failure can't abort the request's
+    transaction; it is logged and no plan is returned.
+
+    Returns:
+        Optional[str]: The plan, one line per plan row, or None if none was captured
+    """
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    streaming = context is not None and context.execution_options.get("stream_results")
+    if prefix is None or executemany or streaming or not statement.lstrip().upper().startswith("SELECT"):
+        return None
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            raise
+    except Exception as e:
+        logger.error("Error capturing the plan of a slow query: %s", e)
+        return None
+    finally:
+        cursor.close()
+
+# Shared by both engines and the admin endpoint
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,76 @@
+import logging
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Execution option that makes a connection's transactions start with BEGIN IMMEDIATE
+BEGIN_IMMEDIATE_OPTION = "sqlite_begin_immediate"
+
+def sqlite_pragmas(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    PRAGMAs applied to every new SQLite connection.
+
+    WAL lets readers run alongside the single writer, and synchronous=NORMAL
+    only syncs at checkpoints, which stays consistent after a crash but may lose
+    the last transactions on power loss. Foreign keys are off by default in
+    SQLite and must be turned on for ON DELETE SET NULL to apply.
+
+    Args:
+        config: Values from load_config()
+
+    Returns:
+        dict: PRAGMA name -> value, in the order they are set
+    """
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "foreign_keys": "ON",
+        "busy_timeout": config['sqlite_busy_timeout_ms'],
+        # Negative sizes are in KiB
+        "cache_size": -config['sqlite_cache_size_kib'],
+        "mmap_size": config['sqlite_mmap_size_mb'] * 1024 * 1024,
+        "temp_store": "MEMORY"
+    }
+
+def configure_sqlite(engine: Engine, config: Dict[str, Any]) -> None:
+    """
+    Set the PRAGMAs on each new connection of a SQLite engine and make its
+    transactions behave like PostgreSQL's.
+
+    The sqlite3 module only opens a transaction before INSERT, UPDATE or DELETE,
+    so reads ran outside it and SAVEPOINT did not nest. Its own transaction
+    handling is switched off and BEGIN is sent when SQLAlchemy starts a
+    transaction, on a bare cursor so it isn't counted as a statement.
+
+    A deferred transaction that has read and then writes fails at once with
+    "database is locked" if another writer committed meanwhile, since its
+    snapshot is stale and waiting can't help. Connections carrying the
+    BEGIN_IMMEDIATE_OPTION execution option take the write lock at BEGIN
+    instead, waiting up to busy_timeout for it.
+    For an AsyncEngine pass its sync_engine.
+    """
+    pragmas = sqlite_pragmas(config)
+
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+    def on_begin(conn):
+        cursor = conn.connection.cursor()
+        try:
+            immediate = conn.get_execution_options().get(BEGIN_IMMEDIATE_OPTION)
+            cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "begin", on_begin)
+    logger.debug("SQLite engine configured with %s", pragmas)
@@ -0,0 +1,92 @@
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Statements each route is expected to need, keyed by method and path template.
+# Counts assume a database set up with init_db.py (table_versions seeded), hold
+# for any page size or filter, and include the table version read for ETags
+# and the version bump on writes, so a route that starts loading relationships
+# row by row (N+1) goes over. None exempts a route whose count grows with the
+# request body: bulk inserts send one INSERT per BULK_BATCH_SIZE rows on
+# PostgreSQL (one per row on SQLite).
+ROUTE_STATEMENT_BUDGETS: Dict[Tuple[str, str], Optional[int]] = {
+    # Page plus table version; expand adds one SELECT ... IN per relationship
+    ("GET", "/subscriptions/"): 5,
+    ("GET", "/subscriptions/export"): 1,
+    ("GET", "/subscriptions/summary"): 2,
+    ("GET", "/subscriptions/summary/{grouping}"): 2,
+    ("GET", "/subscriptions/search"): 2,
+    # Detail routes take their ETag from the body, so only a cache miss reads the row
+    ("GET", "/subscriptions/{subscription_id}"): 1,
+    # The write, the rollup upsert and the version bump, plus locking the rollup
+    # groups first on PostgreSQL. Removing rows may also recompute the extremes
+    # of the groups they were the minimum or maximum of and delete emptied groups,
+    # one statement each however many groups; an update first reads and locks
+    # the old values
+    ("POST", "/subscriptions/"): 4,
+    ("PUT", "/subscriptions/{subscription_id}"): 7,
+    ("DELETE", "/subscriptions/{subscription_id}"): 6,
+    ("POST", "/subscriptions/bulk"): None,
+    ("DELETE", "/subscriptions/"): 6,
+    ("POST", "/subscriptions/bulk-delete"): 6,
+}
+
+# Companies, users and categories share the generic CRUD routes and their counts.
+# Writes that touch names also relink the subscriptions carrying them, and bump
+# the subscriptions version when a link changed: the write, the relink and two bumps
+for _plural, _singular in (("companies", "company"), ("users", "user"), ("categories", "category")):
+    ROUTE_STATEMENT_BUDGETS.update({
+        ("GET", f"/{_plural}/"): 2,
+        ("GET", f"/{_plural}/{{{_singular}_id}}"): 1,
+        ("POST", f"/{_plural}/"): 4,
+        ("PUT", f"/{_plural}/{{{_singular}_id}}"): 4,
+        ("DELETE", f"/{_plural}/{{{_singular}_id}}"): 4,
+        ("POST", f"/{_plural}/bulk"): None,
+        ("DELETE", f"/{_plural}/"): 4,
+        ("POST", f"/{_plural}/bulk-delete"): 4,
+    })
+
+class StatementBudgetExceeded(RuntimeError):
+    """Raised in raise mode when a request executes more statements than its route's budget."""
+
+def statement_budget(method: str, route: str, default: int) -> Optional[int]:
+    """
+    The statement budget of a route.
+
+    Args:
+        method: HTTP method
+        route: Path template of the matched route
+        default: Budget of routes not listed in ROUTE_STATEMENT_BUDGETS, 0 for none
+
+    Returns:
+        Optional[int]: Statements the route may execute, or None if it is not checked
+    """
+    budget = ROUTE_STATEMENT_BUDGETS.get((method, route), default)
+    return budget or None
+
+def check_statement_budget(method: str, route: str, statements: int, config: Dict[str, Any]) -> None:
+    """
+    Compare the statements a request executed with its route's budget.
+
+    Args:
+        method: HTTP method
+        route: Path template of the matched route
+        statements: Statements the request executed
+        config: Values from load_config()
+
+    Raises:
+        StatementBudgetExceeded: If the budget was exceeded and DB_STATEMENT_BUDGET_MODE is "raise"
+    """
+    mode = config['statement_budget_mode']
+    if mode == "off":
+        return
+    budget = statement_budget(method, route, config['statement_budget'])
+    if budget is None or statements <= budget:
+        return
+
+    message = f"{method} {route} executed {statements} statements, over its budget of {budget}"
+    if mode == "raise":
+        raise StatementBudgetExceeded(message)
+    logger.warning(message)
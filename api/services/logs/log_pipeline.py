@@ -0,0 +1,162 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
+
+from services.db.config import load_config
+
+# Attributes every LogRecord has; anything else was passed in extra= and goes into the JSON entry
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as one JSON object per line, with any extra= fields as keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of the DEBUG and INFO records of chosen loggers.
+
+    The records of each sampled logger are counted per level and its 1st,
+    (n+1)th, (2n+1)th... record of that level is kept, so the counters stay as
+    few as the loggers whatever the messages hold. WARNING and above always
+    pass. Records come from every thread, so the counters are updated under a lock.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Most specific logger name first, so services.db.repository can override services.db
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self.sampled_out = 0
+        self._lock = threading.Lock()
+        self._intervals: Dict[str, int] = {}
+        self._counts: Dict[Tuple[str, int], int] = {}
+
+    def _interval(self, name: str) -> int:
+        """Keep one record in this many for a logger; 0 to drop them all."""
+        interval = self._intervals.get(name)
+        if interval is None:
+            rate = next((rate for prefix, rate in self.rates if name == prefix or name.startswith(prefix + ".")), 1.0)
+            interval = 0 if rate <= 0 else max(1, round(1 / rate))
+            self._intervals[name] = interval
+        return interval
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        with self._lock:
+            interval = self._interval(record.name)
+            if interval == 1:
+                return True
+            key = (record.name, record.levelno)
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+            if interval and count % interval == 0:
+                return True
+            self.sampled_out += 1
+            return False
+
+class LogQueueHandler(QueueHandler):
+    """
+    Hand records to the listener thread without blocking the caller.
+
+    Only the message arguments are merged here, while they still hold the
+    values being logged; timestamps, JSON and the write itself happen on the
+    listener thread. When the queue is full the record is dropped and counted
+    rather than making the event loop wait for the terminal or log collector.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_lock = threading.Lock()
+_handler: Optional[LogQueueHandler] = None
+_sampling: Optional[SamplingFilter] = None
+_listener: Optional[QueueListener] = None
+
+def configure_logging(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Send every log record through a queue to a background thread that formats
+    and writes it, so logging never blocks a request on I/O.
+
+    Records below LOG_LEVEL are discarded before they are formatted, and
+    loggers listed in LOG_SAMPLE_RATES keep only that fraction of their DEBUG
+    and INFO records. LOG_FORMAT=json writes one JSON object per line instead of
+    the plain "LEVEL:logger:message" lines. uvicorn's loggers, access log
+    included, are routed through the same queue.
+
+    Like logging.basicConfig this does nothing if the root logger already has
+    handlers, and calling it again has no effect.
+
+    Args:
+        config: Values from load_config(); loaded if not given
+    """
+    global _handler, _sampling, _listener
+    with _lock:
+        root = logging.getLogger()
+        if _listener is not None or root.handlers:
+            return
+        config = config or load_config()
+
+        output = logging.StreamHandler(sys.stderr)
+        output.setFormatter(JsonFormatter() if config['log_format'] == "json" else logging.Formatter(logging.BASIC_FORMAT))
+        _handler = LogQueueHandler(queue.Queue(config['log_queue_size']))
+        _sampling = SamplingFilter(config['log_sample_rates'])
+        _handler.addFilter(_sampling)
+        root.addHandler(_handler)
+        root.setLevel(config['log_level'])
+
+        # uvicorn configures its loggers with their own handlers before it imports the app
+        for name in ("uvicorn", "uvicorn.access"):
+            uvicorn_logger = logging.getLogger(name)
+            uvicorn_logger.handlers.clear()
+            uvicorn_logger.propagate = True
+
+        _listener = QueueListener(_handler.queue, output)
+        _listener.start()
+        atexit.register(stop_logging)
+
+def stop_logging() -> None:
+    """Write out the records still queued and stop the listener thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+def log_pipeline_stats() -> Dict[str, int]:
+    """Records dropped because the queue was full and records left out by sampling."""
+    if _handler is None:
+        return {"dropped": 0, "sampled_out": 0, "queued": 0}
+    return {"dropped": _handler.dropped, "sampled_out": _sampling.sampled_out, "queued": _handler.queue.qsize()}
@@ -0,0 +1,128 @@
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds; the last bucket (+Inf) is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    """
+    Prometheus-style histogram with fixed buckets.
+
+    Counts are kept per bucket and only summed up into cumulative counts when
+    rendered, so an observation is one bisect and two additions.
+    """
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, count) pairs in the order Prometheus expects, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            pairs.append((repr(bound), total))
+        pairs.append(("+Inf", total + self.counts[-1]))
+        return pairs
+
+class RouteMetrics:
+    """Everything recorded for one method and route template."""
+    __slots__ = ("statuses", "duration", "db_duration", "db_statements")
+
+    def __init__(self):
+        self.statuses: Dict[int, int] = {}
+        self.duration = Histogram()
+        self.db_duration = Histogram()
+        self.db_statements = 0
+
+class RequestMetrics:
+    """
+    Per-route request counters and latency histograms of this process.
+
+    Routes are keyed by their path template (/subscriptions/{subscription_id}),
+    never the concrete path, so the number of series stays bounded. Requests
+    are recorded and rendered on the event loop, which is why no lock is taken.
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.in_progress = 0
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float,
+                db_seconds: float, db_statements: int) -> None:
+        """
+        Record one finished request.
+
+        Args:
+            method: HTTP method
+            route: Path template of the matched route
+            status_code: Response status sent to the client
+            seconds: Time from receiving the request to sending the last response byte
+            db_seconds: Time spent executing statements for the request
+            db_statements: Statements executed for the request
+        """
+        metrics = self.routes.get((method, route))
+        if metrics is None:
+            metrics = self.routes[(method, route)] = RouteMetrics()
+        metrics.statuses[status_code] = metrics.statuses.get(status_code, 0) + 1
+        metrics.duration.observe(seconds)
+        metrics.db_duration.observe(db_seconds)
+        metrics.db_statements += db_statements
+
+    def render(self) -> List[str]:
+        """Lines in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_requests_total Requests handled, by route and status code.",
+            "# TYPE http_requests_total counter"
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            for status_code, count in sorted(metrics.statuses.items()):
+                lines.append(f'http_requests_total{{{labels},status="{status_code}"}} {count}')
+
+        lines += [
+            "# HELP http_requests_in_progress Requests being handled right now.",
+            "# TYPE http_requests_in_progress gauge",
+            f"http_requests_in_progress {self.in_progress}"
+        ]
+
+        for name, attribute, description in (
+            ("http_request_duration_seconds", "duration", "Time to handle a request, until the last response byte is sent."),
+            ("http_request_db_duration_seconds", "db_duration", "Time a request spent executing database statements.")
+        ):
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+            for (method, route), metrics in routes:
+                labels = f'method="{method}",route="{_escape(route)}"'
+                histogram = getattr(metrics, attribute)
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            "# HELP http_request_db_statements_total Database statements executed while handling requests.",
+            "# TYPE http_request_db_statements_total counter"
+        ]
+        for (method, route), metrics in routes:
+            lines.append(f'http_request_db_statements_total{{method="{method}",route="{_escape(route)}"}} {metrics.db_statements}')
+        return lines
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+# Shared by the middleware and the /metrics route
+request_metrics = RequestMetrics()
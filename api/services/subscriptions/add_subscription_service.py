@@ -1,9 +1,14 @@
 from typing import Optional
 import logging
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from models.subscription import Subscription, SubscriptionCreate
+from services.cache.entity_cache import cache_entity
+from services.db.change_versions import bump_table_version
+from services.subscriptions.rollup_subscriptions_service import apply_rollup_changes
+from services.subscriptions.link_subscriptions_service import link_values
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -25,38 +30,43 @@ def add_subscription(db: Session, subscription_data: SubscriptionCreate) -> Subs
         ValueError: If the subscription data is invalid
     """
     try:
-        # Create a new Subscription object from the validated data
-        db_subscription = Subscription(
-            companyName=subscription_data.companyName,
-            price=subscription_data.price,
-            subscriptionCategory=subscription_data.subscriptionCategory,
-            description=subscription_data.description,
-            userName=subscription_data.userName,
-            emailAssociated=subscription_data.emailAssociated
-        )
-        
-        # Add to session and commit to database
-        db.add(db_subscription)
+        # Insert the validated data, linking it to its company, category and user,
+        # and read the stored row back in the same statement
+        db_subscription = db.scalars(
+            insert(Subscription).values(
+                companyName=subscription_data.companyName,
+                price=subscription_data.price,
+                subscriptionCategory=subscription_data.subscriptionCategory,
+                description=subscription_data.description,
+                userName=subscription_data.userName,
+                emailAssociated=subscription_data.emailAssociated,
+                **link_values(subscription_data.model_dump())
+            ).returning(Subscription)
+        ).one()
+        apply_rollup_changes(db, added=[db_subscription])
+        bump_table_version(db, Subscription.__tablename__)
         db.commit()
-        db.refresh(db_subscription)
         
-        logger.info(f"Created new subscription: {db_subscription.companyName} (ID: {db_subscription.subscriptionID})")
+        # New rows are likely to be read back soon, so cache them straight away
+        cache_entity(db_subscription)
+        
+        logger.info("Created new subscription: %s (ID: %s)", db_subscription.companyName, db_subscription.subscriptionID)
         return db_subscription
         
     except IntegrityError as e:
         # Roll back the session in case of integrity error
         db.rollback()
-        logger.error(f"Integrity error when creating subscription: {str(e)}")
+        logger.error("Integrity error when creating subscription: %s", e)
         raise
         
     except SQLAlchemyError as e:
         # Roll back the session in case of database error
         db.rollback()
-        logger.error(f"Database error when creating subscription: {str(e)}")
+        logger.error("Database error when creating subscription: %s", e)
         raise
         
     except Exception as e:
         # Roll back the session in case of any other error
         db.rollback()
-        logger.error(f"Unexpected error when creating subscription: {str(e)}")
+        logger.error("Unexpected error when creating subscription: %s", e)
         raise ValueError(f"Error creating subscription: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,60 @@
+from typing import List
+import logging
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+
+from models.subscription import Subscription, SubscriptionCreate
+from services.db.bulk import insert_many, BULK_BATCH_SIZE
+from services.db.change_versions import bump_table_version
+from services.subscriptions.rollup_subscriptions_service import apply_rollup_changes
+from services.subscriptions.link_subscriptions_service import bulk_link_values, link_parameters
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def bulk_add_subscriptions(db: Session, subscriptions_data: List[SubscriptionCreate], batch_size: int = BULK_BATCH_SIZE) -> List[Subscription]:
+    """
+    Add many subscriptions to the database in a single transaction.
+    
+    Args:
+        db: SQLAlchemy database session
+        subscriptions_data: Validated subscription data from request
+        batch_size: Number of subscriptions per multi-row INSERT statement
+        
+    Returns:
+        List[Subscription]: The newly created subscription objects, in request order
+        
+    Raises:
+        SQLAlchemyError: If there is a database error; nothing is created
+        IntegrityError: If any subscription violates a constraint; nothing is created
+        ValueError: If the subscription data is invalid
+    """
+    try:
+        rows = link_parameters([subscription.model_dump() for subscription in subscriptions_data])
+        
+        # Insert every row and fold them into the rollups in one transaction, then commit once
+        db_subscriptions = insert_many(db, Subscription, rows, batch_size, values=bulk_link_values())
+        apply_rollup_changes(db, added=db_subscriptions)
+        bump_table_version(db, Subscription.__tablename__)
+        db.commit()
+        
+        logger.info("Created %s subscriptions in bulk", len(db_subscriptions))
+        return db_subscriptions
+        
+    except IntegrityError as e:
+        # Roll back the session in case of integrity error
+        db.rollback()
+        logger.error("Integrity error when creating subscriptions in bulk: %s", e)
+        raise
+        
+    except SQLAlchemyError as e:
+        # Roll back the session in case of database error
+        db.rollback()
+        logger.error("Database error when creating subscriptions in bulk: %s", e)
+        raise
+        
+    except Exception as e:
+        # Roll back the session in case of any other error
+        db.rollback()
+        logger.error("Unexpected error when creating subscriptions in bulk: %s", e)
+        raise ValueError(f"Error creating subscriptions: {str(e)}")
@@ -0,0 +1,51 @@
+from typing import List, Sequence, Tuple
+import logging
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription
+from services.cache.entity_cache import invalidate
+from services.db.bulk import delete_many
+from services.db.change_versions import bump_table_version
+from services.subscriptions.rollup_subscriptions_service import apply_rollup_changes, ROLLUP_SOURCE_COLUMNS
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+def bulk_delete_subscriptions(db: Session, subscription_ids: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """
+    Delete many subscriptions from the database by ID in a single statement.
+    
+    Args:
+        db: SQLAlchemy database session
+        subscription_ids: IDs of the subscriptions to delete
+        
+    Returns:
+        tuple: (deleted, missing)
+            - deleted: IDs that were deleted
+            - missing: Requested IDs that did not exist
+        
+    Raises:
+        SQLAlchemyError: If there is a database error; nothing is deleted
+    """
+    try:
+        requested = list(dict.fromkeys(subscription_ids))
+        deleted_rows = delete_many(db, Subscription, Subscription.subscriptionID, requested, *ROLLUP_SOURCE_COLUMNS)
+        deleted = {row.subscriptionID for row in deleted_rows}
+        if deleted:
+            apply_rollup_changes(db, removed=deleted_rows)
+            bump_table_version(db, Subscription.__tablename__)
+        db.commit()
+        invalidate(Subscription, *deleted)
+        
+        missing = [subscription_id for subscription_id in requested if subscription_id not in deleted]
+        if missing:
+            logger.warning("%s subscriptions not found for bulk deletion", len(missing))
+        logger.info("Deleted %s subscriptions in bulk", len(deleted))
+        return [subscription_id for subscription_id in requested if subscription_id in deleted], missing
+        
+    except SQLAlchemyError as e:
+        # Roll back the session in case of database error
+        db.rollback()
+        logger.error("Database error when deleting subscriptions in bulk: %s", e)
+        raise
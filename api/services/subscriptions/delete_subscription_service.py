@@ -1,9 +1,13 @@
 import logging
 from typing import Tuple, Optional, Any
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from models.subscription import Subscription
+from services.cache.entity_cache import invalidate
+from services.db.change_versions import bump_table_version
+from services.subscriptions.rollup_subscriptions_service import apply_rollup_changes, ROLLUP_SOURCE_COLUMNS
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -25,22 +29,27 @@ def delete_subscription(db: Session, subscription_id: int) -> Tuple[bool, Option
         SQLAlchemyError: If there is a database error
     """
     try:
-        # Query the subscription by ID
-        db_subscription = db.query(Subscription).filter(Subscription.subscriptionID == subscription_id).first()
+        # Delete the subscription and read back what the rollups need in a single DELETE ... RETURNING statement
+        statement = (
+            delete(Subscription)
+            .where(Subscription.subscriptionID == subscription_id)
+            .returning(*ROLLUP_SOURCE_COLUMNS)
+        )
+        deleted = db.execute(statement, execution_options={"synchronize_session": False}).one_or_none()
         
         # Return False if subscription not found
-        if not db_subscription:
-            logger.warning(f"Subscription with ID {subscription_id} not found for deletion")
+        if deleted is None:
+            logger.warning("Subscription with ID %s not found for deletion", subscription_id)
+            invalidate(Subscription, subscription_id)
             return False, f"Subscription with ID {subscription_id} not found"
         
-        # Get subscription name for logging
-        company_name = db_subscription.companyName
-        
-        # Delete the subscription
-        db.delete(db_subscription)
+        company_name = deleted.companyName
+        apply_rollup_changes(db, removed=[deleted])
+        bump_table_version(db, Subscription.__tablename__)
         db.commit()
+        invalidate(Subscription, subscription_id)
         
-        logger.info(f"Deleted subscription ID {subscription_id}: {company_name}")
+        logger.info("Deleted subscription ID %s: %s", subscription_id, company_name)
         return True, None
         
     except SQLAlchemyError as e:
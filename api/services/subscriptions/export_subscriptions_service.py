@@ -0,0 +1,79 @@
+from typing import AsyncIterator, Iterator, Sequence
+import logging
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+
+# Plain columns rather than entities, so no ORM objects are built per row
+_export_statement = select(
+    Subscription.subscriptionID,
+    Subscription.companyName,
+    Subscription.price,
+    Subscription.subscriptionCategory,
+    Subscription.description,
+    Subscription.userName,
+    Subscription.emailAssociated
+).order_by(Subscription.subscriptionID)
+
+def stream_subscriptions(db: Session, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Sequence[Row]]:
+    """
+    Stream every subscription from the database in batches using a server-side cursor.
+
+    Only one batch is held in memory at a time, regardless of the table size.
+
+    Args:
+        db: SQLAlchemy database session, kept open while the iterator is consumed
+        batch_size: Number of rows fetched from the cursor per batch
+
+    Yields:
+        Batches of subscription rows, ordered by ID
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+    """
+    try:
+        exported = 0
+        result = db.execute(_export_statement.execution_options(yield_per=batch_size))
+        for batch in result.partitions():
+            exported += len(batch)
+            yield batch
+        logger.info("Exported %s subscriptions from database", exported)
+    except SQLAlchemyError as e:
+        # Log the error and re-raise
+        logger.error("Database error when exporting subscriptions: %s", e)
+        raise
+
+async def stream_subscriptions_async(db: AsyncSession, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Sequence[Row]]:
+    """
+    Async variant of stream_subscriptions for use with an AsyncSession.
+
+    Args:
+        db: SQLAlchemy async database session, kept open while the iterator is consumed
+        batch_size: Number of rows fetched from the cursor per batch
+
+    Yields:
+        Batches of subscription rows, ordered by ID
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+    """
+    try:
+        exported = 0
+        result = await db.stream(_export_statement.execution_options(yield_per=batch_size))
+        async for batch in result.partitions():
+            exported += len(batch)
+            yield batch
+        logger.info("Exported %s subscriptions from database", exported)
+    except SQLAlchemyError as e:
+        # Log the error and re-raise
+        logger.error("Database error when exporting subscriptions: %s", e)
+        raise
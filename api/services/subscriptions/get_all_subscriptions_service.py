@@ -1,29 +1,147 @@
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional, Sequence
+from sqlalchemy import select, Select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
-from models.subscription import Subscription
+from models.subscription import Subscription, SubscriptionFilter
+from services.db.pagination import Page, SortKey, fetch_page, DEFAULT_PAGE_SIZE
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-def get_all_subscriptions(db: Session) -> List[Subscription]:
+# Columns the list may be sorted by, each backed by a (column, subscriptionID) index
+SORTABLE_COLUMNS = {
+    "subscriptionID": Subscription.subscriptionID,
+    "companyName": Subscription.companyName,
+    "price": Subscription.price,
+    "subscriptionCategory": Subscription.subscriptionCategory,
+    "userName": Subscription.userName,
+    "emailAssociated": Subscription.emailAssociated
+}
+
+# Related entities the list can load alongside each subscription
+EXPANDABLE_RELATIONSHIPS = {
+    "company": Subscription.company,
+    "category": Subscription.category,
+    "user": Subscription.user
+}
+
+def parse_expand(expand: Optional[str]) -> List[str]:
+    """
+    Parse an expand specification such as "company,user" into relationship names.
+
+    Args:
+        expand: Comma separated relationship names, or None for none
+
+    Returns:
+        List of distinct relationship names, in the order given
+
+    Raises:
+        ValueError: If a relationship is unknown
+    """
+    names = []
+    for name in (expand or "").split(","):
+        name = name.strip()
+        if not name or name in names:
+            continue
+        if name not in EXPANDABLE_RELATIONSHIPS:
+            raise ValueError(f"Cannot expand '{name}'. Expandable: {', '.join(EXPANDABLE_RELATIONSHIPS)}")
+        names.append(name)
+    return names
+
+def parse_sort(sort: Optional[str]) -> List[SortKey]:
     """
-    Retrieve all subscriptions from the database.
+    Parse a sort specification such as "price,-companyName" into sort keys.
+
+    A leading "-" sorts that column descending. subscriptionID is always appended
+    as the final key so the ordering is stable for keyset pagination.
+
+    Args:
+        sort: Comma separated column names, or None for ID order
+
+    Returns:
+        List of (column, descending) sort keys
+
+    Raises:
+        ValueError: If a column is unknown or repeated
+    """
+    keys = []
+    seen = set()
+    for field in (sort or "").split(","):
+        field = field.strip()
+        if not field:
+            continue
+        descending = field.startswith("-")
+        name = field.lstrip("-")
+        if name not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by '{name}'. Sortable columns: {', '.join(SORTABLE_COLUMNS)}")
+        if name in seen:
+            raise ValueError(f"Sort column '{name}' is given more than once")
+        seen.add(name)
+        keys.append((SORTABLE_COLUMNS[name], descending))
+
+    if "subscriptionID" not in seen:
+        keys.append((Subscription.subscriptionID, False))
+    return keys
+
+def apply_filters(statement: Select, filters: Optional[SubscriptionFilter]) -> Select:
+    """
+    Add the WHERE clauses for a subscription filter to a statement.
+
+    Args:
+        statement: Select statement over the subscriptions table
+        filters: Column and price range filters, or None for no filtering
+
+    Returns:
+        Select: The filtered statement
+    """
+    if filters is None:
+        return statement
+    for name, value in filters.model_dump(exclude_none=True).items():
+        if name == "minPrice":
+            statement = statement.where(Subscription.price >= value)
+        elif name == "maxPrice":
+            statement = statement.where(Subscription.price <= value)
+        else:
+            statement = statement.where(getattr(Subscription, name) == value)
+    return statement
+
+def get_all_subscriptions(
+    db: Session,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    filters: Optional[SubscriptionFilter] = None,
+    sort: Optional[str] = None,
+    expand: Sequence[str] = ()
+) -> Page:
+    """
+    Retrieve one page of subscriptions from the database.
+
+    Filters and ordering are applied in SQL, so only the requested page is transferred.
     Args:
         db: SQLAlchemy database session
+        limit: Maximum number of subscriptions to return
+        cursor: Opaque cursor from the previous page, if any
+        filters: Optional column and price range filters
+        sort: Optional sort specification, see parse_sort; defaults to ID order
+        expand: Relationships to load with the page, see parse_expand; each costs
+            one extra query for the whole page, however many subscriptions it holds
     Returns:
-        List of Subscription objects
+        Page of Subscription objects and the cursor for the next page
     Raises:
         SQLAlchemyError: If there is a database error
+        ValueError: If the cursor or sort specification is invalid
     """
     try:
-        # Query all subscriptions from the database
-        subscriptions = db.query(Subscription).all()
-        logger.info(f"Retrieved {len(subscriptions)} subscriptions from database")
-        return subscriptions
+        statement = apply_filters(select(Subscription), filters)
+        statement = statement.options(*(selectinload(EXPANDABLE_RELATIONSHIPS[name]) for name in expand))
+
+        # Query one page of subscriptions, keyed on the sort columns and the primary key
+        page = fetch_page(db, statement, parse_sort(sort), limit, cursor)
+        logger.info("Retrieved %s subscriptions from database", len(page.items))
+        return page
     except SQLAlchemyError as e:
         # Log the error and re-raise
-        logger.error(f"Database error when retrieving subscriptions: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("Database error when retrieving subscriptions: %s", e)
+        raise
@@ -4,13 +4,14 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from models.subscription import Subscription
+from services.cache.entity_cache import get_cached, read_generation, cache_entity
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 def get_subscription_by_id(db: Session, subscription_id: int) -> Optional[Subscription]:
     """
-    Retrieve a single subscription by ID from the database.
+    Retrieve a single subscription by ID, from the entity cache when possible.
     
     Args:
         db: SQLAlchemy database session
@@ -23,22 +24,30 @@ def get_subscription_by_id(db: Session, subscription_id: int) -> Optional[Subscr
         SQLAlchemyError: If there is a database error
     """
     try:
-        # Query the subscription by ID
+        # Serve recently read or written subscriptions from the cache
+        cached = get_cached(Subscription, subscription_id)
+        if cached is not None:
+            logger.info("Retrieved subscription ID %s from cache: %s", subscription_id, cached.companyName)
+            return cached
+        
+        # Query the subscription by ID; a write committed meanwhile keeps it out of the cache
+        generation = read_generation(Subscription, subscription_id)
         subscription = db.query(Subscription).filter(Subscription.subscriptionID == subscription_id).first()
         
         if subscription:
-            logger.info(f"Retrieved subscription ID {subscription_id}: {subscription.companyName}")
+            cache_entity(subscription, generation)
+            logger.info("Retrieved subscription ID %s: %s", subscription_id, subscription.companyName)
         else:
-            logger.warning(f"Subscription with ID {subscription_id} not found")
+            logger.warning("Subscription with ID %s not found", subscription_id)
             
         return subscription
         
     except SQLAlchemyError as e:
         # Log the error and re-raise
-        logger.error(f"Database error when retrieving subscription {subscription_id}: {str(e)}")
+        logger.error("Database error when retrieving subscription %s: %s", subscription_id, e)
         raise
         
     except Exception as e:
         # Log the error and re-raise
-        logger.error(f"Unexpected error when retrieving subscription {subscription_id}: {str(e)}")
+        logger.error("Unexpected error when retrieving subscription %s: %s", subscription_id, e)
         raise ValueError(f"Error retrieving subscription: {str(e)}")
\ No newline at end of file
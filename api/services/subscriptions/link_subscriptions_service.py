@@ -0,0 +1,166 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+import logging
+from sqlalchemy import select, update, bindparam, func, or_, and_
+from sqlalchemy.orm import Session
+
+from models.subscription import Subscription
+from models.company import Company
+from models.category import Category
+from models.user import User
+from services.db.change_versions import bump_table_version
+from services.cache.entity_cache import invalidate
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+LINK_BACKFILL_BATCH_SIZE = 5000
+
+# Name column on the subscription -> (foreign key on the subscription, primary key and name of the target)
+SUBSCRIPTION_LINKS = {
+    "companyName": (Subscription.companyId, Company.companyId, Company.companyName),
+    "subscriptionCategory": (Subscription.categoryID, Category.categoryID, Category.categoryName),
+    "userName": (Subscription.userID, User.userID, User.userName)
+}
+
+def _lookup(field: str, name: Any):
+    """Scalar subquery for the lowest ID whose name matches; names are not unique."""
+    _, target_id, target_name = SUBSCRIPTION_LINKS[field]
+    return select(target_id).where(target_name == name).order_by(target_id).limit(1).scalar_subquery()
+
+def link_values(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Foreign key values for the name columns present in an insert or update.
+
+    The keys are resolved by subqueries inside the same statement, so linking
+    costs no extra round trip.
+
+    Args:
+        values: Column values being written to a subscription
+
+    Returns:
+        dict: Foreign key column name -> subquery, or None for a cleared name
+    """
+    links = {}
+    for field, (foreign_key, _, _) in SUBSCRIPTION_LINKS.items():
+        if field in values:
+            links[foreign_key.key] = None if values[field] is None else _lookup(field, values[field])
+    return links
+
+def bulk_link_values() -> Dict[str, Any]:
+    """
+    Foreign key values for a multi-row insert, resolved per row from the
+    link_<field> parameters that link_parameters() adds to each row.
+    """
+    return {
+        foreign_key.key: _lookup(field, bindparam(f"link_{field}"))
+        for field, (foreign_key, _, _) in SUBSCRIPTION_LINKS.items()
+    }
+
+def link_parameters(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add the link_<field> parameters bulk_link_values() expects to each row."""
+    return [{**row, **{f"link_{field}": row.get(field) for field in SUBSCRIPTION_LINKS}} for row in rows]
+
+def relink_subscriptions(db: Session, field: str, names: Sequence[Optional[str]], target_ids: Sequence[int] = ()) -> List[int]:
+    """
+    Re-resolve the foreign key of the subscriptions affected by a company,
+    category or user being created, renamed or deleted.
+
+    Subscriptions created before their company existed have a NULL key, and a
+    rename leaves the key pointing at a row whose name no longer matches. Every
+    subscription carrying one of the names, or pointing at one of the target
+    IDs, gets its key looked up from its name again. Only keys that change or
+    are NULL are written, in one statement inside the caller's transaction. Their cached
+    copies still hold the old key, so invalidate them once the caller commits.
+
+    Args:
+        db: SQLAlchemy database session holding the write
+        field: Name column of the link, a key of SUBSCRIPTION_LINKS
+        names: Names that were written or removed
+        target_ids: IDs of rows whose name may have changed
+
+    Returns:
+        List[int]: IDs of the subscriptions whose key changed or is NULL
+    """
+    foreign_key, _, _ = SUBSCRIPTION_LINKS[field]
+    name_column = getattr(Subscription, field)
+    names = [name for name in dict.fromkeys(names) if name is not None]
+    affected = []
+    if names:
+        affected.append(name_column.in_(names))
+    if target_ids:
+        affected.append(foreign_key.in_(list(target_ids)))
+    if not affected:
+        return []
+
+    # Deleting a target has already set its subscriptions' keys to NULL (ON DELETE
+    # SET NULL), so keys left NULL are written again too, to report those rows
+    resolved = _lookup(field, name_column)
+    statement = (
+        update(Subscription)
+        .where(or_(*affected), or_(foreign_key.is_distinct_from(resolved), foreign_key.is_(None)))
+        .values({foreign_key.key: resolved})
+        .returning(Subscription.subscriptionID)
+    )
+    relinked = list(db.scalars(statement, execution_options={"synchronize_session": False}))
+    if relinked:
+        # Expanded listings change with the links
+        bump_table_version(db, Subscription.__tablename__)
+        logger.info("Relinked %s subscriptions by %s", len(relinked), field)
+    return relinked
+
+def subscription_relinker(field: str) -> Callable[[Session, Sequence[Optional[str]], Sequence[int]], Callable[[], None]]:
+    """
+    relink_subscriptions for one link, in the shape of Repository's
+    on_names_written hook: it returns the invalidation of the relinked
+    subscriptions' cache entries, for the repository to run after commit.
+    """
+    def relink(db: Session, names: Sequence[Optional[str]], target_ids: Sequence[int] = ()) -> Callable[[], None]:
+        relinked = relink_subscriptions(db, field, names, target_ids)
+        return lambda: invalidate(Subscription, *relinked)
+    return relink
+
+def backfill_links(db: Session, batch_size: int = LINK_BACKFILL_BATCH_SIZE) -> int:
+    """
+    Resolve the foreign keys of existing subscriptions from their name columns.
+
+    Walks the table in primary key ranges and commits after each range, so
+    locks are held briefly and an interrupted run can simply be repeated. Only
+    unresolved keys are touched; names without a matching row stay NULL.
+
+    Args:
+        db: SQLAlchemy database session
+        batch_size: Width of each primary key range
+
+    Returns:
+        int: Number of subscriptions updated
+    """
+    lowest, highest = db.execute(select(func.min(Subscription.subscriptionID), func.max(Subscription.subscriptionID))).one()
+    db.commit()
+    if lowest is None:
+        return 0
+
+    # Only rows with a name but no key yet, each key filled from its name column
+    unresolved = or_(*(
+        and_(foreign_key.is_(None), getattr(Subscription, field).is_not(None))
+        for field, (foreign_key, _, _) in SUBSCRIPTION_LINKS.items()
+    ))
+    values = {
+        foreign_key.key: func.coalesce(foreign_key, _lookup(field, getattr(Subscription, field)))
+        for field, (foreign_key, _, _) in SUBSCRIPTION_LINKS.items()
+    }
+
+    updated = 0
+    for start in range(lowest, highest + 1, batch_size):
+        statement = (
+            update(Subscription)
+            .where(Subscription.subscriptionID.between(start, start + batch_size - 1), unresolved)
+            .values(**values)
+        )
+        linked = db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+        if linked:
+            # Expanded listings change with the links
+            bump_table_version(db, Subscription.__tablename__)
+        updated += linked
+        db.commit()
+        logger.info("Backfilled subscription links up to ID %s of %s", min(start + batch_size - 1, highest), highest)
+    return updated
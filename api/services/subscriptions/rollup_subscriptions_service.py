@@ -0,0 +1,259 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+from sqlalchemy import select, delete, update, func, case, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from models.subscription import Subscription
+from models.subscription_rollup import SubscriptionRollup
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Rolled up dimensions and the column each one groups by; "all" is a single global group
+ROLLUP_DIMENSIONS = {
+    "all": None,
+    "category": Subscription.subscriptionCategory,
+    "user": Subscription.userName,
+    "company": Subscription.companyName
+}
+
+# Columns a write must capture from the old and new rows to keep the rollups current
+ROLLUP_SOURCE_COLUMNS = (
+    Subscription.price,
+    Subscription.subscriptionCategory,
+    Subscription.userName,
+    Subscription.companyName
+)
+ROLLUP_SOURCE_FIELDS = frozenset(column.key for column in ROLLUP_SOURCE_COLUMNS)
+
+# Primary key of a rollup row: (dimension, key_is_null, group_key)
+RollupKey = Tuple[str, bool, str]
+
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert
+}
+
+def _rollup_keys(row: Any) -> List[RollupKey]:
+    """The rollup rows a subscription counts towards."""
+    keys = []
+    for dimension, column in ROLLUP_DIMENSIONS.items():
+        value = None if column is None else getattr(row, column.key)
+        if column is not None and value is None:
+            keys.append((dimension, True, ""))
+        else:
+            keys.append((dimension, False, value or ""))
+    return keys
+
+def _group_extreme(aggregate):
+    """
+    The minimum or maximum price of each rollup row's group, as an expression
+    over the rollup row, so one UPDATE can recompute groups of every dimension.
+    """
+    price = aggregate(Subscription.price)
+    branches = []
+    for dimension, column in ROLLUP_DIMENSIONS.items():
+        if column is None:
+            value = select(price).scalar_subquery()
+        else:
+            # Separate subqueries for the NULL group and the others, so each can use the column's index
+            value = case(
+                (SubscriptionRollup.key_is_null, select(price).where(column.is_(None)).scalar_subquery()),
+                else_=select(price).where(column == SubscriptionRollup.group_key).scalar_subquery()
+            )
+        branches.append((SubscriptionRollup.dimension == dimension, value))
+    return case(*branches)
+
+def _rollup_key_in(keys: List[RollupKey]):
+    """WHERE clause selecting the rollup rows with the given keys."""
+    return tuple_(SubscriptionRollup.dimension, SubscriptionRollup.key_is_null, SubscriptionRollup.group_key).in_(keys)
+
+def apply_rollup_changes(db: Session, added: Iterable[Any] = (), removed: Iterable[Any] = ()) -> None:
+    """
+    Fold added and removed subscriptions into the rollups.
+
+    Call inside the writing transaction, after the write itself, with rows that
+    carry price, subscriptionCategory, userName and companyName. An update is a
+    removal of the old row plus an addition of the new one. All groups are changed
+    with one upsert. Groups whose removed price was their minimum or maximum have
+    both recomputed from the subscriptions table, all in one more UPDATE, and
+    groups that drop to zero are deleted with one DELETE, so a write costs at
+    most three statements here however many groups it touches.
+
+    On PostgreSQL the existing rows of the groups are first locked with SELECT
+    ... FOR UPDATE, one more statement, in key order: concurrent writes to the
+    same groups then run one after the other, so none recomputes the extremes
+    from a snapshot that misses the other's change and overwrites its result,
+    and writes touching several groups cannot deadlock. SQLite writers already
+    hold the database's write lock.
+
+    Args:
+        db: SQLAlchemy database session holding the write
+        added: Subscriptions that now exist
+        removed: Subscriptions that no longer exist, with their old values
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+        ValueError: If the database dialect has no upsert support here
+    """
+    # key -> [count delta, total delta, added min, added max, removed min, removed max]
+    deltas: Dict[RollupKey, list] = {}
+    for rows, sign in ((added, 1), (removed, -1)):
+        for row in rows:
+            price = Decimal(str(row.price))
+            for key in _rollup_keys(row):
+                delta = deltas.setdefault(key, [0, Decimal(0), None, None, None, None])
+                delta[0] += sign
+                delta[1] += sign * price
+                low, high = (2, 3) if sign > 0 else (4, 5)
+                delta[low] = price if delta[low] is None else min(delta[low], price)
+                delta[high] = price if delta[high] is None else max(delta[high], price)
+    if not deltas:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise ValueError(f"Subscription rollups are not supported on {dialect}")
+
+    # Every write locks and upserts its groups in the same order
+    keys = sorted(deltas)
+    if dialect == "postgresql":
+        db.execute(
+            select(SubscriptionRollup.dimension)
+            .where(_rollup_key_in(keys))
+            .order_by(SubscriptionRollup.dimension, SubscriptionRollup.key_is_null, SubscriptionRollup.group_key)
+            .with_for_update()
+        )
+
+    statement = _UPSERT_INSERTS[dialect](SubscriptionRollup).values([
+        {
+            "dimension": key[0], "key_is_null": key[1], "group_key": key[2],
+            "count": deltas[key][0], "total": deltas[key][1], "minimum": deltas[key][2], "maximum": deltas[key][3]
+        }
+        for key in keys
+    ])
+    excluded = statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=[SubscriptionRollup.dimension, SubscriptionRollup.key_is_null, SubscriptionRollup.group_key],
+        set_={
+            "count": SubscriptionRollup.count + excluded.count,
+            "total": SubscriptionRollup.total + excluded.total,
+            "minimum": case(
+                (excluded.minimum.is_(None), SubscriptionRollup.minimum),
+                (SubscriptionRollup.minimum.is_(None), excluded.minimum),
+                (excluded.minimum < SubscriptionRollup.minimum, excluded.minimum),
+                else_=SubscriptionRollup.minimum
+            ),
+            "maximum": case(
+                (excluded.maximum.is_(None), SubscriptionRollup.maximum),
+                (SubscriptionRollup.maximum.is_(None), excluded.maximum),
+                (excluded.maximum > SubscriptionRollup.maximum, excluded.maximum),
+                else_=SubscriptionRollup.maximum
+            )
+        }
+    ).returning(
+        SubscriptionRollup.dimension, SubscriptionRollup.key_is_null, SubscriptionRollup.group_key,
+        SubscriptionRollup.count, SubscriptionRollup.minimum, SubscriptionRollup.maximum
+    )
+
+    emptied, stale = [], []
+    for row in db.execute(statement):
+        key = (row.dimension, bool(row.key_is_null), row.group_key)
+        removed_min, removed_max = deltas[key][4], deltas[key][5]
+        if row.count <= 0:
+            emptied.append(key)
+        elif removed_min is not None and (row.minimum is None or removed_min <= row.minimum or removed_max >= row.maximum):
+            # The removed price may have been the group's extreme, so look at what is left
+            stale.append(key)
+
+    if stale:
+        db.execute(
+            update(SubscriptionRollup)
+            .where(_rollup_key_in(stale))
+            .values(minimum=_group_extreme(func.min), maximum=_group_extreme(func.max)),
+            execution_options={"synchronize_session": False}
+        )
+
+    if emptied:
+        db.execute(
+            delete(SubscriptionRollup).where(_rollup_key_in(emptied)),
+            execution_options={"synchronize_session": False}
+        )
+
+def compute_rollups(db: Session) -> Dict[RollupKey, Tuple[int, Decimal, Optional[Decimal], Optional[Decimal]]]:
+    """
+    Aggregate the subscriptions table the slow way, one GROUP BY per dimension.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        dict: Rollup key -> (count, total, minimum, maximum) for every non-empty group
+    """
+    aggregates = (
+        func.count(),
+        func.coalesce(func.sum(Subscription.price), 0),
+        func.min(Subscription.price),
+        func.max(Subscription.price)
+    )
+    rollups = {}
+    for dimension, column in ROLLUP_DIMENSIONS.items():
+        if column is None:
+            statement = select(*aggregates)
+        else:
+            statement = select(column, *aggregates).group_by(column)
+        for row in db.execute(statement):
+            if column is None:
+                key, values = (dimension, False, ""), tuple(row)
+            else:
+                key, values = (dimension, row[0] is None, row[0] or ""), tuple(row[1:])
+            if values[0]:
+                rollups[key] = (values[0], Decimal(values[1]), values[2], values[3])
+    return rollups
+
+def rebuild_rollups(db: Session) -> int:
+    """
+    Replace the rollups with a fresh aggregation of the subscriptions table.
+    The caller commits.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    rollups = compute_rollups(db)
+    db.execute(delete(SubscriptionRollup), execution_options={"synchronize_session": False})
+    if rollups:
+        db.execute(SubscriptionRollup.__table__.insert(), [
+            {
+                "dimension": key[0], "key_is_null": key[1], "group_key": key[2],
+                "count": count, "total": total, "minimum": minimum, "maximum": maximum
+            }
+            for key, (count, total, minimum, maximum) in rollups.items()
+        ])
+    logger.info("Rebuilt %s subscription rollups", len(rollups))
+    return len(rollups)
+
+def verify_rollups(db: Session) -> List[str]:
+    """
+    Compare the rollups with a fresh aggregation of the subscriptions table.
+
+    Args:
+        db: SQLAlchemy database session
+
+    Returns:
+        List of human-readable differences; empty when the rollups are correct
+    """
+    expected = compute_rollups(db)
+    stored = {
+        (row.dimension, bool(row.key_is_null), row.group_key): (row.count, Decimal(row.total), row.minimum, row.maximum)
+        for row in db.scalars(select(SubscriptionRollup))
+    }
+    differences = []
+    for key in sorted(expected.keys() | stored.keys()):
+        if expected.get(key) != stored.get(key):
+            differences.append(f"{key}: expected {expected.get(key)}, stored {stored.get(key)}")
+    return differences
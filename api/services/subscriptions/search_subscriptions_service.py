@@ -0,0 +1,206 @@
+import re
+import logging
+from typing import List, Optional
+from sqlalchemy import select, func, column, table, literal_column, text, Float, Integer
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription
+from services.db.pagination import Page, SortKey, fetch_page, DEFAULT_PAGE_SIZE
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Words a search may contain; each one is a term of the full-text query
+MAX_SEARCH_TERMS = 16
+_WORD = re.compile(r"[^\W_]+")
+
+# PostgreSQL: a generated tsvector column, weighted A (company), B (category), C (description)
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+_POSTGRESQL_DDL = (
+    f"""ALTER TABLE subscriptions ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("companyName", '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce("subscriptionCategory", '')), 'B') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')
+    ) STORED""",
+    f"CREATE INDEX IF NOT EXISTS ix_subscriptions_{SEARCH_VECTOR_COLUMN} ON subscriptions USING GIN ({SEARCH_VECTOR_COLUMN})",
+)
+
+# SQLite: an FTS5 index over the same columns, reading their text from the subscriptions
+# table and kept current by triggers; bm25 weights follow the PostgreSQL ones
+SEARCH_TABLE = "subscriptions_fts"
+_BM25_WEIGHTS = (5.0, 2.0, 1.0)
+_SQLITE_DDL = (
+    f"""CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5(
+        "companyName", "subscriptionCategory", description,
+        content='subscriptions', content_rowid='subscriptionID', tokenize='porter unicode61'
+    )""",
+    f"""CREATE TRIGGER {SEARCH_TABLE}_insert AFTER INSERT ON subscriptions BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, "companyName", "subscriptionCategory", description)
+        VALUES (new."subscriptionID", new."companyName", new."subscriptionCategory", new.description);
+    END""",
+    f"""CREATE TRIGGER {SEARCH_TABLE}_delete AFTER DELETE ON subscriptions BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, "companyName", "subscriptionCategory", description)
+        VALUES ('delete', old."subscriptionID", old."companyName", old."subscriptionCategory", old.description);
+    END""",
+    f"""CREATE TRIGGER {SEARCH_TABLE}_update AFTER UPDATE OF "companyName", "subscriptionCategory", description ON subscriptions BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, "companyName", "subscriptionCategory", description)
+        VALUES ('delete', old."subscriptionID", old."companyName", old."subscriptionCategory", old.description);
+        INSERT INTO {SEARCH_TABLE}(rowid, "companyName", "subscriptionCategory", description)
+        VALUES (new."subscriptionID", new."companyName", new."subscriptionCategory", new.description);
+    END""",
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')",
+)
+
+_search_table = table(SEARCH_TABLE, column("rowid", Integer), column(SEARCH_TABLE))
+
+def parse_search_terms(query: str) -> List[str]:
+    """
+    Split a search into the words it is matched on, dropping punctuation.
+
+    Only letters and digits reach the full-text query, so nothing a user types
+    is read as tsquery or FTS5 query syntax.
+
+    Args:
+        query: Search text, e.g. "that streaming thing"
+
+    Returns:
+        List of distinct lowercase words, in the order given
+
+    Raises:
+        ValueError: If the search has no words or too many
+    """
+    terms = list(dict.fromkeys(word.lower() for word in _WORD.findall(query)))
+    if not terms:
+        raise ValueError("Search query must contain at least one letter or digit")
+    if len(terms) > MAX_SEARCH_TERMS:
+        raise ValueError(f"Search query has {len(terms)} words; at most {MAX_SEARCH_TERMS} are allowed")
+    return terms
+
+def _postgresql_search(terms: List[str], match_all: bool) -> tuple:
+    """WHERE clause and rank of a search against the generated tsvector column."""
+    query = func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), (" & " if match_all else " | ").join(terms))
+    vector = literal_column(f"{Subscription.__tablename__}.{SEARCH_VECTOR_COLUMN}", TSVECTOR)
+    # ts_rank is a real; as double precision the cursor's value round-trips exactly
+    rank = func.ts_rank(vector, query).cast(Float)
+    return vector.op("@@")(query), rank
+
+def _sqlite_search(terms: List[str], match_all: bool) -> tuple:
+    """WHERE clause and rank of a search against the FTS5 table."""
+    query = (" AND " if match_all else " OR ").join(f'"{term}"' for term in terms)
+    # bm25 is negative, more so for better matches, so it sorts ascending
+    rank = func.bm25(literal_column(SEARCH_TABLE), *_BM25_WEIGHTS, type_=Float)
+    return _search_table.c[SEARCH_TABLE].match(query), rank
+
+def search_subscriptions(
+    db: Session,
+    query: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    match_all: bool = False
+) -> Page:
+    """
+    Retrieve one page of the subscriptions matching a full-text search of
+    their company name, category and description, best match first.
+
+    Words are stemmed, so "streaming" also finds "streams". A match in the
+    company name ranks above one in the category, which ranks above one in the
+    description. On PostgreSQL the search uses the GIN index on the generated
+    search_vector column and English stop words such as "that" are ignored; on
+    SQLite it uses the subscriptions_fts FTS5 table. Both are created by
+    create_search_index.
+
+    Args:
+        db: SQLAlchemy database session
+        query: Search text
+        limit: Maximum number of subscriptions to return
+        cursor: Opaque cursor from the previous page, if any
+        match_all: Only return subscriptions containing every word, instead of any word
+            with those containing more of them ranked first
+
+    Returns:
+        Page of Subscription objects and the cursor for the next page
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+        ValueError: If the search, the cursor or the database backend is not supported
+    """
+    terms = parse_search_terms(query)
+    dialect = db.get_bind().dialect.name
+    try:
+        if dialect == "postgresql":
+            matches, rank = _postgresql_search(terms, match_all)
+            statement = select(Subscription).where(matches)
+            keys: List[SortKey] = [(rank, True)]
+        elif dialect == "sqlite":
+            matches, rank = _sqlite_search(terms, match_all)
+            statement = select(Subscription).join(_search_table, _search_table.c.rowid == Subscription.subscriptionID).where(matches)
+            keys = [(rank, False)]
+        else:
+            raise ValueError(f"Full-text search is not supported on {dialect}")
+        keys.append((Subscription.subscriptionID, False))
+
+        # Ranked on the relevance, with the primary key breaking ties for keyset pagination
+        page = fetch_page(db, statement, keys, limit, cursor)
+        logger.info("Found %s subscriptions matching %s", len(page.items), terms)
+        return page
+    except SQLAlchemyError as e:
+        # Log the error and re-raise
+        logger.error("Database error when searching subscriptions: %s", e)
+        raise
+
+def create_search_index(engine: Engine) -> bool:
+    """
+    Create the full-text search index of the subscriptions table unless it exists.
+
+    On PostgreSQL this adds the generated search_vector column and its GIN
+    index; adding the column rewrites the table once. On SQLite it creates the
+    subscriptions_fts FTS5 table, the triggers keeping it in step with every
+    insert, update and delete, and indexes the existing subscriptions.
+
+    Args:
+        engine: Engine of the database holding the subscriptions table
+
+    Returns:
+        bool: True if the index was created, False if it already existed
+
+    Raises:
+        ValueError: If the database backend is not supported
+    """
+    dialect = engine.dialect.name
+    with engine.begin() as conn:
+        if dialect == "postgresql":
+            exists = conn.scalar(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = 'subscriptions' AND column_name = :name"
+                ),
+                {"name": SEARCH_VECTOR_COLUMN}
+            )
+            # Both statements are IF NOT EXISTS, so a missing index is added to an existing column
+            for statement in _POSTGRESQL_DDL:
+                conn.exec_driver_sql(statement)
+        elif dialect == "sqlite":
+            exists = conn.scalar(text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": SEARCH_TABLE})
+            if not exists:
+                for statement in _SQLITE_DDL:
+                    conn.exec_driver_sql(statement)
+        else:
+            raise ValueError(f"Full-text search is not supported on {dialect}")
+    if exists:
+        return False
+    logger.info("Created the subscription search index")
+    return True
+
+def drop_search_index(engine: Engine) -> None:
+    """
+    Drop the SQLite FTS5 table, which dropping the subscriptions table leaves
+    behind; PostgreSQL's search column and index go with the table.
+    """
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
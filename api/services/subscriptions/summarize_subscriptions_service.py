@@ -0,0 +1,137 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional
+import logging
+from sqlalchemy import select, func, Numeric
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.subscription import Subscription, SubscriptionFilter
+from models.subscription_rollup import SubscriptionRollup
+from services.subscriptions.get_all_subscriptions_service import apply_filters
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Columns the summary can be grouped by, each backed by a (column, subscriptionID) index
+SUMMARY_DIMENSIONS = {
+    "category": Subscription.subscriptionCategory,
+    "user": Subscription.userName,
+    "company": Subscription.companyName
+}
+
+def _aggregates() -> list:
+    """Aggregate columns computed on the DECIMAL price, so sums are exact."""
+    return [
+        func.count().label("count"),
+        func.coalesce(func.sum(Subscription.price), 0).label("total"),
+        func.round(func.avg(Subscription.price), 2).cast(Numeric(10, 2)).label("average"),
+        func.min(Subscription.price).label("minimum"),
+        func.max(Subscription.price).label("maximum")
+    ]
+
+def _use_rollups(filters: Optional[SubscriptionFilter], live: bool) -> bool:
+    """Rollups hold unfiltered totals only, so any filter needs live aggregation."""
+    return not live and (filters is None or not filters.model_dump(exclude_none=True))
+
+def _rollup_summary(rollup: Optional[SubscriptionRollup]) -> Dict:
+    """Shape a rollup row like a live aggregate; None stands for an empty group."""
+    if rollup is None:
+        return {"count": 0, "total": Decimal("0.00"), "average": None, "minimum": None, "maximum": None}
+    total = Decimal(rollup.total)
+    return {
+        "count": rollup.count,
+        "total": total,
+        "average": (total / rollup.count).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+        "minimum": rollup.minimum,
+        "maximum": rollup.maximum
+    }
+
+def summarize_subscriptions(db: Session, filters: Optional[SubscriptionFilter] = None, live: bool = False) -> Dict:
+    """
+    Aggregate spend over all subscriptions.
+
+    Without filters this is a single primary key lookup in the rollups; with
+    filters, or when live is set, the subscriptions table is aggregated directly.
+
+    Args:
+        db: SQLAlchemy database session
+        filters: Optional column and price range filters
+        live: Aggregate the subscriptions table even when rollups could be used
+
+    Returns:
+        dict: count, total, average, minimum and maximum
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+    """
+    try:
+        if _use_rollups(filters, live):
+            summary = _rollup_summary(db.get(SubscriptionRollup, ("all", False, "")))
+            logger.info("Summarized %s subscriptions from rollups", summary['count'])
+            return summary
+        
+        statement = apply_filters(select(*_aggregates()), filters)
+        summary = db.execute(statement).one()._asdict()
+        logger.info("Summarized %s subscriptions", summary['count'])
+        return summary
+    except SQLAlchemyError as e:
+        # Log the error and re-raise
+        logger.error("Database error when summarizing subscriptions: %s", e)
+        raise
+
+def summarize_subscriptions_by(
+    db: Session,
+    dimension: str,
+    filters: Optional[SubscriptionFilter] = None,
+    live: bool = False
+) -> List[Dict]:
+    """
+    Aggregate spend per category, user or company.
+
+    Only one row per group leaves the database, highest total first. Without
+    filters the groups are read from the rollups; with filters, or when live is
+    set, they are computed with GROUP BY over the subscriptions table.
+
+    Args:
+        db: SQLAlchemy database session
+        dimension: One of SUMMARY_DIMENSIONS
+        filters: Optional column and price range filters
+        live: Aggregate the subscriptions table even when rollups could be used
+
+    Returns:
+        List of dicts with the group key and its count, total, average, minimum and maximum
+
+    Raises:
+        SQLAlchemyError: If there is a database error
+        ValueError: If the dimension is unknown
+    """
+    if dimension not in SUMMARY_DIMENSIONS:
+        raise ValueError(f"Cannot summarize by '{dimension}'. Dimensions: {', '.join(SUMMARY_DIMENSIONS)}")
+
+    try:
+        if _use_rollups(filters, live):
+            statement = (
+                select(SubscriptionRollup)
+                .where(SubscriptionRollup.dimension == dimension)
+                .order_by(SubscriptionRollup.total.desc(), SubscriptionRollup.key_is_null, SubscriptionRollup.group_key)
+            )
+            groups = [
+                {"key": None if rollup.key_is_null else rollup.group_key, **_rollup_summary(rollup)}
+                for rollup in db.scalars(statement)
+            ]
+            logger.info("Read %s subscription groups by %s from rollups", len(groups), dimension)
+            return groups
+        
+        column = SUMMARY_DIMENSIONS[dimension]
+        statement = (
+            apply_filters(select(column.label("key"), *_aggregates()), filters)
+            .group_by(column)
+            .order_by(func.sum(Subscription.price).desc(), column.asc().nulls_last())
+        )
+        groups = [row._asdict() for row in db.execute(statement)]
+        logger.info("Summarized subscriptions into %s groups by %s", len(groups), dimension)
+        return groups
+    except SQLAlchemyError as e:
+        # Log the error and re-raise
+        logger.error("Database error when summarizing subscriptions by %s: %s", dimension, e)
+        raise
@@ -1,9 +1,14 @@
 from typing import Optional, Dict, Any
 import logging
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from models.subscription import Subscription, SubscriptionUpdate
+from services.cache.entity_cache import cache_entity, invalidate
+from services.db.change_versions import bump_table_version
+from services.subscriptions.rollup_subscriptions_service import apply_rollup_changes, ROLLUP_SOURCE_COLUMNS, ROLLUP_SOURCE_FIELDS
+from services.subscriptions.link_subscriptions_service import link_values
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -26,46 +31,82 @@ def update_subscription(db: Session, subscription_id: int, subscription_data: Su
         ValueError: If the subscription data is invalid
     """
     try:
-        # Query the subscription by ID
-        db_subscription = db.query(Subscription).filter(Subscription.subscriptionID == subscription_id).first()
+        # Update subscription data if provided
+        update_data = subscription_data.model_dump(exclude_unset=True)
+        
+        if not update_data:
+            # Nothing to write, so just read the current row
+            db_subscription = db.get(Subscription, subscription_id)
+            if not db_subscription:
+                logger.warning("Subscription with ID %s not found for update", subscription_id)
+                return None
+            logger.info("No changes provided for subscription ID %s", subscription_id)
+            return db_subscription
+        
+        # Lock and read the old values the rollups need, only when the update touches them
+        old_values = None
+        if ROLLUP_SOURCE_FIELDS & update_data.keys():
+            old_values = db.execute(
+                select(*ROLLUP_SOURCE_COLUMNS)
+                .where(Subscription.subscriptionID == subscription_id)
+                .with_for_update()
+            ).one_or_none()
+            if old_values is None:
+                logger.warning("Subscription with ID %s not found for update", subscription_id)
+                invalidate(Subscription, subscription_id)
+                return None
+        
+        # Update, relink renamed company, category or user, and read back the row
+        # in a single UPDATE ... RETURNING statement
+        statement = (
+            update(Subscription)
+            .where(Subscription.subscriptionID == subscription_id)
+            .values(**update_data, **link_values(update_data))
+            .returning(Subscription)
+        )
+        # populate_existing, so a subscription already loaded in this session takes the new values
+        # instead of keeping the old ones, which the rollup comparison below would then see
+        db_subscription = db.scalars(
+            statement, execution_options={"synchronize_session": False, "populate_existing": True}
+        ).one_or_none()
         
         # Return None if subscription not found
         if not db_subscription:
-            logger.warning(f"Subscription with ID {subscription_id} not found for update")
+            logger.warning("Subscription with ID %s not found for update", subscription_id)
+            invalidate(Subscription, subscription_id)
             return None
         
-        # Update subscription data if provided
-        update_data = subscription_data.dict(exclude_unset=True)
+        # Move the subscription between rollup groups, or adjust its price within them
+        if old_values is not None:
+            new_values = tuple(getattr(db_subscription, column.key) for column in ROLLUP_SOURCE_COLUMNS)
+            if tuple(old_values) != new_values:
+                apply_rollup_changes(db, added=[db_subscription], removed=[old_values])
+        
+        # Record the change for conditional GETs and commit it to the database
+        bump_table_version(db, Subscription.__tablename__)
+        db.commit()
+        
+        # Replace the cached copy with the committed row
+        cache_entity(db_subscription)
         
-        if update_data:               
-            for key, value in update_data.items():
-                setattr(db_subscription, key, value)
-                
-            # Commit changes to database
-            db.commit()
-            db.refresh(db_subscription)
-            
-            logger.info(f"Updated subscription ID {subscription_id}: {db_subscription.companyName}")
-        else:
-            logger.info(f"No changes provided for subscription ID {subscription_id}")
-            
+        logger.info("Updated subscription ID %s: %s", subscription_id, db_subscription.companyName)
         return db_subscription
         
     except IntegrityError as e:
         # Roll back the session in case of integrity error
         db.rollback()
-        logger.error(f"Integrity error when updating subscription {subscription_id}: {str(e)}")
+        logger.error("Integrity error when updating subscription %s: %s", subscription_id, e)
         raise
         
     except SQLAlchemyError as e:
         # Roll back the session in case of database error
         db.rollback()
-        logger.error(f"Database error when updating subscription {subscription_id}: {str(e)}")
+        logger.error("Database error when updating subscription %s: %s", subscription_id, e)
         raise
         
     except Exception as e:
         # Roll back the session in case of any other error
         db.rollback()
-        logger.error(f"Unexpected error when updating subscription {subscription_id}: {str(e)}")
+        logger.error("Unexpected error when updating subscription %s: %s", subscription_id, e)
         raise ValueError(f"Error updating subscription: {str(e)}")
 
@@ -0,0 +1,10 @@
+from models.user import User
+from services.db.repository import Repository
+from services.subscriptions.link_subscriptions_service import subscription_relinker
+
+# Create, read, update and delete for the users table
+user_repository = Repository(
+    User, User.userID, User.userName, "user", "users",
+    # Subscriptions refer to user rows by userName, so keep their foreign keys in step
+    on_names_written=subscription_relinker("userName")
+)
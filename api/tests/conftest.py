@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+# The API modules import each other from the api directory, as when run from there
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from init_db import Base
+from services.cache.cache_backend import NullCache, TTLLRUCache
+from services.cache import entity_cache
+from services.db.config import load_config
+from services.db.connect_to_db import engines
+from services.db.sqlite_engine import configure_sqlite
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A SQLite database file with the full schema, configured like the app's."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'subscriptions.db'}")
+    configure_sqlite(engine, {**load_config(), "backend": "sqlite"})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine, monkeypatch):
+    """A session on the test database like the app's, with the entity cache switched off."""
+    monkeypatch.setattr(entity_cache, "_cache", NullCache())
+    with Session(engine, autoflush=False, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    """A list collecting the SQL of every statement executed on the test database."""
+    executed = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """An in-process entity cache in place of the one db switches off; request it after db."""
+    cache = TTLLRUCache(max_entries=100, ttl_seconds=60)
+    monkeypatch.setattr(entity_cache, "_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """
+    The app on its own SQLite database set up by init_db.py, with route statement
+    budgets enforced: a request over its budget fails the test.
+    """
+    monkeypatch.setenv("DB_BACKEND", "sqlite")
+    monkeypatch.setenv("DB_SQLITE_PATH", str(tmp_path / "api.db"))
+    monkeypatch.setenv("DB_STATEMENT_BUDGET_MODE", "raise")
+    monkeypatch.setattr(entity_cache, "_cache", None)
+    # Forget engines and configuration left by another test's database
+    engines.__init__()
+    import init_db
+    from main import app
+    init_db.create_tables()
+    yield TestClient(app)
+    engines.engine().dispose()
+    engines.__init__()
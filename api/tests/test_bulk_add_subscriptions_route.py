@@ -0,0 +1,43 @@
+def subscription(name, price=5):
+    return {"companyName": name, "price": price}
+
+
+def test_bulk_create_returns_the_created_subscriptions_in_request_order(client):
+    response = client.post("/subscriptions/bulk?batch_size=2", json=[subscription(f"Company {i}", i + 1) for i in range(5)])
+    assert response.status_code == 201
+    body = response.json()
+    assert [item["companyName"] for item in body["created"]] == [f"Company {i}" for i in range(5)]
+    assert len({item["subscriptionID"] for item in body["created"]}) == 5
+    assert body["errors"] == []
+
+    listed = client.get("/subscriptions/", params={"limit": 10}).json()
+    assert sorted(item["name"] for item in listed) == [f"Company {i}" for i in range(5)]
+
+
+def test_bulk_create_reports_invalid_items_by_index_and_creates_the_rest(client):
+    response = client.post("/subscriptions/bulk", json=[subscription("Acme"), {"price": 5}, subscription("Globex", "free")])
+    assert response.status_code == 207
+    body = response.json()
+    assert [item["companyName"] for item in body["created"]] == ["Acme"]
+    assert [error["index"] for error in body["errors"]] == [1, 2]
+
+
+def test_bulk_create_with_no_valid_item_creates_nothing(client):
+    response = client.post("/subscriptions/bulk", json=[{"price": 5}, "not an object"])
+    assert response.status_code == 422
+    assert [error["index"] for error in response.json()["detail"]] == [0, 1]
+    assert client.get("/subscriptions/").json() == []
+
+
+def test_bulk_create_rejects_too_many_items_and_bad_batch_sizes(client, monkeypatch):
+    from routes.subscriptions import bulk_add_subscriptions_route
+    monkeypatch.setattr(bulk_add_subscriptions_route, "MAX_BULK_ITEMS", 2)
+    assert client.post("/subscriptions/bulk", json=[subscription("A"), subscription("B"), subscription("C")]).status_code == 400
+    assert client.post("/subscriptions/bulk?batch_size=0", json=[subscription("A")]).status_code == 422
+    assert client.get("/subscriptions/").json() == []
+
+
+def test_bulk_created_subscriptions_are_counted_in_the_summary(client):
+    client.post("/subscriptions/bulk", json=[subscription("Acme", 2), subscription("Acme", 3)])
+    summary = client.get("/subscriptions/summary").json()
+    assert summary["count"] == 2
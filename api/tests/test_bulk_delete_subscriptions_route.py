@@ -0,0 +1,33 @@
+def create(client, count):
+    created = client.post("/subscriptions/bulk", json=[{"companyName": f"Company {i}", "price": i + 1} for i in range(count)])
+    return [item["subscriptionID"] for item in created.json()["created"]]
+
+
+def test_bulk_delete_by_query_reports_deleted_and_missing_ids_in_request_order(client):
+    ids = create(client, 4)
+    response = client.delete("/subscriptions/", params={"ids": f"{ids[2]},999,{ids[0]}"})
+    assert response.status_code == 200
+    assert response.json() == {"deleted": [ids[2], ids[0]], "missing": [999]}
+    assert sorted(item["id"] for item in client.get("/subscriptions/").json()) == [ids[1], ids[3]]
+
+
+def test_bulk_delete_accepts_repeated_ids_parameters_and_duplicates(client):
+    ids = create(client, 3)
+    response = client.delete(f"/subscriptions/?ids={ids[0]}&ids={ids[1]},{ids[0]}")
+    assert response.json() == {"deleted": [ids[0], ids[1]], "missing": []}
+
+
+def test_bulk_delete_by_body_removes_rows_from_the_cache_and_the_summary(client):
+    ids = create(client, 3)
+    assert client.get(f"/subscriptions/{ids[0]}").status_code == 200
+
+    response = client.post("/subscriptions/bulk-delete", json={"ids": ids[:2]})
+    assert response.json() == {"deleted": ids[:2], "missing": []}
+    assert client.get(f"/subscriptions/{ids[0]}").status_code == 404
+    assert client.get("/subscriptions/summary").json()["count"] == 1
+
+
+def test_bulk_delete_rejects_bad_id_lists(client):
+    assert client.delete("/subscriptions/", params={"ids": "1,two"}).status_code == 400
+    assert client.delete("/subscriptions/", params={"ids": ","}).status_code == 400
+    assert client.post("/subscriptions/bulk-delete", json={"ids": []}).status_code == 422
@@ -0,0 +1,100 @@
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from middleware.compression_middleware import CompressionMiddleware, negotiate_encoding
+from services.db.config import load_config
+
+ROWS = [{"id": i, "name": f"Subscription {i}"} for i in range(200)]
+
+
+def rows(request):
+    return JSONResponse(ROWS)
+
+
+def small(request):
+    return JSONResponse({"status": "healthy"})
+
+
+def image(request):
+    return Response(b"\x89PNG" + bytes(4096), media_type="image/png")
+
+
+def not_modified(request):
+    return Response(status_code=304, headers={"ETag": 'W/"1"'})
+
+
+def stream(request):
+    async def lines():
+        for row in ROWS:
+            yield json.dumps(row) + "\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route(f"/{view.__name__}", view) for view in (rows, small, image, not_modified, stream)])
+    config = {**load_config(), "compression_encodings": ["gzip"], "compression_min_size": 1024}
+    client = TestClient(CompressionMiddleware(app, config))
+    # Requests carry only the Accept-Encoding each test gives
+    del client.headers["accept-encoding"]
+    return client
+
+
+def get(client, path, accept_encoding=None):
+    return client.get(path, headers={"Accept-Encoding": accept_encoding} if accept_encoding else {})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", "gzip"),
+    ("br;q=1, gzip;q=0.5", "br"),
+    ("gzip;q=0.5, br;q=0.5", "br"),
+    ("*", "zstd"),
+    ("*;q=0.1, zstd;q=0", "br"),
+    ("gzip;q=0", None),
+    ("gzip;q=abc", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiation_picks_the_highest_q_with_ties_to_the_server_preference(header, expected):
+    assert negotiate_encoding(header, ["zstd", "br", "gzip"]) == expected
+
+
+def test_large_json_is_compressed_with_length_timing_and_vary(client):
+    response = get(client, "/rows", "gzip")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert "compress;dur=" in response.headers["Server-Timing"]
+    assert int(response.headers["Content-Length"]) < len(json.dumps(ROWS))
+    assert response.json() == ROWS
+
+
+@pytest.mark.parametrize("path, accept_encoding", [("/small", "gzip"), ("/rows", None), ("/rows", "br"), ("/stream", None)])
+def test_uncompressed_responses_of_compressible_types_still_vary_on_accept_encoding(client, path, accept_encoding):
+    response = get(client, path, accept_encoding)
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_other_media_types_and_304s_pass_through_untouched(client):
+    response = get(client, "/image", "gzip")
+    assert "Content-Encoding" not in response.headers
+    assert "Vary" not in response.headers
+    assert len(response.content) == 4100
+
+    response = get(client, "/not_modified", "gzip")
+    assert response.status_code == 304
+    assert "Content-Encoding" not in response.headers
+
+
+def test_streams_are_compressed_chunk_by_chunk(client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    assert [json.loads(line) for line in gzip.decompress(raw).splitlines()] == ROWS
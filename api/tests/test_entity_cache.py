@@ -0,0 +1,49 @@
+from sqlalchemy import event
+
+from models.subscription import Subscription, SubscriptionCreate
+from services.cache.entity_cache import cache_entity, get_cached, invalidate, read_generation
+from services.subscriptions.add_subscription_service import add_subscription
+from services.subscriptions.get_subscription_by_id_service import get_subscription_by_id
+
+
+def subscription(subscription_id, price):
+    return Subscription(subscriptionID=subscription_id, companyName="Acme", price=price)
+
+
+def test_a_read_invalidated_while_in_flight_is_not_cached(cache):
+    generation = read_generation(Subscription, 1)
+    invalidate(Subscription, 1)
+    cache_entity(subscription(1, 5), generation)
+    assert get_cached(Subscription, 1) is None
+
+
+def test_a_read_is_cached_when_nothing_was_written_meanwhile(cache):
+    invalidate(Subscription, 2)
+    generation = read_generation(Subscription, 1)
+    cache_entity(subscription(1, 5), generation)
+    assert get_cached(Subscription, 1).price == 5
+
+
+def test_a_stale_read_does_not_overwrite_what_a_writer_cached(cache):
+    generation = read_generation(Subscription, 1)
+    cache_entity(subscription(1, 9))
+    cache_entity(subscription(1, 5), generation)
+    assert get_cached(Subscription, 1).price == 9
+
+
+def test_get_by_id_does_not_cache_a_row_invalidated_during_its_query(db, engine, cache):
+    added = add_subscription(db, SubscriptionCreate(companyName="Acme", price=5))
+    invalidate(Subscription, added.subscriptionID)
+
+    # A writer commits and invalidates between the reader's SELECT and its cache write
+    def concurrent_write(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "FROM subscriptions" in statement:
+            invalidate(Subscription, added.subscriptionID)
+
+    event.listen(engine, "after_cursor_execute", concurrent_write)
+    assert get_subscription_by_id(db, added.subscriptionID) is not None
+    event.remove(engine, "after_cursor_execute", concurrent_write)
+    assert get_cached(Subscription, added.subscriptionID) is None
+
+    assert get_subscription_by_id(db, added.subscriptionID) is not None
+    assert get_cached(Subscription, added.subscriptionID) is not None
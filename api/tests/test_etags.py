@@ -0,0 +1,63 @@
+import pytest
+
+
+def revalidate(client, path, etag):
+    return client.get(path, headers={"If-None-Match": etag})
+
+
+@pytest.mark.parametrize("path", ["/subscriptions/", "/subscriptions/summary", "/subscriptions/search?q=acme", "/companies/"])
+def test_list_etags_answer_304_until_a_write_changes_them(client, path):
+    client.post("/subscriptions/", json={"companyName": "Acme", "price": 5})
+    client.post("/companies/", json={"companyName": "Acme"})
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    unchanged = revalidate(client, path, etag)
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+
+    client.post("/subscriptions/", json={"companyName": "Acme Two", "price": 7})
+    client.post("/companies/", json={"companyName": "Acme Two"})
+    changed = revalidate(client, path, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_if_none_match_uses_weak_comparison_lists_and_star(client):
+    etag = client.get("/subscriptions/").headers["ETag"]
+    strong = etag.removeprefix("W/")
+    assert revalidate(client, "/subscriptions/", strong).status_code == 304
+    assert revalidate(client, "/subscriptions/", f'"other", {etag}').status_code == 304
+    assert revalidate(client, "/subscriptions/", "*").status_code == 304
+    assert revalidate(client, "/subscriptions/", '"other"').status_code == 200
+
+
+@pytest.mark.parametrize("collection, body, change", [
+    ("subscriptions", {"companyName": "Acme", "price": 5}, {"price": 6}),
+    ("companies", {"companyName": "Acme"}, {"companyName": "Acme Inc."}),
+])
+def test_detail_etags_follow_the_body_served_from_the_cache(client, collection, body, change):
+    created = client.post(f"/{collection}/", json=body).json()
+    entity_id = created.get("subscriptionID") or created.get("companyId")
+    path = f"/{collection}/{entity_id}"
+
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    # Served from the cache filled by the create, so the row is not read
+    assert first.headers["X-DB-Statements"] == "0"
+    assert revalidate(client, path, etag).status_code == 304
+
+    client.put(path, json=change)
+    updated = revalidate(client, path, etag)
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] != etag
+    assert revalidate(client, path, updated.headers["ETag"]).status_code == 304
+
+
+def test_missing_detail_is_404_without_etag(client):
+    response = client.get("/subscriptions/12345", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
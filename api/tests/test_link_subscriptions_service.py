@@ -0,0 +1,42 @@
+from sqlalchemy.orm import Session
+
+from models.company import CompanyCreate, CompanyUpdate
+from models.subscription import SubscriptionCreate
+from services.companies.company_repository import company_repository
+from services.subscriptions.add_subscription_service import add_subscription
+from services.subscriptions.get_subscription_by_id_service import get_subscription_by_id
+
+
+def linked_company(engine, subscription_id):
+    """companyId of a subscription as a new request would read it."""
+    with Session(engine, expire_on_commit=False) as session:
+        return get_subscription_by_id(session, subscription_id).companyId
+
+
+def test_creating_renaming_and_deleting_a_company_relinks_cached_subscriptions(db, engine, cache):
+    subscription = add_subscription(db, SubscriptionCreate(companyName="Zeta", price=5))
+    assert linked_company(engine, subscription.subscriptionID) is None
+
+    # The subscription is now cached without a company; creating one links it
+    company = company_repository.add(db, CompanyCreate(companyName="Zeta"))
+    assert linked_company(engine, subscription.subscriptionID) == company.companyId
+
+    # Renaming the company unlinks the subscriptions still carrying the old name
+    company_repository.update(db, company.companyId, CompanyUpdate(companyName="Zeta Corp"))
+    assert linked_company(engine, subscription.subscriptionID) is None
+
+    company_repository.update(db, company.companyId, CompanyUpdate(companyName="Zeta"))
+    assert linked_company(engine, subscription.subscriptionID) == company.companyId
+
+    assert company_repository.delete(db, company.companyId) == (True, None)
+    assert linked_company(engine, subscription.subscriptionID) is None
+
+
+def test_a_name_shared_by_two_companies_links_to_the_lowest_id(db, engine, cache):
+    first = company_repository.add(db, CompanyCreate(companyName="Acme"))
+    second = company_repository.add(db, CompanyCreate(companyName="Acme"))
+    subscription = add_subscription(db, SubscriptionCreate(companyName="Acme", price=5))
+    assert linked_company(engine, subscription.subscriptionID) == first.companyId
+
+    company_repository.bulk_delete(db, [first.companyId])
+    assert linked_company(engine, subscription.subscriptionID) == second.companyId
@@ -0,0 +1,65 @@
+import logging
+import queue
+import threading
+
+from services.logs.log_pipeline import LogQueueHandler, SamplingFilter
+
+
+def make_record(name, message, level=logging.INFO, args=None):
+    return logging.LogRecord(name, level, __file__, 1, message, args, None)
+
+
+def test_sampling_keeps_one_record_in_n_per_logger_and_level():
+    sampling = SamplingFilter({"services.subscriptions": 0.25})
+    kept = [sampling.filter(make_record("services.subscriptions.add", f"Added subscription {i}")) for i in range(8)]
+    assert kept == [True, False, False, False, True, False, False, False]
+    assert sampling.sampled_out == 6
+
+    # Counted apart from INFO, so its first record is kept
+    assert sampling.filter(make_record("services.subscriptions.add", "debug", logging.DEBUG))
+
+
+def test_sampling_counters_do_not_grow_with_distinct_messages():
+    sampling = SamplingFilter({"services": 0.5})
+    for i in range(1000):
+        sampling.filter(make_record("services.db", f"Pre-formatted message {i}"))
+    assert len(sampling._counts) == 1
+    assert sampling.sampled_out == 500
+
+
+def test_sampling_passes_warnings_and_unlisted_loggers_and_drops_rate_zero():
+    sampling = SamplingFilter({"uvicorn.access": 0, "services": 0.1})
+    assert not sampling.filter(make_record("uvicorn.access", "GET / 200"))
+    assert sampling.filter(make_record("uvicorn.access", "slow", logging.WARNING))
+    assert all(sampling.filter(make_record("main", "started")) for _ in range(5))
+    # A longer prefix is not a child logger
+    assert all(sampling.filter(make_record("servicesx", "other")) for _ in range(5))
+
+
+def test_sampling_counts_exactly_across_threads():
+    sampling = SamplingFilter({"services": 0.25})
+    kept = []
+
+    def log_many():
+        kept.append(sum(sampling.filter(make_record("services.db", "query")) for _ in range(1000)))
+
+    threads = [threading.Thread(target=log_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(kept) == 2000
+    assert sampling.sampled_out == 6000
+
+
+def test_full_queue_drops_and_counts_records_without_blocking():
+    handler = LogQueueHandler(queue.Queue(2))
+    for i in range(5):
+        handler.handle(make_record("services.db", "Record %s", args=(i,)))
+    assert handler.dropped == 3
+    assert handler.queue.qsize() == 2
+
+    # Arguments are merged on the calling thread, while they still hold the logged values
+    record = handler.queue.get_nowait()
+    assert record.msg == "Record 0"
+    assert record.args is None
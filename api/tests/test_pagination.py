@@ -0,0 +1,83 @@
+import random
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from models.subscription import Subscription, SubscriptionCreate
+from services.db.pagination import decode_cursor, encode_cursor, fetch_page
+from services.subscriptions.bulk_add_subscriptions_service import bulk_add_subscriptions
+
+PRICE = (Subscription.price, False)
+ID = (Subscription.subscriptionID, False)
+
+
+@pytest.fixture
+def subscriptions(db):
+    """60 subscriptions with repeated prices and categories, a third of them without a category."""
+    rng = random.Random(7)
+    created = bulk_add_subscriptions(db, [
+        SubscriptionCreate(
+            companyName=f"Company {i}",
+            price=rng.choice((1.00, 2.50, 9.99)),
+            subscriptionCategory=rng.choice((None, "Music", "News", "Streaming"))
+        )
+        for i in range(60)
+    ])
+    return [(row.subscriptionID, row.price, row.subscriptionCategory) for row in created]
+
+
+def walk(db, keys, limit):
+    """IDs of every page in order, following the cursors to the end."""
+    ids, cursor = [], None
+    while True:
+        page = fetch_page(db, select(Subscription), keys, limit, cursor)
+        assert len(page.items) <= limit
+        ids.extend(subscription.subscriptionID for subscription in page.items)
+        if page.next_cursor is None:
+            return ids
+        assert len(page.items) == limit
+        cursor = page.next_cursor
+
+
+def nulls_greatest(value):
+    """Sort NULL after every value, so it comes last ascending and first descending as in order_by_keys."""
+    return (value is None, value or "")
+
+
+@pytest.mark.parametrize("limit", [1, 7, 60, 100])
+@pytest.mark.parametrize("category_descending", [False, True])
+@pytest.mark.parametrize("price_descending", [False, True])
+def test_pages_cover_every_row_once_in_order_with_nulls_and_mixed_directions(db, subscriptions, limit, category_descending, price_descending):
+    keys = [(Subscription.subscriptionCategory, category_descending), (Subscription.price, price_descending), ID]
+
+    expected = sorted(subscriptions, key=lambda row: row[0])
+    expected.sort(key=lambda row: row[1], reverse=price_descending)
+    expected.sort(key=lambda row: nulls_greatest(row[2]), reverse=category_descending)
+    assert walk(db, keys, limit) == [row[0] for row in expected]
+
+
+def test_an_empty_table_is_one_page_without_a_cursor(db):
+    page = fetch_page(db, select(Subscription), [PRICE, ID], 10)
+    assert page.items == [] and page.next_cursor is None
+
+
+def test_cursor_round_trips_typed_values():
+    keys = [(Subscription.subscriptionCategory, False), PRICE, ID]
+    cursor = encode_cursor([None, Decimal("9.99"), 42])
+    assert decode_cursor(cursor, keys) == [None, Decimal("9.99"), 42]
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64 at all!",
+    encode_cursor([1]),
+    encode_cursor([1, 2, 3]),
+    encode_cursor(["cheap", 1]),
+    encode_cursor(["1.00", "one"]),
+    "eyJhIjoxfQ",  # {"a":1}
+    "bnVsbA",  # null
+])
+def test_malformed_cursors_are_rejected_with_value_error(db, cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        fetch_page(db, select(Subscription), [PRICE, ID], 10, cursor)
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+
+def test_responses_report_their_statements_and_timing(client):
+    client.post("/subscriptions/", json={"companyName": "Acme", "price": 5})
+    response = client.get("/subscriptions/")
+    assert int(response.headers["X-DB-Statements"]) >= 1
+    assert int(response.headers["X-DB-Round-Trips"]) >= 1
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+
+
+def test_not_modified_responses_report_their_statements(client):
+    etag = client.get("/subscriptions/").headers["ETag"]
+    response = client.get("/subscriptions/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["X-DB-Statements"] == "1"
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "json"])
+def test_streamed_exports_carry_no_statement_headers(client, export_format):
+    client.post("/subscriptions/bulk", json=[{"companyName": f"Company {i}", "price": 5} for i in range(5)])
+    response = client.get("/subscriptions/export", params={"format": export_format, "batch_size": 2})
+    assert response.status_code == 200
+    assert "X-DB-Statements" not in response.headers
+    assert "X-DB-Round-Trips" not in response.headers
+    assert "db;dur=" not in response.headers.get("Server-Timing", "")
+
+    if export_format == "ndjson":
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    else:
+        rows = response.json()
+    assert len(rows) == 5
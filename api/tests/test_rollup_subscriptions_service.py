@@ -0,0 +1,89 @@
+import random
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from models.subscription import Subscription, SubscriptionCreate, SubscriptionUpdate
+from models.subscription_rollup import SubscriptionRollup
+from services.subscriptions.add_subscription_service import add_subscription
+from services.subscriptions.bulk_add_subscriptions_service import bulk_add_subscriptions
+from services.subscriptions.bulk_delete_subscriptions_service import bulk_delete_subscriptions
+from services.subscriptions.delete_subscription_service import delete_subscription
+from services.subscriptions.rollup_subscriptions_service import compute_rollups
+from services.subscriptions.update_subscription_service import update_subscription
+
+# Few distinct values, so writes keep landing on a group's minimum or maximum and on ties
+PRICES = (1.00, 2.50, 2.50, 9.99, 20.00)
+CATEGORIES = (None, "Music", "Streaming")
+USERS = (None, "Ann", "Bob")
+COMPANIES = ("Acme", "Globex", "Initech")
+
+
+def stored_rollups(db):
+    """The rollup rows in the shape compute_rollups returns."""
+    return {
+        (row.dimension, bool(row.key_is_null), row.group_key): (row.count, Decimal(row.total), row.minimum, row.maximum)
+        for row in db.scalars(select(SubscriptionRollup))
+    }
+
+
+def random_fields(rng):
+    return {
+        "price": rng.choice(PRICES),
+        "subscriptionCategory": rng.choice(CATEGORIES),
+        "userName": rng.choice(USERS),
+        "companyName": rng.choice(COMPANIES)
+    }
+
+
+def existing_ids(db):
+    return list(db.scalars(select(Subscription.subscriptionID)))
+
+
+def random_write(db, rng):
+    """Apply one random add, bulk add, update, delete or bulk delete through the services."""
+    ids = existing_ids(db)
+    operation = rng.choice(("add", "bulk_add", "update", "update", "delete", "bulk_delete") if ids else ("add", "bulk_add"))
+    if operation == "add":
+        add_subscription(db, SubscriptionCreate(**random_fields(rng)))
+    elif operation == "bulk_add":
+        bulk_add_subscriptions(db, [SubscriptionCreate(**random_fields(rng)) for _ in range(rng.randint(1, 4))])
+    elif operation == "update":
+        # Any subset of the fields, including none and moves to or from the NULL groups
+        fields = random_fields(rng)
+        changes = {name: value for name, value in fields.items() if rng.random() < 0.5}
+        update_subscription(db, rng.choice(ids), SubscriptionUpdate(**changes))
+    elif operation == "delete":
+        delete_subscription(db, rng.choice(ids))
+    else:
+        bulk_delete_subscriptions(db, rng.sample(ids, rng.randint(1, min(3, len(ids)))) + [max(ids) + 1000])
+    return operation
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_writes_keep_rollups_equal_to_a_full_aggregation(db, seed):
+    rng = random.Random(seed)
+    for step in range(60):
+        operation = random_write(db, rng)
+        assert stored_rollups(db) == compute_rollups(db), f"rollups diverged after step {step} ({operation})"
+
+
+def test_removing_the_extremes_of_every_group_recomputes_them_in_one_statement(db, statements):
+    shared = {"subscriptionCategory": "Music", "userName": "Ann", "companyName": "Acme"}
+    cheapest = add_subscription(db, SubscriptionCreate(price=1.00, **shared))
+    add_subscription(db, SubscriptionCreate(price=5.00, **shared))
+    priciest = add_subscription(db, SubscriptionCreate(price=9.00, **shared))
+
+    # The new price is neither extreme, so all four groups (all, category, user, company) need both recomputed
+    statements.clear()
+    update_subscription(db, cheapest.subscriptionID, SubscriptionUpdate(price=4.00))
+    recomputes = [statement for statement in statements if statement.startswith("UPDATE subscription_rollups")]
+    assert len(recomputes) == 1
+    assert stored_rollups(db) == compute_rollups(db)
+
+    statements.clear()
+    delete_subscription(db, priciest.subscriptionID)
+    recomputes = [statement for statement in statements if statement.startswith("UPDATE subscription_rollups")]
+    assert len(recomputes) == 1
+    assert stored_rollups(db)[("all", False, "")] == (2, Decimal("9.00"), Decimal("4.00"), Decimal("5.00"))
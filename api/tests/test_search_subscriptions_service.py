@@ -0,0 +1,90 @@
+import pytest
+
+from models.subscription import SubscriptionCreate, SubscriptionUpdate
+from services.subscriptions.add_subscription_service import add_subscription
+from services.subscriptions.delete_subscription_service import delete_subscription
+from services.subscriptions.search_subscriptions_service import (
+    MAX_SEARCH_TERMS, create_search_index, parse_search_terms, search_subscriptions
+)
+from services.subscriptions.update_subscription_service import update_subscription
+
+
+@pytest.fixture
+def search_db(db, engine):
+    """The test session, with the search index created as init_db.py does."""
+    assert create_search_index(engine)
+    assert not create_search_index(engine)
+    return db
+
+
+def add(db, company, category=None, description=None):
+    return add_subscription(db, SubscriptionCreate(companyName=company, price=5, subscriptionCategory=category, description=description)).subscriptionID
+
+
+def found(db, query, **kwargs):
+    return [subscription.subscriptionID for subscription in search_subscriptions(db, query, **kwargs).items]
+
+
+def test_terms_are_lowercased_deduplicated_words_without_query_syntax():
+    assert parse_search_terms('That "Streaming" thing, streaming* OR -music_video') == ["that", "streaming", "thing", "or", "music", "video"]
+
+
+@pytest.mark.parametrize("query", ["", "  ", "*** --", " ".join(f"w{i}" for i in range(MAX_SEARCH_TERMS + 1))])
+def test_searches_without_words_or_with_too_many_are_rejected(query):
+    with pytest.raises(ValueError):
+        parse_search_terms(query)
+
+
+def test_company_matches_rank_above_category_above_description(search_db):
+    in_description = add(search_db, "Acme", "Games", "Streaming video on demand")
+    in_company = add(search_db, "Streaming Plus", "Music")
+    in_category = add(search_db, "Globex", "Streaming")
+    add(search_db, "Initech", "News", "Daily paper")
+    assert found(search_db, "streaming") == [in_company, in_category, in_description]
+
+
+def test_words_are_stemmed(search_db):
+    streams = add(search_db, "Acme", description="Streams live sport")
+    assert found(search_db, "streaming") == [streams]
+
+
+def test_match_all_needs_every_word_and_any_ranks_more_words_first(search_db):
+    both = add(search_db, "Acme", description="Premium music streaming")
+    music = add(search_db, "Globex", description="Music lessons")
+    assert found(search_db, "premium music", match_all=True) == [both]
+    assert found(search_db, "premium music") == [both, music]
+
+
+def test_results_page_through_with_the_cursor(search_db):
+    ids = [add(search_db, f"Company {i}", description="cloud storage") for i in range(7)]
+    seen, cursor = [], None
+    while True:
+        page = search_subscriptions(search_db, "storage", limit=3, cursor=cursor)
+        seen.extend(subscription.subscriptionID for subscription in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert sorted(seen) == ids and len(seen) == len(ids)
+
+
+def test_the_index_follows_updates_and_deletes(search_db):
+    subscription_id = add(search_db, "Acme", description="Cloud storage")
+    update_subscription(search_db, subscription_id, SubscriptionUpdate(description="Video streaming"))
+    assert found(search_db, "storage") == []
+    assert found(search_db, "video") == [subscription_id]
+
+    delete_subscription(search_db, subscription_id)
+    assert found(search_db, "video") == []
+
+
+def test_query_syntax_in_a_search_is_treated_as_words(search_db):
+    subscription_id = add(search_db, "Acme", description="Near the office")
+    assert found(search_db, 'NEAR("office" OR) AND *') == [subscription_id]
+
+
+def test_search_route_returns_list_items_and_rejects_searches_without_words(client):
+    client.post("/subscriptions/", json={"companyName": "Acme Streaming", "price": 5})
+    response = client.get("/subscriptions/search", params={"q": "streaming", "match": "all"})
+    assert [item["name"] for item in response.json()] == ["Acme Streaming"]
+    assert client.get("/subscriptions/search", params={"q": "!!"}).status_code == 400
+    assert client.get("/subscriptions/search", params={"q": "acme", "after": "garbage"}).status_code == 400
@@ -0,0 +1,9 @@
+def test_slow_queries_are_not_served_unless_enabled(client):
+    assert client.get("/db/slow-queries").status_code == 404
+
+
+def test_slow_queries_are_served_when_enabled(client, monkeypatch):
+    monkeypatch.setenv("DB_SLOW_QUERY_ENDPOINT", "true")
+    response = client.get("/db/slow-queries")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
@@ -1,18 +1,33 @@
 const API_URL = import.meta.env.VITE_API_URL;
+const PAGE_SIZE = 1000;
 
-export const getAllSubscriptions = async () => {
+// query: optional server-side filters and sort, e.g. { subscriptionCategory: 'Entertainment', sort: '-price' }
+export const getAllSubscriptions = async (query = {}) => {
     try {
         console.log('Fetching all subscriptions from API...');
-        const response = await fetch(`${API_URL}/subscriptions`);
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`)
-        }
+        const subscriptions = [];
+        let cursor = null;
+
+        // The API returns one page at a time; follow X-Next-Cursor until the last page
+        do {
+            const params = new URLSearchParams({ ...query, limit: PAGE_SIZE });
+            if (cursor) {
+                params.set('after', cursor);
+            }
+            const response = await fetch(`${API_URL}/subscriptions?${params}`);
             
-        const responseData = await response.json();
-        return responseData;
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`)
+            }
+                
+            const responseData = await response.json();
+            subscriptions.push(...responseData);
+            cursor = response.headers.get('X-Next-Cursor');
+        } while (cursor);
+
+        return subscriptions;
     } catch (error) {
         console.error('Error fetching all subscriptions:', error);
         throw error;
     }
-}
\ No newline at end of file
+}